@@ -0,0 +1,21 @@
+"""
+Action to read configuration values.
+"""
+
+from core.config_manager import config
+
+
+def action(connector, key=None):
+    """
+    Read one configuration value or all of them.
+    
+    Args:
+        connector: The BackendConnector instance.
+        key: The configuration key to read. Omit for every setting.
+
+    Returns:
+        The value of key, or a dict of every setting's value.
+    """
+    if key is not None:
+        return config.get(key)
+    return config.snapshot()
@@ -0,0 +1,18 @@
+"""
+Action to read the runtime metrics.
+"""
+
+from core.metrics import metrics
+
+
+def action(connector):
+    """
+    Read all counters, gauges and timing percentiles.
+    
+    Args:
+        connector: The BackendConnector instance.
+
+    Returns:
+        dict: metrics.snapshot().
+    """
+    return metrics.snapshot()
@@ -0,0 +1,42 @@
+"""
+Action to report the state of the HandyMouse application.
+"""
+
+from core.metrics import metrics
+
+
+def action(connector):
+    """
+    Report whether the application is running and what it is doing.
+    
+    Args:
+        connector: The BackendConnector instance.
+
+    Returns:
+        dict: running/starting, gesture state, camera mode, power and
+              quality state, and frame counters.
+    """
+    alive = connector.app_thread is not None and connector.app_thread.is_alive()
+    app = connector.app_instance
+    status = {
+        "running": alive and app is not None,
+        "starting": alive and app is None,
+    }
+    if app is None:
+        return status
+
+    flags = app.context.flags
+    status.update({
+        "system_active": flags.SYSTEM_ACTIVE,
+        "scroll_active": flags.SCROLL_ACTIVE,
+        "main_hand": flags.hand_label(flags.MAIN_HAND),
+        "secondary_hand": flags.hand_label(flags.SECONDARY_HAND),
+        "mic_muted": app.context.audio.mic_muted,
+        "camera": {"width": app.camera.width, "height": app.camera.height, "fps": app.camera.fps},
+        "capture_failed": app.capture_failed,
+        "power_state": app.power.state,
+        "quality_level": app.quality.level,
+        "frames_processed": metrics.counters.get("frames.processed", 0),
+        "fps": metrics.gauges.get("frame.fps", 0.0),
+    })
+    return status
@@ -2,19 +2,39 @@
 Action to start the HandyMouse application.
 """
 
+import threading
 from core.app import HandyMouseApp
 from helpers.utils import set_high_priority
 
 
-def action(connector):
+def action(connector, wait=False, show_preview=False):
     """
-    Start the HandyMouse application.
+    Start the HandyMouse application on a background thread.
     
     Args:
         connector: The BackendConnector instance.
+        wait (bool): Block until the application exits.
+        show_preview (bool): Show the OpenCV camera preview window. Off by
+                             default: the app runs off the main thread, where
+                             HighGUI is unsupported on some platforms, and
+                             there may be no display at all.
+
+    Returns:
+        bool: False if the application was already running.
     """
-    set_high_priority()
-    app = HandyMouseApp()
-    connector.app_instance = app
-    app.run()
+    if connector.app_thread is not None and connector.app_thread.is_alive():
+        print("Warning: App is already running.")
+        return False
+
+    def run():
+        set_high_priority()
+        app = HandyMouseApp()
+        connector.app_instance = app
+        app.run(show_preview=show_preview)
 
+    connector.app_instance = None
+    connector.app_thread = threading.Thread(target=run, name="handymouse-app", daemon=True)
+    connector.app_thread.start()
+    if wait:
+        connector.app_thread.join()
+    return True
@@ -9,9 +9,12 @@ def action(connector):
     
     Args:
         connector: The BackendConnector instance.
+
+    Returns:
+        bool: True if a running application was asked to exit.
     """
     if connector.app_instance is not None:
         connector.app_instance.context.flags.EXIT_REQUESTED = True
-    else:
-        print("Warning: No app instance to stop.")
-
+        return True
+    print("Warning: No app instance to stop.")
+    return False
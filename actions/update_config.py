@@ -3,16 +3,30 @@ Action to update configuration values.
 """
 
 from core.config_manager import config
+from core.control_server import InvalidParams
 
 
 def action(connector, key, value):
     """
     Update a configuration value.
-    
+
     Args:
         connector: The BackendConnector instance.
         key: The configuration key to update.
-        value: The new value to set.
+        value: The new value to set. Must match the type and range of the
+               setting in default_config.json.
+
+    Returns:
+        The value now stored for key.
+
+    Raises:
+        InvalidParams: If key is not a setting or value does not fit it.
     """
+    try:
+        value = config.validate(key, value)
+    except KeyError as e:
+        raise InvalidParams(e.args[0])
+    except ValueError as e:
+        raise InvalidParams(str(e))
     config.set(key, value)
-
+    return config.get(key)
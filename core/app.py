@@ -6,9 +6,23 @@ This file initializes and runs the HandyMouse application using the Conditions/E
 
 import cv2
 import time
+import numpy as np
 from .config_manager import config
 from .context import HandyContext
+from .metrics import metrics
+from .metrics_server import MetricsServer
+from .tracing import tracer
+from .pipeline import FramePacket
 from helpers.hand_data import HandData
+from helpers.hand_identity import HandIdentityTracker
+from helpers.landmark_filter import LandmarkFilter
+from helpers.inference_scheduler import InferenceScheduler, LandmarkPropagator
+from helpers.motion_gate import MotionGate
+from helpers.power_manager import PowerManager
+from helpers.quality_controller import QualityController
+from helpers.camera import Camera, CameraReconnector
+from helpers.thread_scheduling import FrameJitterMeter, tune_current_thread
+from helpers.cpu_accounting import CpuAccounting, register_thread
 from helpers.utils import is_palm_facing_camera, is_palm_rightside_up, measure_true_palm_width
 from .condition import ConditionRegistry
 
@@ -21,149 +35,347 @@ import features.exit_gesture
 
 class HandyMouseApp:
 
-    def __init__(self):
-        self.context = HandyContext()
+    def __init__(self, camera=None, clock=None, tracker=None, on_camera_probe=None):
+        """
+        Args:
+            camera (Camera): Frame source. Defaults to the first webcam; a
+                             Camera opened on a video file replays a recording.
+            clock: Clock used to stamp frames (see core.clock). Defaults to a
+                   monotonic clock; pass a VirtualClock for replays.
+            tracker (TrackerBackend): Hand tracker to use instead of the one
+                                      the settings select, e.g. a
+                                      SyntheticHandTracker.
+            on_camera_probe: Called as on_camera_probe(done, total, mode)
+                             while a new camera's modes are measured, which
+                             can take several seconds on first use.
+        """
+        self.context = HandyContext(clock, tracker)
 
-        self.video_cap = cv2.VideoCapture(0)
+        tracer.configure(config.TRACE_ENABLED, config.TRACE_BUFFER_EVENTS)
+        self._next_frame_id = 0
+
+        self.camera = camera or Camera(0, config.FRAME_POOL_SIZE)
         
         # Request higher resolution (many webcams default to 640x480 but support 1280x720)
-        self.video_cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.video_cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-        
-        # Read actual resolution from camera and store in context for cursor mapping
-        self.cam_width = int(self.video_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.cam_height = int(self.video_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if config.CAMERA_PROBE_ENABLED:
+            self.cam_width, self.cam_height = self.camera.negotiate(
+                config.CAMERA_WIDTH, config.CAMERA_HEIGHT, config.CAMERA_FPS, on_progress=on_camera_probe
+            )
+        else:
+            self.cam_width, self.cam_height = self.camera.set_mode(
+                config.CAMERA_WIDTH, config.CAMERA_HEIGHT, config.CAMERA_FPS
+            )
         print(f"Camera Resolution: {self.cam_width}x{self.cam_height}")
         
         # Store camera dimensions in context for cursor movement calculations
         self.context.cam_width = self.cam_width
         self.context.cam_height = self.cam_height
-        
-        self.consecutive_failures = 0
 
-    def process_frame(self):
+        # Persistent hand IDs and voted handedness across frames
+        self.hand_identity = HandIdentityTracker()
+        # Temporal smoothing of all landmarks before gesture detection
+        self.landmark_filter = LandmarkFilter()
+        # Skips inference on some frames and fills them in by propagation
+        self.inference_scheduler = InferenceScheduler()
+        self.propagator = LandmarkPropagator()
+        # Skips inference entirely on duplicate frames and idle scenes
+        self.motion_gate = MotionGate()
+        # Steps capture and inference down while no hand is in view
+        self.power = PowerManager()
+        # Trades tracking quality for speed to hold the target frame rate
+        self.quality = QualityController()
+
+        self.consecutive_failures = 0
+        # Reopens the camera after read failures without touching the tracker
+        self.reconnector = CameraReconnector(self.camera)
+        self._camera_lost_at = None
+        # Frame interval jitter, to compare scheduling settings
+        self.jitter = FrameJitterMeter()
+        # CPU time and memory per thread role, sampled from /proc
+        self.cpu_accounting = CpuAccounting()
+        if config.CPU_ACCOUNTING_ENABLED:
+            self.cpu_accounting.start()
+        # Prometheus endpoint for the node agent; only reads the metrics registry
+        self.metrics_server = MetricsServer(config.METRICS_ENDPOINT_PORT)
+        if config.METRICS_ENDPOINT_ENABLED:
+            self.metrics_server.start()
+        self._last_rendered_at = None
+
+    @property
+    def capture_failed(self):
+        """True once the camera is gone and could not be reopened."""
+        return self.reconnector.gave_up
+
+    def capture(self):
         """
-        Captures and processes a single frame.
+        Reads the next camera frame.
         Returns:
-            tuple: (success (bool), img (numpy.ndarray or None))
-            success is True if frame was captured and processed.
-            img is the processed frame with overlays, or None if capture failed.
+            FramePacket or None if the camera did not deliver a frame.
         """
-        success, img = self.video_cap.read()
+        if self.reconnector.active:
+            # The camera is being reopened in the background; wait instead of spinning.
+            # Mode changes stay pending until it is back.
+            self.reconnector.wait(0.05)
+            return None
+
+        power_changed = self.power.take_pending_change()
+        quality_changed = self.quality.take_pending_resolution()
+        if power_changed or quality_changed:
+            self._set_capture_mode(*self.power.capture_mode(
+                self.camera.negotiated_size, self.quality.current.resolution_scale
+            ))
+
+        tracer.set_frame(self._next_frame_id)
+        with tracer.span("capture"):
+            success, img = self.camera.read()
         if not success:
             self.consecutive_failures += 1
-            if self.consecutive_failures > config.NUMBER_OF_CONSECUTIVE_NULL_FRAMES_TO_EXIT:
-                print("Failed to grab frame 30 times consecutively.")
-                return False, None
-            return False, None # Skip this frame
-        
+            if self._camera_lost_at is None:
+                self._camera_lost_at = time.perf_counter()
+            if self.consecutive_failures >= config.NUMBER_OF_CONSECUTIVE_NULL_FRAMES_TO_EXIT:
+                print(f"Failed to grab frame {self.consecutive_failures} times consecutively, reconnecting camera...")
+                self.consecutive_failures = 0
+                self._interrupt_gestures()
+                self.reconnector.start()
+            else:
+                # Reads from a disconnected device often fail instantly
+                time.sleep(0.005)
+            return None
+
         self.consecutive_failures = 0
+        if self._camera_lost_at is not None:
+            recovery_ms = (time.perf_counter() - self._camera_lost_at) * 1000.0
+            self._camera_lost_at = None
+            metrics.observe("camera.recovery_ms", recovery_ms)
+            print(f"Camera recovered after {recovery_ms:.0f} ms.")
+            self.jitter.reset()
+        self.jitter.tick()
+        self.power.frame_captured()
+        self._next_frame_id += 1
+        return FramePacket(img, self.context.clock.now(), self.camera.pool, self._next_frame_id - 1)
+
+    def infer(self, packet):
+        """
+        Finds the hands in a captured frame.
+        Returns:
+            FramePacket: The same packet with its tracker result filled in.
+        """
+        tracer.set_frame(packet.frame_id)
+        settings = self.quality.take_pending_tracker_settings()
+        if settings:
+            self.context.tracker.reconfigure(**settings)
+
+        with tracer.span("inference"):
+            packet.img, packet.result = self._track_hands(packet.img, packet.capture_time)
+        return packet
+
+    def evaluate(self, packet):
+        """
+        Resolves hand identities, filters landmarks and runs all conditions
+        for a frame whose hands have been found.
+        Returns:
+            FramePacket: The same packet, with exit_requested set if the exit
+            gesture fired.
+        """
+        img, result, time_now = packet.img, packet.result, packet.capture_time
+        tracer.set_frame(packet.frame_id)
 
         # Reset per-frame state
         self.context.frame_consumed = False
 
-        # Process Hands
-        img, hand_landmarks_list, handedness_list, world_landmarks_list = self.context.tracker.process_frame(img)
         img_h, img_w = img.shape[:2]
         processed_hand = False
 
+        if (img_w, img_h) != (self.context.cam_width, self.context.cam_height):
+            self._on_resolution_change(img_w, img_h)
+
+        # Resolve stable identities before anything keys state by hand ID
+        tracks = self._update_hand_identities(result, img_h, img_w)
+
+        # Filter once per frame so every detector sees the same smoothed hands
+        hand_landmarks_list = self.landmark_filter.apply(
+            result.landmarks, [track.hand_id for track in tracks], time_now
+        )
+
         # Store frame data in context for multi-hand conditions
         self.context.frame_landmarks = hand_landmarks_list
-        self.context.frame_handedness = handedness_list
-        self.context.frame_world_landmarks = world_landmarks_list
-
-        if hand_landmarks_list:
-            time_now = time.time()
+        self.context.frame_handedness = result.handedness
+        self.context.frame_world_landmarks = result.world_landmarks
+        self.context.frame_hand_tracks = tracks
+        self.context.frame_hand_labels = [
+            self._get_hand_label(track, idx) for idx, track in enumerate(tracks)
+        ]
+        self._sync_hand_states(tracks, self.context.frame_hand_labels)
+
+        if len(hand_landmarks_list):
             conditions = ConditionRegistry.get_all()
-            processed_labels = set()  # Ensure at most one Left/Right is processed per frame
             for idx, hand_landmarks in enumerate(hand_landmarks_list):
                 if getattr(self.context, "frame_consumed", False):
                     break
                 
-                handedness_info = handedness_list[idx] if idx < len(handedness_list) else None
-                world_landmarks = world_landmarks_list[idx] if idx < len(world_landmarks_list) else None
-                label = self._get_hand_label(handedness_info, idx)
-                
+                track = tracks[idx]
+                label = self.context.frame_hand_labels[idx]
+
                 canonical_label = label if label in ("Left", "Right") else None
-                if canonical_label and canonical_label in processed_labels:
-                    continue
 
                 palm_ok, upright_ok = self._hand_orientation_status(
-                    img, hand_landmarks, handedness_info, label, idx
+                    img, hand_landmarks, track.handedness, label, idx
                 )
                 orientation_ok = palm_ok and upright_ok
-                color = self._get_hand_color(label, orientation_ok)
-                self.context.tracker.draw_landmarks(img, hand_landmarks, color)
+                color = self._get_hand_color(track.hand_id, orientation_ok)
+                with tracer.span("draw_landmarks", "draw"):
+                    self.context.tracker.draw_landmarks(img, hand_landmarks, color)
 
                 if not orientation_ok:
                     continue
 
-                if canonical_label:
-                    processed_labels.add(canonical_label)
-
                 processed_hand = True
 
                 hand_data = HandData(
                     hand_landmarks,
                     (img_h, img_w),
                     label=canonical_label,
-                    is_main=(canonical_label == self.context.flags.MAIN_HAND),
+                    is_main=(track.hand_id == self.context.flags.MAIN_HAND),
+                    hand_id=track.hand_id,
                 )
 
                 for cond in conditions:
-                    should_run, data = cond(hand_data, img, time_now, self.context)
+                    with tracer.span(cond.name, "condition"):
+                        should_run, data = cond(hand_data, img, time_now, self.context)
                     if should_run:
                         if cond.event_func:
-                            cond.event_func(self.context, data)
+                            with tracer.span(cond.event_func.__name__, "event"):
+                                cond.event_func(self.context, data)
+                            metrics.inc(f"gestures.{cond.event_func.__name__}")
                         if cond.halt_following:
                             break
 
                 if getattr(self.context, "frame_consumed", False):
                     break
 
-        if hand_landmarks_list and not processed_hand:
+        if len(hand_landmarks_list) and not processed_hand:
             self._reset_inputs()
 
+        self.power.update(len(hand_landmarks_list) > 0, time_now)
+
+        packet.exit_requested = self.context.flags.EXIT_REQUESTED
+        return packet
+
+    def render(self, packet):
+        """
+        Draws the status overlay on the preview frame.
+        Returns:
+            FramePacket: The same packet.
+        """
+        tracer.set_frame(packet.frame_id)
+        if not packet.exit_requested:
+            with tracer.span("draw_status", "draw"):
+                self._draw_status(packet.img, packet.capture_time)
+        latency_ms = (time.perf_counter() - packet.captured_at) * 1000.0
+        metrics.observe("frame.latency_ms", latency_ms)
+        if self.power.state == PowerManager.ACTIVE:
+            self.quality.observe(latency_ms, packet.capture_time)
+        metrics.inc("frames.processed")
+        now = time.perf_counter()
+        if self._last_rendered_at is not None and now > self._last_rendered_at:
+            fps = metrics.gauges.get("frame.fps", 0.0)
+            metrics.set_gauge("frame.fps", fps + 0.1 * (1.0 / (now - self._last_rendered_at) - fps))
+        self._last_rendered_at = now
+        return packet
+
+    def process_frame(self):
+        """
+        Captures and processes a single frame, running every stage in turn.
+        Returns:
+            tuple: (success (bool), img (numpy.ndarray or None))
+            success is True if frame was captured and processed.
+            img is the processed frame with overlays, or None if capture failed.
+        """
+        start = time.perf_counter()
+        packet = self.capture()
+        if packet is None:
+            return False, None # Skip this frame
+        metrics.observe("stage.capture.ms", (time.perf_counter() - start) * 1000.0)
+
+        for name, stage in (("inference", self.infer), ("gesture", self.evaluate), ("render", self.render)):
+            start = time.perf_counter()
+            packet = stage(packet)
+            metrics.observe(f"stage.{name}.ms", (time.perf_counter() - start) * 1000.0)
+
         # Check for exit request from gesture
-        if self.context.flags.EXIT_REQUESTED:
+        if packet.exit_requested:
             print("Exit requested via double fist gesture.")
-            return False, img
+            return False, packet.img
 
-        self._draw_status(img)
-        
-        return True, img
+        return True, packet.img
 
-    def run(self):
-        print("HandyMouse started. Press 'Esc' to exit.")
+    def run(self, show_preview: bool = True):
+        """
+        Runs the frame loop until exit is requested.
+
+        Args:
+            show_preview (bool): Show the camera preview window (Esc exits).
+                                 Turn off when running headless or off the
+                                 main thread, where OpenCV's HighGUI may not work.
+        """
+        if show_preview:
+            print("HandyMouse started. Press 'Esc' to exit.")
+        else:
+            print("HandyMouse started without preview.")
+        # Capture and inference share this thread when run serially
+        tune_current_thread("inference")
+        register_thread("inference")
         try:
             self.consecutive_failures = 0
             while True:
                 success, img = self.process_frame()
                 if not success:
-                    if self.consecutive_failures > config.NUMBER_OF_CONSECUTIVE_NULL_FRAMES_TO_EXIT:
+                    if self.capture_failed:
                         break
-                    # If we just failed to read one frame (but not limit), process_frame returns False, None.
+                    # If we failed to read a frame or the camera is reconnecting, process_frame returns False, None.
                     # If we requested exit, process_frame returns False, img.
                     if self.context.flags.EXIT_REQUESTED:
                          break
                     continue
 
-                cv2.imshow("HandyMouse - CamOutput", img)
-                if cv2.waitKey(1) & 0xFF == 27:
+                if show_preview:
+                    cv2.imshow("HandyMouse - CamOutput", img)
+                self.camera.pool.release(img)
+                if show_preview and cv2.waitKey(1) & 0xFF == 27:
                     break
 
         except KeyboardInterrupt:
             print("Interrupted by user.")
         finally:
             self._cleanup()
-            self.video_cap.release()
-            cv2.destroyAllWindows()
+            self.camera.release()
+            if show_preview:
+                cv2.destroyAllWindows()
 
     def _reset_inputs(self):
         self.context.mouse.leftRelease()
         self.context.mouse.rightRelease()
 
-    def _draw_status(self, img):
+    def _interrupt_gestures(self):
+        """
+        Ends held clicks and scrolling when frames stop arriving, so a button
+        is not left pressed and the scroll does not coast on through a camera
+        reconnect. The hands stay activated.
+        """
+        flags = self.context.flags
+        self._reset_inputs()
+        self.context.scroll_engine.stop()
+        flags.LONG_CLICK_ACTIVE = False
+        flags.LONG_CLICK_START_TIME = None
+        flags.SCROLL_ACTIVE = False
+        flags.SCROLL_ORIGIN_X = None
+        flags.SCROLL_ORIGIN_Y = None
+        flags.LAST_FIST_TIME = None
+        flags.DOUBLE_FIST_START_TIME = None
+        # The hand will have moved; pick the cursor up where it reappears
+        flags.IS_FIRST_DETECTION = True
+
+    def _draw_status(self, img, time_now):
         status_text = "Active" if self.context.flags.SYSTEM_ACTIVE else "Paused"
         status_color = (0, 255, 0) if self.context.flags.SYSTEM_ACTIVE else (0, 0, 255)
 
@@ -179,7 +391,7 @@ class HandyMouseApp:
 
         cv2.putText(
             img,
-            f"Main: {self.context.flags.MAIN_HAND or '--'}",
+            f"Main: {self.context.flags.hand_label(self.context.flags.MAIN_HAND) or '--'}",
             (40, 80),
             cv2.FONT_HERSHEY_PLAIN,
             2,
@@ -189,7 +401,7 @@ class HandyMouseApp:
 
         cv2.putText(
             img,
-            f"Secondary: {self.context.flags.SECONDARY_HAND or '--'}",
+            f"Secondary: {self.context.flags.hand_label(self.context.flags.SECONDARY_HAND) or '--'}",
             (40, 110),
             cv2.FONT_HERSHEY_PLAIN,
             2,
@@ -212,7 +424,7 @@ class HandyMouseApp:
             remaining = max(
                 0.0,
                 config.TOGGLE_ON_STILLNESS_SECONDS
-                - (time.time() - pending_state.start_time),
+                - (time_now - pending_state.start_time),
             )
 
             cv2.putText(
@@ -225,29 +437,150 @@ class HandyMouseApp:
                 2,
             )
 
+    def _set_capture_mode(self, width, height, fps):
+        """
+        Switches the camera mode and the matching inference rate.
+        """
+        self.cam_width, self.cam_height = self.camera.set_mode(width, height, fps)
+        self.inference_scheduler.request_min_interval(self.power.inference_interval)
+        print(f"Camera mode: {self.cam_width}x{self.cam_height} @ {fps:g} fps "
+              f"({self.camera.last_switch_ms:.0f} ms)")
+
+    def _on_resolution_change(self, img_w, img_h):
+        """
+        Rescales all pixel-space gesture state when frames of a new size
+        start arriving, so the cursor and gestures continue without a jump.
+        """
+        sx = img_w / self.context.cam_width
+        sy = img_h / self.context.cam_height
+        flags = self.context.flags
+
+        if flags.MOUSE_LOCATION is not None:
+            flags.MOUSE_LOCATION = flags.MOUSE_LOCATION * (sx, sy)
+        if flags.SCROLL_ORIGIN_X is not None:
+            flags.SCROLL_ORIGIN_X *= sx
+            flags.SCROLL_ORIGIN_Y *= sy
+        for state in flags.HAND_STATES.values():
+            if state.anchor_x is not None:
+                state.anchor_x *= sx
+                state.anchor_y *= sy
+        self.hand_identity.rescale(sx, sy)
+
+        self.context.cam_width = img_w
+        self.context.cam_height = img_h
+
     def _cleanup(self):
         """
-        Ensure any synthetic mouse presses are released before exiting.
+        Ensure any synthetic mouse presses are released and background
+        controllers are stopped before exiting.
         """
+        self.reconnector.stop()
+        self.metrics_server.stop()
+        if tracer.enabled and config.TRACE_FILE:
+            try:
+                count = tracer.export(config.TRACE_FILE)
+                print(f"Wrote {count} trace events to {config.TRACE_FILE}")
+            except OSError as e:
+                print(f"Could not write trace to {config.TRACE_FILE}: {e}")
+        if config.CPU_ACCOUNTING_ENABLED:
+            # Before the tracker closes, so an inference process is still counted
+            self.cpu_accounting.stop()
+            print(self.cpu_accounting.report())
+            if config.CPU_ACCOUNTING_DUMP_FILE:
+                self.cpu_accounting.dump(config.CPU_ACCOUNTING_DUMP_FILE)
         self._reset_inputs()
+        self.context.scroll_engine.close()
+        self.context.audio.close()
+        self.context.tracker.close()
 
-    def _get_hand_label(self, handedness_info, idx):
-        if handedness_info and handedness_info.classification:
-            label = handedness_info.classification[0].label
-            if label == "Left":
-                return "Right"
-            elif label == "Right":
-                return "Left"
+    def _track_hands(self, img, time_now):
+        """
+        Runs hand inference, reuses the previous result for static or
+        repeated frames, or propagates the previous landmarks when the
+        scheduler decides this frame can skip inference.
+        Returns:
+            tuple: (img, TrackerResult)
+        """
+        last_result = self.propagator.last_result
+        if self.motion_gate.check(img, last_result):
+            # Repeated frame, or an empty scene that has not changed
+            return img, last_result
+
+        img_h, img_w = img.shape[:2]
+        if not self.inference_scheduler.should_infer(self.propagator.last_result, img_w, img_h):
+            return img, self.propagator.propagate(time_now, img)
+
+        start = time.perf_counter()
+        img, result = self.context.tracker.process_frame(img)
+        self.inference_scheduler.record_inference((time.perf_counter() - start) * 1000.0)
+        self.propagator.observe(result, time_now, img, keep_frame=self.inference_scheduler.may_skip_next())
+        return img, result
+
+    def _update_hand_identities(self, result, img_h, img_w):
+        """
+        Feeds this frame's wrists, palm sizes and handedness votes to the
+        identity tracker.
+        Returns:
+            list: The HandTrack for each detected hand, in detection order.
+        """
+        scale = np.array([img_w, img_h])
+        wrists = result.landmarks[:, config.WRIST_IDX, :2] * scale
+        middle_mcps = result.landmarks[:, config.MIDDLE_FINGER_MCP_IDX, :2] * scale
+        palm_sizes = np.linalg.norm(middle_mcps - wrists, axis=1)
+        return self.hand_identity.update(
+            wrists, palm_sizes, result.handedness, result.handedness_scores
+        )
+
+    def _sync_hand_states(self, tracks, labels):
+        """
+        Keeps the per-hand state, keyed by track ID, in step with the identity
+        tracker. When a role's track expires because the hand left the frame,
+        the role passes to the first new hand with the same handedness, so an
+        activated hand keeps control when it comes back.
+        """
+        flags = self.context.flags
+        for track, label in zip(tracks, labels):
+            flags.get_hand_state(track.hand_id).label = label
+
+        live = {track.hand_id for track in self.hand_identity.tracks}
+        for role in ("MAIN_HAND", "SECONDARY_HAND"):
+            hand_id = getattr(flags, role)
+            if hand_id is None or hand_id in live:
+                continue
+            old_state = flags.HAND_STATES.pop(hand_id)
+            heir = next((
+                track.hand_id for track, label in zip(tracks, labels)
+                if label == old_state.label and track.hand_id not in (flags.MAIN_HAND, flags.SECONDARY_HAND)
+            ), None)
+            if heir is None:
+                # Keep the role waiting until a matching hand appears
+                flags.HAND_STATES[hand_id] = old_state
+                continue
+            flags.HAND_STATES[heir].is_active = old_state.is_active
+            setattr(flags, role, heir)
+
+        roles = (flags.MAIN_HAND, flags.SECONDARY_HAND)
+        for hand_id in [h for h in flags.HAND_STATES if h not in live and h not in roles]:
+            del flags.HAND_STATES[hand_id]
+
+    def _get_hand_label(self, track, idx):
+        # MediaPipe assumes a mirrored image, so its handedness is swapped
+        label = track.handedness
+        if label == "Left":
+            return "Right"
+        elif label == "Right":
+            return "Left"
+        elif label:
             return label
         return f"Hand {idx + 1}"
 
-    def _hand_orientation_status(self, img, landmarks, handedness_info, label, index):
+    def _hand_orientation_status(self, img, landmarks, handedness, label, index):
         """
         Determines if the hand is palm facing the camera and rightside up.
         Args:
             img: The image to draw the status on.
             landmarks: The landmarks of the hand.
-            handedness_info: The handedness info of the hand.
+            handedness: The voted MediaPipe handedness label of the hand.
             label: The label of the hand.
             index: The index of the hand.
         Returns:
@@ -255,7 +588,7 @@ class HandyMouseApp:
             palm_facing: True if the hand is palm facing the camera, False otherwise.
             rightside_up: True if the hand is rightside up, False otherwise.
         """
-        palm_facing = is_palm_facing_camera(landmarks, handedness_info)
+        palm_facing = is_palm_facing_camera(landmarks, handedness)
         rightside_up = is_palm_rightside_up(landmarks)
         label_text = label or f"Hand {index + 1}"
         base_y = 200 + index * 60
@@ -284,7 +617,7 @@ class HandyMouseApp:
 
         return palm_facing, rightside_up
 
-    def _get_hand_color(self, label, orientation_ok):
+    def _get_hand_color(self, hand_id, orientation_ok):
         # Colors in BGR
         COLOR_RED = (0, 0, 255)
         COLOR_GREEN = (0, 255, 0)
@@ -294,10 +627,10 @@ class HandyMouseApp:
         if not orientation_ok:
             return COLOR_RED
 
-        if label == self.context.flags.MAIN_HAND:
+        if hand_id == self.context.flags.MAIN_HAND:
             return COLOR_YELLOW
 
-        if label == self.context.flags.SECONDARY_HAND and self.context.flags.TWO_HANDED_MODE:
+        if hand_id == self.context.flags.SECONDARY_HAND and self.context.flags.TWO_HANDED_MODE:
             return COLOR_GREEN
 
         return COLOR_GRAY
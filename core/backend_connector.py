@@ -19,6 +19,8 @@ class BackendConnector:
     def __init__(self):
         """Initialize the connector and load all actions."""
         self.app_instance = None
+        self.app_thread = None
+        self.actions = {}  # Action name -> bound action, as exposed by the control server
         self.load_actions()
 
     def load_actions(self):
@@ -26,7 +28,7 @@ class BackendConnector:
         Dynamically load all action modules from the actions/ folder
         and attach their 'action' functions as methods to this instance.
         """
-        actions_dir = os.path.join(os.path.dirname(__file__), "actions")
+        actions_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "actions")
         
         if not os.path.exists(actions_dir):
             print(f"Warning: Actions directory '{actions_dir}' not found.")
@@ -61,10 +63,17 @@ class BackendConnector:
                             def action_wrapper(*args, **kwargs):
                                 # Always pass connector instance as first argument
                                 return action_func(connector_instance, *args, **kwargs)
+                            # Advertise the parameters after the connector, for argument checks
+                            action_sig = inspect.signature(action_func)
+                            action_wrapper.__signature__ = action_sig.replace(
+                                parameters=list(action_sig.parameters.values())[1:]
+                            )
                             return action_wrapper
                         
                         # Attach the action as a method with the module name
-                        setattr(self, module_name, make_action_wrapper(module.action, self))
+                        wrapper = make_action_wrapper(module.action, self)
+                        setattr(self, module_name, wrapper)
+                        self.actions[module_name] = wrapper
                         print(f"Loaded action: {module_name}")
                     else:
                         print(f"Warning: Module '{module_name}' does not have an 'action' function.")
@@ -0,0 +1,44 @@
+"""
+Clocks for the gesture engine.
+
+Every frame is stamped once, at capture, with the context's clock, and all
+gesture timing (holds, cooldowns, leeways) compares those stamps. The default
+MonotonicClock cannot jump with wall-clock changes. A VirtualClock only moves
+when told to, so recorded sessions can be replayed faster than real time
+with the same timing behaviour, e.g. by advancing it by 1 / fps per frame.
+"""
+
+import threading
+import time
+
+
+class MonotonicClock:
+    """
+    Seconds from time.monotonic(); unaffected by system clock changes.
+    """
+
+    def now(self) -> float:
+        return time.monotonic()
+
+
+class VirtualClock:
+    """
+    A clock that is moved explicitly, for replays and tests.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float):
+        """Move the clock forward."""
+        with self._lock:
+            self._now += seconds
+
+    def set(self, timestamp: float):
+        """Jump to a timestamp, e.g. a frame's position in a recording. Never moves backwards."""
+        with self._lock:
+            self._now = max(self._now, timestamp)
@@ -4,6 +4,7 @@ class ConditionWrapper:
     def __init__(self, priority, condition_func, halt_following=False):
         self.priority = priority
         self.condition_func = condition_func
+        self.name = condition_func.__name__
         self.event_func = None
         self.halt_following = halt_following
 
@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+import threading
 
 CONFIG_FILE = "config.json"
 DEFAULT_CONFIG_FILE = "default_config.json"
@@ -13,6 +14,8 @@ class ConfigManager:
         object.__setattr__(self, "_default_config", {})
         # Cache flattened key-value map for quick access
         object.__setattr__(self, "_flattened_config", {})
+        # Settings are written from the GUI, the frame loop and control API worker threads
+        object.__setattr__(self, "_lock", threading.RLock())
         self.load_config()
 
     def _flatten_config(self, config_dict):
@@ -111,13 +114,14 @@ class ConfigManager:
         self._flattened_config = self._flatten_config(self._config)
 
     def save_config(self):
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self._config, f, indent=4)
-            # Update cache after save
-            self._flattened_config = self._flatten_config(self._config)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        with self._lock:
+            try:
+                with open(CONFIG_FILE, 'w') as f:
+                    json.dump(self._config, f, indent=4)
+                # Update cache after save
+                self._flattened_config = self._flatten_config(self._config)
+            except Exception as e:
+                print(f"Error saving config: {e}")
 
     def _find_key_path(self, key, config_dict, path=None):
         """
@@ -147,31 +151,86 @@ class ConfigManager:
             
         return default
 
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Every setting's current value, keyed by setting name.
+        """
+        return {key: self.get(key) for key in list(self._flattened_config)}
+
+    def validate(self, key, value):
+        """
+        Checks a value against the type and range of the setting's default.
+
+        Numbers must lie within the range and are converted to the default's
+        type (an int setting accepts 2.0 but not 2.5). Strings with a range
+        must be one of its entries.
+
+        Returns:
+            The value, converted to the setting's type.
+
+        Raises:
+            KeyError: If key is not a setting in the default config.
+            ValueError: If the value has the wrong type or is out of range.
+        """
+        location = self._find_key_path(key, self._default_config)
+        if location is None:
+            raise KeyError(f"Unknown setting '{key}'")
+        container, found_key = location
+        default_item = container[found_key]
+        if not isinstance(default_item, dict) or "value" not in default_item:
+            return value
+        default, rng = default_item["value"], default_item.get("range")
+
+        if isinstance(default, bool):
+            if not isinstance(value, bool):
+                raise ValueError(f"{key} must be true or false, got {value!r}")
+            return value
+        if isinstance(default, (int, float)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{key} must be a number, got {value!r}")
+            if isinstance(default, int):
+                if value != int(value):
+                    raise ValueError(f"{key} must be a whole number, got {value!r}")
+                value = int(value)
+            else:
+                value = float(value)
+            if rng and not rng[0] <= value <= rng[1]:
+                raise ValueError(f"{key} must be between {rng[0]} and {rng[1]}, got {value!r}")
+            return value
+        if isinstance(default, str):
+            if not isinstance(value, str):
+                raise ValueError(f"{key} must be a string, got {value!r}")
+            if rng and value not in rng:
+                raise ValueError(f"{key} must be one of {', '.join(rng)}, got {value!r}")
+        return value
+
     def set(self, key, value):
-        # Find where this key lives in the real _config structure
-        location = self._find_key_path(key, self._config)
-        if location:
-            container, found_key = location
-            item = container[found_key]
-            if isinstance(item, dict) and "value" in item:
-                item["value"] = value
+        with self._lock:
+            # Find where this key lives in the real _config structure
+            location = self._find_key_path(key, self._config)
+            if location:
+                container, found_key = location
+                item = container[found_key]
+                if isinstance(item, dict) and "value" in item:
+                    item["value"] = value
+                else:
+                    container[found_key] = value
+                self.save_config()
             else:
-                container[found_key] = value
-            self.save_config()
-        else:
-            # Fallback to creating it in root.
-            self._config[key] = value
-            self.save_config()
+                # Fallback to creating it in root.
+                self._config[key] = value
+                self.save_config()
 
     def reset_to_defaults(self):
         """
         Resets the configuration to default values.
         """
-        self._config = self._default_config.copy()
         # Deep copy to avoid reference issues if we modify _config later
         import copy
-        self._config = copy.deepcopy(self._default_config)
-        self.save_config()
+        with self._lock:
+            self._config = copy.deepcopy(self._default_config)
+            self.save_config()
 
     def reset_setting(self, key):
         """
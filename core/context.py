@@ -1,12 +1,32 @@
 from helpers.mouse_controller import MouseController
 from helpers.audio_controller import AudioController
-from helpers.hand_tracker import HandTracker
+from helpers.tracker_backends import create_hand_tracker
+from helpers.inference_process import RemoteHandTracker
+from helpers.scroll_engine import ScrollEngine
+from helpers.thread_scheduling import tuned_thread
+from .clock import MonotonicClock
+from .config_manager import config
 from .flags import HandyFlags
 
 class HandyContext:
-    def __init__(self):
+    def __init__(self, clock=None, tracker=None):
+        # Source of all frame timestamps; see core.clock
+        self.clock = clock or MonotonicClock()
         self.flags = HandyFlags()
         self.mouse = MouseController()
+        self.scroll_engine = ScrollEngine(self.mouse)
         self.audio = AudioController()
-        self.tracker = HandTracker(max_num_hands=2)
+        self.tracker = tracker or self._create_tracker()
+
+    def _create_tracker(self):
+        """Creates the tracker the settings select."""
+        # MediaPipe's inference threads inherit the inference thread settings
+        with tuned_thread("inference"):
+            if config.INFERENCE_OUT_OF_PROCESS:
+                return RemoteHandTracker(
+                    max_num_hands=2, roi_mode=config.ROI_CROP_ENABLED, backend=config.TRACKER_BACKEND
+                )
+            return create_hand_tracker(
+                config.TRACKER_BACKEND, max_num_hands=2, roi_mode=config.ROI_CROP_ENABLED, clock=self.clock
+            )
 
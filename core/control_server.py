@@ -0,0 +1,248 @@
+"""
+Local control API for HandyMouse.
+
+Serves the BackendConnector's actions (start_app, stop_app, update_config,
+get_status, get_metrics, get_config, ...) to other programs over a Unix
+socket, or over a localhost TCP port where Unix sockets are not available
+(Windows). The protocol is JSON-RPC 2.0 with one JSON object per line:
+
+    -> {"jsonrpc": "2.0", "id": 1, "method": "update_config", "params": {"key": "CURSOR_SPEED", "value": 2.0}}
+    <- {"jsonrpc": "2.0", "id": 1, "result": 2.0}
+
+The asyncio server runs on its own daemon thread and executes each call in a
+worker thread, so a slow call never holds up other clients and nothing runs
+on the frame loop. Actions only read state or set flags and settings, which
+is safe while the engine is running.
+
+Run headless, controlled only through the socket:
+    python -m core.control_server
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+from typing import Optional
+from .config_manager import config
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+HAS_UNIX_SOCKETS = hasattr(asyncio, "start_unix_server")
+
+
+def default_socket_path() -> str:
+    """CONTROL_SOCKET_PATH, or handymouse.sock in the user's runtime directory."""
+    if config.CONTROL_SOCKET_PATH:
+        return config.CONTROL_SOCKET_PATH
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, "handymouse.sock")
+
+
+class InvalidParams(Exception):
+    """Raised by an action for arguments it rejects; answered with INVALID_PARAMS."""
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class ControlServer:
+    """
+    JSON-RPC server exposing a BackendConnector's actions.
+    """
+
+    def __init__(self, connector, path: Optional[str] = None, port: Optional[int] = None):
+        """
+        Args:
+            connector (BackendConnector): Provides the callable actions.
+            path (str): Unix socket path. Defaults to default_socket_path().
+            port (int): Localhost TCP port used where Unix sockets are not
+                        available. Defaults to the CONTROL_PORT setting.
+        """
+        self.connector = connector
+        self.path = path or default_socket_path()
+        self.port = port or config.CONTROL_PORT
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._started = threading.Event()
+
+    @property
+    def address(self) -> str:
+        return self.path if HAS_UNIX_SOCKETS else f"127.0.0.1:{self.port}"
+
+    def start(self) -> bool:
+        """Starts serving on a daemon thread. Returns False if the socket could not be opened."""
+        if self._thread is not None:
+            return True
+        self._thread = threading.Thread(target=self._run, name="control-server", daemon=True)
+        self._thread.start()
+        self._started.wait(timeout=5.0)
+        if self._server is None:
+            self._thread = None
+            return False
+        print(f"Control API listening on {self.address}")
+        return True
+
+    def stop(self):
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(self._open())
+        except OSError as e:
+            print(f"Could not start control API on {self.address}: {e}")
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            # Connections still open; their handlers must finish before the loop closes
+            clients = asyncio.all_tasks(self._loop)
+            for task in clients:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*clients, return_exceptions=True))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+            self._server = None
+            if HAS_UNIX_SOCKETS:
+                self._remove_socket()
+
+    async def _open(self):
+        if not HAS_UNIX_SOCKETS:
+            return await asyncio.start_server(self._handle_client, "127.0.0.1", self.port)
+        self._remove_socket()
+        server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        # Only the current user may drive the mouse through the socket
+        os.chmod(self.path, stat.S_IRUSR | stat.S_IWUSR)
+        return server
+
+    def _remove_socket(self):
+        """Removes a socket left behind by an earlier run, never a regular file."""
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self._dispatch(line)
+                if response is not None:
+                    writer.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # The server is stopping; end quietly instead of as a cancelled task
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> Optional[dict]:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        is_notification = "id" not in request
+        action = self.connector.actions.get(request["method"])
+        params = request.get("params", {})
+        if action is None:
+            response = _error(request_id, METHOD_NOT_FOUND, f"Unknown method '{request['method']}'")
+        elif not isinstance(params, (list, dict)):
+            response = _error(request_id, INVALID_PARAMS, "params must be an array or object")
+        else:
+            args, kwargs = (params, {}) if isinstance(params, list) else ([], params)
+            try:
+                inspect.signature(action).bind(*args, **kwargs)
+            except TypeError as e:
+                response = _error(request_id, INVALID_PARAMS, str(e))
+            else:
+                try:
+                    # In a worker thread, so a slow action does not block other clients
+                    result = await self._loop.run_in_executor(None, lambda: action(*args, **kwargs))
+                    response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+                except InvalidParams as e:
+                    response = _error(request_id, INVALID_PARAMS, str(e))
+                except Exception as e:
+                    # Including TypeErrors from inside the action: those are bugs, not bad params
+                    response = _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+        return None if is_notification else response
+
+
+def call(method: str, params=None, path: Optional[str] = None, port: Optional[int] = None,
+         timeout: float = 5.0):
+    """
+    Calls a method on a running control server and returns its result.
+
+    Raises:
+        RuntimeError: If the server answered with an error.
+    """
+    if HAS_UNIX_SOCKETS:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = path or default_socket_path()
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = ("127.0.0.1", port or config.CONTROL_PORT)
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            response = json.loads(f.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+def main():
+    from .backend_connector import BackendConnector
+
+    connector = BackendConnector()
+    server = ControlServer(connector)
+    if not server.start():
+        sys.exit(1)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print("Interrupted by user.")
+    finally:
+        if connector.app_instance is not None:
+            connector.stop_app()
+            if connector.app_thread is not None:
+                connector.app_thread.join(timeout=5.0)
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 class HandActivationState:
-    def __init__(self, label):
-        self.label = label
+    def __init__(self, hand_id, label=None):
+        self.hand_id = hand_id
+        self.label = label  # Current handedness label, for display
         self.pending = False
         self.start_time = None
         self.anchor_x = None
@@ -23,15 +24,12 @@ class HandyFlags:
         self.SCROLL_ACTIVE = False
         self.LONG_CLICK_ACTIVE = False
 
-        # Hand Role State
+        # Hand Role State, by persistent hand ID (see helpers.hand_identity)
         self.MAIN_HAND = None
         self.SECONDARY_HAND = None
         self.TWO_HANDED_MODE = False
-        self.HAND_STATES = {
-            "Left": HandActivationState("Left"),
-            "Right": HandActivationState("Right"),
-        }
-        self.LAST_TOGGLE_TIME = 0
+        self.HAND_STATES = {}
+        self.LAST_TOGGLE_TIME = float("-inf")
 
         # Scroll State
         self.SCROLL_ORIGIN_X = None
@@ -40,11 +38,11 @@ class HandyFlags:
 
         # Mic State
         self.MIC_MUTE_HANDLED = False
-        self.LAST_MIC_TOGGLE_TIME = 0
+        self.LAST_MIC_TOGGLE_TIME = float("-inf")
 
         # Click State
         self.LONG_CLICK_START_TIME = None
-        self.LAST_CLICK_DETECTED_TIME = 0
+        self.LAST_CLICK_DETECTED_TIME = float("-inf")
 
         # Mouse Smoothing State
         self.MOUSE_LOCATION = None
@@ -54,7 +52,12 @@ class HandyFlags:
         self.DOUBLE_FIST_START_TIME = None
         self.EXIT_REQUESTED = False
 
-    def get_hand_state(self, label):
-        if label not in self.HAND_STATES:
-            self.HAND_STATES[label] = HandActivationState(label)
-        return self.HAND_STATES[label]
+    def get_hand_state(self, hand_id, label=None):
+        if hand_id not in self.HAND_STATES:
+            self.HAND_STATES[hand_id] = HandActivationState(hand_id, label)
+        return self.HAND_STATES[hand_id]
+
+    def hand_label(self, hand_id):
+        """The handedness label of a hand ID, or None."""
+        state = self.HAND_STATES.get(hand_id)
+        return state.label if state else None
@@ -0,0 +1,100 @@
+"""
+Runtime metrics for HandyMouse.
+
+A process-wide registry of counters, gauges and timing rings. Writers on the
+hot path only bump a number or write one slot of a preallocated ring; readers
+(GUI, endpoints, dumps) take snapshots on their own schedule.
+"""
+
+import threading
+import numpy as np
+
+
+class TimingRing:
+    """
+    Fixed-size ring of the most recent timing samples, in milliseconds.
+    """
+
+    def __init__(self, size: int = 512):
+        self._samples = np.zeros(size, dtype=np.float64)
+        self._size = size
+        self._index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float):
+        self._samples[self._index] = value
+        self._index = (self._index + 1) % self._size
+        self.count += 1
+        self.total += value
+
+    def values(self) -> np.ndarray:
+        """Returns a copy of the samples currently held, oldest first."""
+        if self.count < self._size:
+            return self._samples[:self.count].copy()
+        return np.roll(self._samples, -self._index)
+
+    def percentiles(self, percents=(50, 90, 99)) -> dict:
+        values = self.values()
+        if values.size == 0:
+            return {p: 0.0 for p in percents}
+        return dict(zip(percents, np.percentile(values, percents).tolist()))
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and timing rings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.timings = {}
+
+    def inc(self, name: str, amount: float = 1):
+        """Adds to a monotonically increasing counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float):
+        """Sets a point-in-time value."""
+        self.gauges[name] = value
+
+    def observe(self, name: str, value_ms: float):
+        """Records a timing sample in milliseconds."""
+        ring = self.timings.get(name)
+        if ring is None:
+            with self._lock:
+                ring = self.timings.setdefault(name, TimingRing())
+        ring.add(value_ms)
+
+    def snapshot(self, percents=(50, 90, 99)) -> dict:
+        """
+        Returns a consistent-enough copy of all metrics for display or export.
+
+        Returns:
+            dict: {"counters": {...}, "gauges": {...},
+                   "timings": {name: {"count", "total", "p50", ...}}}
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            timings = dict(self.timings)
+        gauges = dict(self.gauges)
+
+        timing_stats = {}
+        for name, ring in timings.items():
+            stats = {"count": ring.count, "total": ring.total}
+            for p, value in ring.percentiles(percents).items():
+                stats[f"p{p}"] = value
+            timing_stats[name] = stats
+        return {"counters": counters, "gauges": gauges, "timings": timing_stats}
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.timings.clear()
+
+
+metrics = MetricsRegistry()
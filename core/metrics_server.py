@@ -0,0 +1,145 @@
+"""
+Prometheus endpoint for the runtime metrics.
+
+Serves the metrics registry as Prometheus text on http://127.0.0.1:<port>/metrics
+from a daemon thread. Each scrape only takes a snapshot of the registry, so
+the frame loop is never involved. Metric names are prefixed with
+"handymouse_"; per-stage, per-role and per-gesture metrics become labels,
+e.g. stage.inference.ms -> handymouse_stage_ms{stage="inference"}. Timings
+are exported as summaries in milliseconds over the most recent samples.
+"""
+
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from .metrics import metrics
+
+PREFIX = "handymouse_"
+
+# First name component -> (label for the second component, second components that stay unlabeled)
+LABELED_FAMILIES = {
+    "stage": ("stage", set()),
+    "cpu": ("role", {"process"}),
+    "gestures": ("event", set()),
+}
+
+QUANTILES = (50, 90, 99)
+
+_INVALID = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _split_name(name: str):
+    """Returns (metric family name, labels) for a registry metric name."""
+    parts = name.split(".")
+    labels = {}
+    rule = LABELED_FAMILIES.get(parts[0])
+    if rule and len(parts) >= 2 and parts[1] not in rule[1]:
+        labels[rule[0]] = parts[1]
+        parts = [parts[0]] + parts[2:]
+    return PREFIX + _INVALID.sub("_", "_".join(parts)), labels
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def format_prometheus(snapshot: dict) -> str:
+    """
+    Formats a metrics.snapshot() as Prometheus text exposition format.
+
+    Args:
+        snapshot (dict): Snapshot taken with percents equal to QUANTILES.
+
+    Returns:
+        str: The exposition text, ending with a newline.
+    """
+    families = {}  # family -> (type, [(suffix, labels, value)])
+
+    def add(family, kind, suffix, labels, value):
+        families.setdefault(family, (kind, []))[1].append((suffix, labels, value))
+
+    for name, value in snapshot["counters"].items():
+        family, labels = _split_name(name)
+        add(family + "_total", "counter", "", labels, value)
+    for name, value in snapshot["gauges"].items():
+        family, labels = _split_name(name)
+        add(family, "gauge", "", labels, value)
+    for name, stats in snapshot["timings"].items():
+        family, labels = _split_name(name)
+        for q in QUANTILES:
+            add(family, "summary", "", dict(labels, quantile=f"{q / 100:g}"), stats[f"p{q}"])
+        add(family, "summary", "_sum", labels, stats["total"])
+        add(family, "summary", "_count", labels, stats["count"])
+
+    lines = []
+    for family in sorted(families):
+        kind, samples = families[family]
+        lines.append(f"# TYPE {family} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{family}{suffix}{_format_labels(labels)} {float(value):g}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = format_prometheus(metrics.snapshot(QUANTILES)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the console
+        pass
+
+
+class MetricsServer:
+    """
+    HTTP server for the /metrics endpoint, running on a daemon thread.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        """
+        Args:
+            port (int): TCP port to listen on.
+            host (str): Address to bind. Defaults to localhost only.
+        """
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread = None
+
+    def start(self) -> bool:
+        """Starts serving. Returns False if the port could not be bound."""
+        if self._server is not None:
+            return True
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        except OSError as e:
+            print(f"Could not start metrics endpoint on {self.host}:{self.port}: {e}")
+            return False
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        print(f"Metrics available at http://{self.host}:{self.port}/metrics")
+        return True
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=1.0)
+        self._server = None
+        self._thread = None
@@ -0,0 +1,170 @@
+"""
+Staged frame pipeline.
+
+Runs capture, inference, gesture evaluation and preview rendering on their
+own threads, connected by small drop-oldest queues. Throughput is bounded by
+the slowest stage instead of the sum of all stages, and a slow stage sheds
+stale frames instead of building up latency.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+from .config_manager import config
+from .metrics import metrics
+from helpers.thread_scheduling import tune_current_thread
+
+
+class FramePacket:
+    """
+    A frame moving through the pipeline, with everything computed for it so far.
+    """
+
+    def __init__(self, img, capture_time: float, pool=None, frame_id: int = -1):
+        self.img = img
+        self.frame_id = frame_id          # Sequence number of the frame, for tracing
+        self.pool = pool                  # FramePool the image was borrowed from
+        self.capture_time = capture_time  # Context clock time when the frame was read
+        self.captured_at = time.perf_counter()  # Real time of capture, for latency measurements
+        self.result = None                # TrackerResult, set by inference
+        self.exit_requested = False
+        self.enqueued_at = None           # perf_counter() when last put on a queue
+
+    def release(self):
+        """Return the image buffer to its pool. The packet must not be used afterwards."""
+        if self.pool is not None:
+            self.pool.release(self.img)
+        self.img = None
+
+
+class DropOldestQueue:
+    """
+    Bounded queue that discards the oldest item instead of blocking the producer.
+    """
+
+    def __init__(self, maxsize: int, name: str):
+        self.name = name
+        self._items = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, packet: FramePacket):
+        packet.enqueued_at = time.perf_counter()
+        with self._cond:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+                metrics.inc(f"stage.{self.name}.dropped")
+                self._items.popleft().release()
+            self._items.append(packet)
+            metrics.set_gauge(f"stage.{self.name}.queue_depth", len(self._items))
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        """Returns the oldest item, or None if nothing arrived within timeout."""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            packet = self._items.popleft()
+            metrics.set_gauge(f"stage.{self.name}.queue_depth", len(self._items))
+        return packet
+
+    def __len__(self):
+        return len(self._items)
+
+
+class FramePipeline:
+    """
+    Drives a HandyMouseApp's capture, infer, evaluate and render steps on
+    separate threads.
+    """
+
+    STAGES = ("inference", "gesture", "render")
+
+    def __init__(self, app, queue_size: Optional[int] = None):
+        """
+        Args:
+            app (HandyMouseApp): The app whose stage methods are run.
+            queue_size (int): Capacity of each inter-stage queue. Defaults to
+                              the PIPELINE_QUEUE_SIZE setting.
+        """
+        self.app = app
+        size = queue_size or config.PIPELINE_QUEUE_SIZE
+        self.queues = {name: DropOldestQueue(size, name) for name in self.STAGES}
+        # Finished frames for the consumer (preview / GUI)
+        self.output = DropOldestQueue(size, "output")
+        self.capture_failed = False
+
+        self._stop = threading.Event()
+        handlers = {
+            "inference": app.infer,
+            "gesture": app.evaluate,
+            "render": app.render,
+        }
+        outboxes = list(self.queues.values())[1:] + [self.output]
+
+        self._threads = [threading.Thread(target=self._capture_loop, name="stage-capture", daemon=True)]
+        for (name, inbox), outbox in zip(self.queues.items(), outboxes):
+            self._threads.append(threading.Thread(
+                target=self._stage_loop,
+                args=(name, handlers[name], inbox, outbox),
+                name=f"stage-{name}",
+                daemon=True,
+            ))
+
+    @property
+    def running(self) -> bool:
+        return not self._stop.is_set()
+
+    def start(self):
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop all stages and wait for them to finish their current frame."""
+        self._stop.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+
+    def _capture_loop(self):
+        tune_current_thread("capture")
+        inbox = self.queues["inference"]
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                packet = self.app.capture()
+            except Exception as e:
+                print(f"Pipeline capture error: {e}")
+                self._stop.set()
+                break
+            metrics.observe("stage.capture.ms", (time.perf_counter() - start) * 1000.0)
+
+            if packet is None:
+                # capture() itself waits while the camera is failing or reconnecting
+                if self.app.capture_failed:
+                    self.capture_failed = True
+                    self._stop.set()
+                    break
+                continue
+            inbox.put(packet)
+
+    def _stage_loop(self, name: str, handler, inbox: DropOldestQueue, outbox: DropOldestQueue):
+        tune_current_thread(name)
+        while not self._stop.is_set():
+            packet = inbox.get(timeout=0.1)
+            if packet is None:
+                continue
+
+            start = time.perf_counter()
+            metrics.observe(f"stage.{name}.wait_ms", (start - packet.enqueued_at) * 1000.0)
+            try:
+                packet = handler(packet)
+            except Exception as e:
+                print(f"Pipeline {name} error: {e}")
+                self._stop.set()
+                break
+            metrics.observe(f"stage.{name}.ms", (time.perf_counter() - start) * 1000.0)
+            outbox.put(packet)
@@ -0,0 +1,195 @@
+"""
+Frame tracing in Chrome trace format.
+
+When enabled, the app records a span for every capture, inference, condition,
+event function and drawing step, and an instant event for every injected
+mouse or microphone action, each tagged with the frame it belongs to. Records
+go into a preallocated ring (the newest TRACE_BUFFER_EVENTS are kept) and are
+exported as Chrome trace JSON, which chrome://tracing and ui.perfetto.dev open
+directly. Following a late click back through its frame's spans shows where
+the time went.
+
+When disabled, span() returns a shared no-op object and instant() returns
+immediately.
+"""
+
+import json
+import os
+import threading
+import time
+import numpy as np
+
+_RECORD = np.dtype([
+    ("name", np.int32),      # Index into Tracer._names
+    ("cat", np.int32),       # Index into Tracer._names
+    ("phase", np.uint8),     # ord("X") complete span, ord("i") instant
+    ("start", np.float64),   # perf_counter() seconds
+    ("duration", np.float64),
+    ("tid", np.int64),
+    ("frame", np.int64),     # -1 when not tied to a frame
+])
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "start")
+
+    def __init__(self, tracer, name: str, cat: str):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.cat, ord("X"), self.start, time.perf_counter() - self.start)
+        return False
+
+
+class Tracer:
+    """
+    Ring buffer of trace records with Chrome trace JSON export.
+    """
+
+    def __init__(self, size: int = 200000):
+        self.enabled = False
+        self._size = 0
+        self._ring = None
+        self._written = 0   # Records written since the last clear; the next slot is _written % size
+        self._names = []
+        self._name_ids = {}
+        self._thread_names = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._size_hint = size
+
+    def configure(self, enabled: bool, size: int = None):
+        """
+        Turns tracing on or off. The ring is allocated once, when tracing is
+        first enabled, and cleared whenever its size changes.
+        """
+        size = size or self._size_hint
+        with self._lock:
+            if enabled and (self._ring is None or size != self._size):
+                self._ring = np.zeros(size, dtype=_RECORD)
+                self._size = size
+                self._written = 0
+            self.enabled = enabled
+
+    def set_frame(self, frame_id: int):
+        """Tags everything the calling thread records from now on with a frame."""
+        self._local.frame = frame_id
+
+    def span(self, name: str, cat: str = "stage"):
+        """
+        Usage:
+            with tracer.span("inference"):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat)
+
+    def instant(self, name: str, cat: str = "action"):
+        """Records a point in time, e.g. an injected mouse press."""
+        if self.enabled:
+            self.record(name, cat, ord("i"), time.perf_counter(), 0.0)
+
+    def _intern(self, name: str) -> int:
+        index = self._name_ids.get(name)
+        if index is None:
+            with self._lock:
+                index = self._name_ids.get(name)
+                if index is None:
+                    index = len(self._names)
+                    self._names.append(name)
+                    self._name_ids[name] = index
+        return index
+
+    def record(self, name: str, cat: str, phase: int, start: float, duration: float):
+        ring = self._ring
+        if ring is None:
+            return
+        tid = threading.get_native_id()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        record = (self._intern(name), self._intern(cat), phase, start, duration, tid,
+                  getattr(self._local, "frame", -1))
+        # Claiming the slot and filling it under the lock keeps events() from
+        # seeing a slot that is taken but not yet written
+        with self._lock:
+            ring[self._written % len(ring)] = record
+            self._written += 1
+
+    def events(self) -> list:
+        """
+        Returns:
+            list: The recorded events, oldest first, as Chrome trace event dicts.
+        """
+        with self._lock:
+            ring = self._ring
+            if ring is None:
+                return []
+            written = self._written
+            if written <= len(ring):
+                records = ring[:written].copy()
+            else:
+                records = np.roll(ring, -(written % len(ring)))
+            names = list(self._names)
+
+        pid = os.getpid()
+        events = []
+        for rec in records:
+            event = {
+                "name": names[rec["name"]],
+                "cat": names[rec["cat"]],
+                "ph": chr(rec["phase"]),
+                "ts": (rec["start"] - self._origin) * 1e6,
+                "pid": pid,
+                "tid": int(rec["tid"]),
+            }
+            if event["ph"] == "X":
+                event["dur"] = rec["duration"] * 1e6
+            else:
+                event["s"] = "t"  # Instant scoped to its thread
+            if rec["frame"] >= 0:
+                event["args"] = {"frame": int(rec["frame"])}
+            events.append(event)
+        return events
+
+    def export(self, path: str) -> int:
+        """
+        Writes the ring as a Chrome trace JSON file.
+
+        Returns:
+            int: Number of events written.
+        """
+        events = self.events()
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._thread_names.items()
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+    def clear(self):
+        with self._lock:
+            self._written = 0
+
+
+tracer = Tracer()
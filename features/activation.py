@@ -7,10 +7,11 @@ from core.condition import condition
 @condition(priority=0)
 def check_activation(hand_data, img, time_now, context):
     label = getattr(hand_data, "label", None)
-    if not label:
+    hand_id = getattr(hand_data, "hand_id", None)
+    if not label or hand_id is None:
         return False, {}
 
-    state = context.flags.get_hand_state(label)
+    state = context.flags.get_hand_state(hand_id, label)
     is_pose = detectors.is_activation_pose(hand_data)
 
     if is_pose or state.pending:
@@ -36,7 +37,7 @@ def toggle_system_event(context, data):
         if (time_now - context.flags.LAST_TOGGLE_TIME) > config.TOGGLE_COOLDOWN:
             if state.is_active:
                 # Instant Deactivation
-                deactivate_hand(context, state.label, time_now)
+                deactivate_hand(context, state.hand_id, time_now)
                 reset_activation_state(state)
             else:
                 # Activation Sequence
@@ -77,30 +78,30 @@ def process_activation_hold(context, state, current_time, hand_data):
             state.drift_frames = 0
             
         if (current_time - state.start_time) >= config.TOGGLE_ON_STILLNESS_SECONDS:
-            activate_hand(context, state.label, current_time)
+            activate_hand(context, state.hand_id, current_time)
             reset_activation_state(state)
 
 def reset_activation_state(state):
     state.reset_pending()
 
-def activate_hand(context, label, current_time):
+def activate_hand(context, hand_id, current_time):
     flags = context.flags
-    state = flags.get_hand_state(label)
+    state = flags.get_hand_state(hand_id)
 
     if flags.MAIN_HAND is None:
-        flags.MAIN_HAND = label
+        flags.MAIN_HAND = hand_id
         flags.SYSTEM_ACTIVE = True
         flags.IS_FIRST_DETECTION = True
         flags.MOUSE_LOCATION = None
         state.is_active = True
-        print(f"{label} hand set as MAIN.")
-    elif flags.MAIN_HAND == label:
+        print(f"{state.label} hand set as MAIN.")
+    elif flags.MAIN_HAND == hand_id:
         state.is_active = True
-    elif flags.SECONDARY_HAND is None and label != flags.MAIN_HAND:
-        flags.SECONDARY_HAND = label
+    elif flags.SECONDARY_HAND is None and hand_id != flags.MAIN_HAND:
+        flags.SECONDARY_HAND = hand_id
         state.is_active = True
-        print(f"{label} hand set as SECONDARY.")
-    elif flags.SECONDARY_HAND == label:
+        print(f"{state.label} hand set as SECONDARY.")
+    elif flags.SECONDARY_HAND == hand_id:
         state.is_active = True
     else:
         # Ignore additional hands beyond two roles
@@ -109,12 +110,12 @@ def activate_hand(context, label, current_time):
     flags.LAST_TOGGLE_TIME = current_time
     update_two_handed_flag(flags)
 
-def deactivate_hand(context, label, current_time):
+def deactivate_hand(context, hand_id, current_time):
     flags = context.flags
-    state = flags.get_hand_state(label)
+    state = flags.get_hand_state(hand_id)
     state.is_active = False
 
-    if label == flags.MAIN_HAND:
+    if hand_id == flags.MAIN_HAND:
         flags.MAIN_HAND = None
         flags.SYSTEM_ACTIVE = False
         if flags.SECONDARY_HAND:
@@ -126,6 +127,7 @@ def deactivate_hand(context, label, current_time):
         flags.SCROLL_ORIGIN_X = None
         flags.SCROLL_ORIGIN_Y = None
         flags.LAST_FIST_TIME = None
+        context.scroll_engine.stop()
         flags.LONG_CLICK_ACTIVE = False
         flags.LONG_CLICK_START_TIME = None
         flags.MOUSE_LOCATION = None
@@ -133,7 +135,7 @@ def deactivate_hand(context, label, current_time):
         context.mouse.leftRelease()
         context.mouse.rightRelease()
         print("Main hand toggled off. All hands deactivated.")
-    elif label == flags.SECONDARY_HAND:
+    elif hand_id == flags.SECONDARY_HAND:
         flags.SECONDARY_HAND = None
         print("Secondary hand toggled off.")
 
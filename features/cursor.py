@@ -42,9 +42,13 @@ def move_cursor_event(context, data):
         context.flags.MOUSE_LOCATION = current_raw
         context.flags.IS_FIRST_DETECTION = False
     
-    context.flags.MOUSE_LOCATION = smooth_position(
-        current_raw, context.flags.MOUSE_LOCATION, config.SMOOTHING_FACTOR
-    )
+    if config.LANDMARK_FILTER_STRENGTH > 0:
+        # The landmarks are already filtered; a second smoother only adds lag
+        context.flags.MOUSE_LOCATION = current_raw
+    else:
+        context.flags.MOUSE_LOCATION = smooth_position(
+            current_raw, context.flags.MOUSE_LOCATION, config.SMOOTHING_FACTOR
+        )
     
     context.mouse.move_to(
         context.flags.MOUSE_LOCATION,
@@ -11,14 +11,6 @@ from core.config_manager import config
 from core.condition import condition
 
 
-def _get_label(handedness_info):
-    """Extract label from handedness info."""
-    if handedness_info and getattr(handedness_info, "classification", None):
-        if handedness_info.classification:
-            return handedness_info.classification[0].label
-    return None
-
-
 @condition(priority=1)
 def check_double_fist_exit(hand_data, img, time_now, context):
     """
@@ -33,8 +25,11 @@ def check_double_fist_exit(hand_data, img, time_now, context):
         return False, {}
     
     # Get all hands in the current frame
-    frame_landmarks = getattr(context, "frame_landmarks", []) or []
-    frame_handedness = getattr(context, "frame_handedness", []) or []
+    frame_landmarks = getattr(context, "frame_landmarks", None)
+    if frame_landmarks is None:
+        frame_landmarks = []
+    frame_labels = getattr(context, "frame_hand_labels", []) or []
+    frame_tracks = getattr(context, "frame_hand_tracks", []) or []
     
     # Need exactly 2 hands for this gesture
     if len(frame_landmarks) < 2:
@@ -45,16 +40,17 @@ def check_double_fist_exit(hand_data, img, time_now, context):
     
     # Create HandData for both hands
     img_shape = img.shape[:2]
-    frame_labels = [_get_label(h) for h in frame_handedness]
     
     hands = []
     for idx in range(min(2, len(frame_landmarks))):
         label = frame_labels[idx] if idx < len(frame_labels) else None
+        track = frame_tracks[idx] if idx < len(frame_tracks) else None
         h = HandData(
             frame_landmarks[idx],
             img_shape,
             label=label,
-            is_main=(label == context.flags.MAIN_HAND),
+            is_main=(track is not None and track.hand_id == context.flags.MAIN_HAND),
+            hand_id=track.hand_id if track else None,
         )
         hands.append(h)
     
@@ -38,6 +38,7 @@ def manage_scroll_event(context, data):
             # Reset inputs
             context.mouse.leftRelease()
             context.mouse.rightRelease()
+            context.scroll_engine.engage()
     else:
         if context.flags.SCROLL_ACTIVE:
             if context.flags.LAST_FIST_TIME is None:
@@ -46,57 +47,47 @@ def manage_scroll_event(context, data):
                 context.flags.SCROLL_ACTIVE = False
                 context.flags.SCROLL_ORIGIN_Y = None
                 context.flags.LAST_FIST_TIME = None
+                context.scroll_engine.release()
                 
     if context.flags.SCROLL_ACTIVE:
         process_scroll(context, img, hand_data)
 
 def process_scroll(context, img, hand_data):
+    """
+    Converts wrist displacement since the last frame into fractional wheel
+    notches and hands them to the scroll engine, which emits them smoothly.
+    """
     wrist_x, wrist_y = hand_data.wrist
 
     delta_y = wrist_y - context.flags.SCROLL_ORIGIN_Y
     delta_x = wrist_x - context.flags.SCROLL_ORIGIN_X
-    
-    scroll_amount_y = delta_y * config.SCROLL_SPEED_FACTOR
-    scroll_amount_x = delta_x * config.SCROLL_SPEED_FACTOR
-    
-    steps_y = int(scroll_amount_y)
-    steps_x = int(scroll_amount_x)
-    
-    dy = 0
-    dx = 0
-    
-    if steps_y != 0:
-        dy = -steps_y
-        if config.INVERT_SCROLL_DIRECTION_VERTICAL:
-            dy = -dy
-            
-        consumed_pixels_y = steps_y / config.SCROLL_SPEED_FACTOR
-        context.flags.SCROLL_ORIGIN_Y += consumed_pixels_y
 
-    if steps_x != 0:
-        dx = steps_x
-        if config.INVERT_SCROLL_DIRECTION_HORIZONTAL:
-            dx = -dx
-            
-        consumed_pixels_x = steps_x / config.SCROLL_SPEED_FACTOR
-        context.flags.SCROLL_ORIGIN_X += consumed_pixels_x
+    dy = -delta_y * config.SCROLL_SPEED_FACTOR
+    if config.INVERT_SCROLL_DIRECTION_VERTICAL:
+        dy = -dy
+
+    dx = delta_x * config.SCROLL_SPEED_FACTOR
+    if config.INVERT_SCROLL_DIRECTION_HORIZONTAL:
+        dx = -dx
 
     if dx != 0 or dy != 0:
-        context.mouse.scroll(dx, dy)
+        context.scroll_engine.push(dx, dy)
 
-    if context.flags.SCROLL_ORIGIN_X is not None:
-        origin_pt = (int(context.flags.SCROLL_ORIGIN_X), int(context.flags.SCROLL_ORIGIN_Y))
-        current_pt = (int(context.flags.SCROLL_ORIGIN_X), int(wrist_y))
+    # The whole displacement has been handed off, so the next frame starts here
+    origin_pt = (int(context.flags.SCROLL_ORIGIN_X), int(context.flags.SCROLL_ORIGIN_Y))
+    current_pt = (int(wrist_x), int(wrist_y))
+    context.flags.SCROLL_ORIGIN_X = wrist_x
+    context.flags.SCROLL_ORIGIN_Y = wrist_y
 
-        cv2.circle(img, origin_pt, 7, (0, 255, 255), 2)
-        cv2.line(img, origin_pt, current_pt, (0, 255, 255), 2)
+    cv2.circle(img, origin_pt, 7, (0, 255, 255), 2)
+    cv2.line(img, origin_pt, current_pt, (0, 255, 255), 2)
 
-        cv2.putText(
-            img,
-            "Scroll: ON",
-            (40, 550),
-            cv2.FONT_HERSHEY_PLAIN,
-            2,
-            (0, 255, 255),
-            2,
-        )
+    cv2.putText(
+        img,
+        "Scroll: ON",
+        (40, 550),
+        cv2.FONT_HERSHEY_PLAIN,
+        2,
+        (0, 255, 255),
+        2,
+    )
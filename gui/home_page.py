@@ -277,6 +277,9 @@ class HomePage(QWidget):
                 self.toggle_btn.style().polish(self.toggle_btn)
             
             qt_img = convert_cv_qt(cv_img)
+            # The pixmap holds its own copy, so the frame buffer can be reused
+            if self.worker is not None:
+                self.worker.release_frame(cv_img)
             self.video_label.setPixmap(qt_img)
         except RuntimeError:
             # Widget was destroyed, ignore
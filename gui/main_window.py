@@ -8,8 +8,10 @@ from PySide6.QtGui import QFont, QIcon
 from PySide6.QtCore import Qt, QEvent, QPoint
 from gui.home_page import HomePage
 from gui.settings_page import SettingsPage
+from gui.performance_page import PerformancePage
 from gui.custom_title_bar import CustomTitleBar
 from gui.utils import load_stylesheet
+from core.config_manager import config
 
 # Windows native resize support
 if sys.platform == "win32":
@@ -61,9 +63,11 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.home_page = HomePage()
         self.settings_page = SettingsPage()
+        self.performance_page = PerformancePage()
         
         self.tabs.addTab(self.home_page, "Home")
         self.tabs.addTab(self.settings_page, "Settings")
+        self.tabs.addTab(self.performance_page, "Performance")
         
         # Window Controls in Tab Bar
         self.window_controls = CustomTitleBar(self)
@@ -76,6 +80,21 @@ class MainWindow(QMainWindow):
         
         # Install event filter on tab bar for dragging
         self.tabs.tabBar().installEventFilter(self)
+
+        self.connector = None
+        self.control_server = None
+        if config.CONTROL_API_ENABLED:
+            self._start_control_server()
+
+    def _start_control_server(self):
+        """Serve the control API (core.control_server) for the lifetime of the window."""
+        from core.backend_connector import BackendConnector
+        from core.control_server import ControlServer
+
+        self.connector = BackendConnector()
+        self.control_server = ControlServer(self.connector)
+        if not self.control_server.start():
+            self.control_server = None
         
     def closeEvent(self, event):
         # Stop camera and wait for cleanup before closing
@@ -85,6 +104,13 @@ class MainWindow(QMainWindow):
             # Give a bit more time for cleanup to complete
             if self.home_page.worker and self.home_page.worker.isRunning():
                 self.home_page.worker.wait(1000)  # Additional wait if needed
+        if self.control_server is not None:
+            # Stop an engine started through the API before the server goes away
+            if self.connector.app_instance is not None:
+                self.connector.stop_app()
+                if self.connector.app_thread is not None:
+                    self.connector.app_thread.join(timeout=5.0)
+            self.control_server.stop()
         event.accept()
 
     def eventFilter(self, obj, event):
@@ -0,0 +1,217 @@
+"""
+Performance page for HandyMouse application.
+
+Shows live frame rate, stage latencies, dropped frames, skipped inference,
+injected input events and CPU usage. Everything is read from the metrics
+registry once a second on the GUI thread, so the worker never waits for it.
+"""
+
+import time
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QGridLayout,
+    QGroupBox, QScrollArea, QFrame
+)
+from PySide6.QtCore import Qt, QTimer
+from core.metrics import metrics
+from helpers.cpu_accounting import ROLES
+
+REFRESH_INTERVAL_MS = 1000
+
+STAGES = ("capture", "inference", "gesture", "render")
+
+PERCENTILES = (50, 90, 99)
+
+# Frames that got no inference: repeats and still scenes (motion gate), and
+# frames filled in by landmark propagation (inference scheduler)
+SKIP_COUNTERS = ("inference.skipped_duplicate", "inference.skipped_static", "inference.skipped_propagated")
+
+
+class StatTile(QWidget):
+    """A large value with a caption underneath."""
+
+    def __init__(self, caption: str, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("background-color: transparent;")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 8, 0, 8)
+        layout.setSpacing(2)
+
+        self.value_label = QLabel("--")
+        self.value_label.setStyleSheet("color: #3a8fff; font-size: 22px; font-weight: 600;")
+        self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        caption_label = QLabel(caption)
+        caption_label.setStyleSheet("color: #606060; font-size: 11px;")
+        caption_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        layout.addWidget(self.value_label)
+        layout.addWidget(caption_label)
+
+    def set_value(self, text: str):
+        self.value_label.setText(text)
+
+
+class PerformancePage(QWidget):
+    """Live performance dashboard."""
+
+    def __init__(self):
+        super().__init__()
+        self._previous = None       # (monotonic time, counters) of the last refresh
+        self._setup_ui()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_INTERVAL_MS)
+
+    def _setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+
+        content = QWidget()
+        content.setStyleSheet("background-color: #0a0a0a;")
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        layout.addWidget(self._create_overview())
+        layout.addWidget(self._create_stage_table())
+        layout.addWidget(self._create_cpu_table())
+        layout.addStretch()
+
+        scroll.setWidget(content)
+        main_layout.addWidget(scroll)
+
+    def _create_overview(self) -> QGroupBox:
+        group = QGroupBox("Overview")
+        grid = QGridLayout(group)
+        grid.setContentsMargins(12, 16, 12, 12)
+
+        self.tiles = {
+            "fps": StatTile("Frames per second"),
+            "latency": StatTile("Capture to screen p50 / p99 (ms)"),
+            "dropped": StatTile("Dropped frames per second"),
+            "skipped": StatTile("Inference skipped"),
+            "events": StatTile("Injected events per second"),
+            "cpu": StatTile("CPU (% of one core)"),
+            "memory": StatTile("Memory (MB)"),
+            "quality": StatTile("Quality level"),
+        }
+        for index, tile in enumerate(self.tiles.values()):
+            grid.addWidget(tile, index // 4, index % 4)
+        return group
+
+    @staticmethod
+    def _header(text: str) -> QLabel:
+        label = QLabel(text)
+        label.setStyleSheet("color: #606060; font-size: 11px;")
+        label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return label
+
+    @staticmethod
+    def _cell(text: str = "--", align=Qt.AlignmentFlag.AlignRight) -> QLabel:
+        label = QLabel(text)
+        label.setStyleSheet("color: #c0c0c0;")
+        label.setAlignment(align | Qt.AlignmentFlag.AlignVCenter)
+        return label
+
+    def _create_stage_table(self) -> QGroupBox:
+        group = QGroupBox("Stage Latency (ms)")
+        grid = QGridLayout(group)
+        grid.setContentsMargins(12, 16, 12, 12)
+        grid.setHorizontalSpacing(24)
+
+        columns = [f"p{p}" for p in PERCENTILES] + ["dropped"]
+        for col, title in enumerate(columns, start=1):
+            grid.addWidget(self._header(title), 0, col)
+
+        self.stage_cells = {}
+        rows = list(STAGES) + ["end to end"]
+        for row, stage in enumerate(rows, start=1):
+            grid.addWidget(self._cell(stage.capitalize(), Qt.AlignmentFlag.AlignLeft), row, 0)
+            cells = [self._cell() for _ in columns]
+            for col, cell in enumerate(cells, start=1):
+                grid.addWidget(cell, row, col)
+            self.stage_cells[stage] = cells
+        grid.setColumnStretch(0, 1)
+        return group
+
+    def _create_cpu_table(self) -> QGroupBox:
+        group = QGroupBox("CPU by Thread Role")
+        grid = QGridLayout(group)
+        grid.setContentsMargins(12, 16, 12, 12)
+        grid.setHorizontalSpacing(24)
+
+        grid.addWidget(self._header("% of one core"), 0, 1)
+        grid.addWidget(self._header("seconds"), 0, 2)
+        self.cpu_cells = {}
+        for row, role in enumerate(ROLES, start=1):
+            grid.addWidget(self._cell(role.capitalize(), Qt.AlignmentFlag.AlignLeft), row, 0)
+            cells = [self._cell(), self._cell()]
+            grid.addWidget(cells[0], row, 1)
+            grid.addWidget(cells[1], row, 2)
+            self.cpu_cells[role] = cells
+
+        self.cpu_note = QLabel("Turn on CPU accounting in the performance settings to measure CPU usage (Linux only).")
+        self.cpu_note.setStyleSheet("color: #505050; font-size: 11px;")
+        grid.addWidget(self.cpu_note, len(ROLES) + 1, 0, 1, 3)
+        grid.setColumnStretch(0, 1)
+        return group
+
+    def refresh(self):
+        """Reads the metrics and updates every label. Skipped while the page is hidden."""
+        if not self.isVisible():
+            self._previous = None
+            return
+
+        now = time.monotonic()
+        snapshot = metrics.snapshot(PERCENTILES)
+        counters, gauges, timings = snapshot["counters"], snapshot["gauges"], snapshot["timings"]
+
+        rates = {}
+        if self._previous is not None:
+            elapsed = now - self._previous[0]
+            before = self._previous[1]
+            if elapsed > 0:
+                rates = {name: (value - before.get(name, 0)) / elapsed for name, value in counters.items()}
+        self._previous = (now, counters)
+
+        def rate(name):
+            return rates.get(name, 0.0)
+
+        dropped_names = [f"stage.{stage}.dropped" for stage in STAGES] + ["stage.output.dropped"]
+        self.tiles["fps"].set_value(f"{rate('frames.processed'):.1f}" if rates else "--")
+        latency = timings.get("frame.latency_ms")
+        self.tiles["latency"].set_value(f"{latency['p50']:.0f} / {latency['p99']:.0f}" if latency else "--")
+        self.tiles["dropped"].set_value(f"{sum(rate(n) for n in dropped_names):.1f}" if rates else "--")
+        skipped = sum(counters.get(name, 0) for name in SKIP_COUNTERS)
+        evaluated = skipped + counters.get("inference.runs", 0)
+        self.tiles["skipped"].set_value(f"{skipped / evaluated * 100:.0f}%" if evaluated else "--")
+        events = rate("input.mouse_events") + rate("input.audio_events")
+        self.tiles["events"].set_value(f"{events:.1f}" if rates else "--")
+        cpu = gauges.get("cpu.process.percent")
+        self.tiles["cpu"].set_value(f"{cpu:.0f}%" if cpu is not None else "--")
+        memory = gauges.get("memory.rss_mb")
+        self.tiles["memory"].set_value(f"{memory:.0f}" if memory is not None else "--")
+        level = gauges.get("quality.level")
+        self.tiles["quality"].set_value(f"{level:.0f}" if level is not None else "--")
+
+        for stage, cells in self.stage_cells.items():
+            name = "frame.latency_ms" if stage == "end to end" else f"stage.{stage}.ms"
+            stats = timings.get(name)
+            for cell, p in zip(cells, PERCENTILES):
+                cell.setText(f"{stats[f'p{p}']:.1f}" if stats else "--")
+            queue = "output" if stage == "end to end" else stage
+            dropped = counters.get(f"stage.{queue}.dropped")
+            cells[-1].setText(str(int(dropped)) if dropped is not None else "--")
+
+        self.cpu_note.setVisible("cpu.process.percent" not in gauges)
+        for role, (percent_cell, seconds_cell) in self.cpu_cells.items():
+            percent = gauges.get(f"cpu.{role}.percent")
+            seconds = gauges.get(f"cpu.{role}.seconds")
+            percent_cell.setText(f"{percent:.1f}" if percent is not None else "--")
+            seconds_cell.setText(f"{seconds:.1f}" if seconds is not None else "--")
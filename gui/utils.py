@@ -1,15 +1,14 @@
-import cv2
 import os
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtCore import Qt
 
 def convert_cv_qt(cv_img, max_width=960, max_height=720):
     """Convert from an opencv image to QPixmap, scaling to fit display."""
-    rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb_image.shape
-    bytes_per_line = ch * w
+    h, w, ch = cv_img.shape
+    bytes_per_line = cv_img.strides[0]
+    # Qt reads OpenCV's BGR layout directly, so the frame is not converted again for display.
     # PySide6 uses nested Enums
-    convert_to_Qt_format = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+    convert_to_Qt_format = QImage(cv_img.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
     # Scale to fit the display area while maintaining aspect ratio
     p = convert_to_Qt_format.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
     return QPixmap.fromImage(p)
@@ -26,6 +26,15 @@ class VideoWorker(QThread):
         step = get_step(index)
         self.loading_signal.emit(step.get_message(self._show_dev), step.progress)
 
+    def _on_camera_probe(self, done: int, total: int, mode: dict):
+        """Show the camera mode probe, which only runs on first use of a camera."""
+        start, end = get_step(2).progress, get_step(3).progress
+        if self._show_dev:
+            message = f"Probing {mode['fourcc']} {mode['width']}x{mode['height']} ({done + 1}/{total})"
+        else:
+            message = f"Measuring camera modes, first run only ({done + 1}/{total})"
+        self.loading_signal.emit(message, start + (end - start) * done // total)
+
     def run(self):
         """Main worker thread execution."""
         try:
@@ -36,7 +45,7 @@ class VideoWorker(QThread):
             self._emit_step(1)  # Loading model
             self._emit_step(2)  # Initializing tracker
             
-            self.app = HandyMouseApp()
+            self.app = HandyMouseApp(on_camera_probe=self._on_camera_probe)
             
             # Check if we should stop before continuing
             if not self._run_flag:
@@ -46,6 +55,16 @@ class VideoWorker(QThread):
             self._emit_step(4)  # Finalizing
             self._emit_step(5)  # Ready
             
+            if config.PIPELINE_ENABLED:
+                self._run_pipeline()
+                return
+
+            # Capture and inference share this thread when run serially
+            from helpers.cpu_accounting import register_thread
+            from helpers.thread_scheduling import tune_current_thread
+            tune_current_thread("inference")
+            register_thread("inference")
+
             # Main processing loop
             while self._run_flag:
                 success, img = self.app.process_frame()
@@ -60,7 +79,7 @@ class VideoWorker(QThread):
                         # Signal receiver was destroyed, stop processing
                         break
                 
-                if self.app.context.flags.EXIT_REQUESTED:
+                if self.app.context.flags.EXIT_REQUESTED or self.app.capture_failed:
                     self._run_flag = False
 
         except Exception as e:
@@ -71,8 +90,8 @@ class VideoWorker(QThread):
             try:
                 if self.app:
                     self.app._cleanup()
-                    if hasattr(self.app, 'video_cap') and self.app.video_cap:
-                        self.app.video_cap.release()
+                    if hasattr(self.app, 'camera') and self.app.camera:
+                        self.app.camera.release()
             except Exception as e:
                 print(f"Error during worker cleanup: {e}")
             
@@ -82,6 +101,40 @@ class VideoWorker(QThread):
             except RuntimeError:
                 pass  # Receiver was destroyed, ignore
 
+    def _run_pipeline(self):
+        """Run the app's stages on their own threads and forward finished frames."""
+        from core.pipeline import FramePipeline
+
+        from helpers.cpu_accounting import register_thread
+        # This thread only hands finished frames to the GUI
+        register_thread("gui")
+
+        pipeline = FramePipeline(self.app)
+        pipeline.start()
+        try:
+            while self._run_flag and pipeline.running:
+                packet = pipeline.output.get(timeout=0.1)
+                if packet is None:
+                    continue
+
+                if packet.exit_requested:
+                    print("Exit requested via double fist gesture.")
+                    self._run_flag = False
+                    break
+
+                try:
+                    self.change_pixmap_signal.emit(packet.img)
+                except RuntimeError:
+                    # Signal receiver was destroyed, stop processing
+                    break
+        finally:
+            pipeline.stop()
+
+    def release_frame(self, img):
+        """Return a displayed frame's buffer to the camera's pool."""
+        if self.app is not None:
+            self.app.camera.pool.release(img)
+
     def stop(self):
         """Signal the worker to stop processing."""
         self._run_flag = False
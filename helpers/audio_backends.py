@@ -0,0 +1,302 @@
+"""
+Audio backends for microphone control.
+
+Each backend wraps one platform API behind the same small interface so that
+AudioController can cache the mute state and talk to the device from its own
+worker thread, independent of how the device is actually reached.
+"""
+
+import subprocess
+import sys
+import threading
+from typing import Optional
+
+
+class AudioBackend:
+    """
+    Interface for microphone backends.
+
+    Backends are only ever called from the AudioController worker thread, so
+    they may block and do not need to be thread-safe. Backends that set
+    notifies_changes report device changes through device_changed() and are
+    not polled with get_device_id().
+    """
+
+    name = "base"
+    notifies_changes = False
+
+    def open(self):
+        """Acquire any resources needed to talk to the device."""
+
+    def close(self):
+        """Release resources acquired in open()."""
+
+    def get_device_id(self) -> Optional[str]:
+        """
+        Returns an identifier for the current default microphone, or None if
+        no microphone is available. A change in this value means the default
+        device changed and the cached mute state must be refreshed.
+        """
+        return None
+
+    def get_mic_mute(self) -> Optional[bool]:
+        """Returns the device mute state, or None if no device is available."""
+        return None
+
+    def set_mic_mute(self, muted: bool):
+        """Sets the device mute state. No-op if no device is available."""
+
+    def device_changed(self) -> bool:
+        """
+        Returns True if the backend has been notified of a device change since
+        the last call. Backends without change notifications return False and
+        rely on AudioController polling get_device_id().
+        """
+        return False
+
+
+class PycawAudioBackend(AudioBackend):
+    """
+    Windows backend using pycaw (Core Audio endpoint volume).
+    """
+
+    name = "pycaw"
+
+    def __init__(self):
+        self._mic_volume = None
+        self._device_id = None
+        self._com_initialized = False
+
+    def open(self):
+        # COM must be initialized on the thread that uses the interfaces
+        import comtypes
+        comtypes.CoInitialize()
+        self._com_initialized = True
+        self._activate()
+
+    def close(self):
+        self._mic_volume = None
+        if self._com_initialized:
+            import comtypes
+            comtypes.CoUninitialize()
+            self._com_initialized = False
+
+    def _activate(self):
+        from ctypes import cast, POINTER
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        try:
+            mic_device = AudioUtilities.GetMicrophone()
+            if mic_device is None:
+                raise RuntimeError("no default microphone")
+            mic_interface = mic_device.Activate(
+                IAudioEndpointVolume._iid_, CLSCTX_ALL, None
+            )
+            self._mic_volume = cast(mic_interface, POINTER(IAudioEndpointVolume))
+            self._device_id = mic_device.GetId()
+        except Exception as e:
+            print(f"Error initializing microphone: {e}")
+            self._mic_volume = None
+            self._device_id = None
+
+    def get_device_id(self) -> Optional[str]:
+        from pycaw.pycaw import AudioUtilities
+
+        try:
+            mic_device = AudioUtilities.GetMicrophone()
+            device_id = mic_device.GetId() if mic_device is not None else None
+        except Exception:
+            device_id = None
+
+        if device_id != self._device_id:
+            self._activate()
+        return self._device_id
+
+    def get_mic_mute(self) -> Optional[bool]:
+        if self._mic_volume is None:
+            return None
+        return bool(self._mic_volume.GetMute())
+
+    def set_mic_mute(self, muted: bool):
+        if self._mic_volume is not None:
+            self._mic_volume.SetMute(int(muted), None)
+
+
+class PulseAudioBackend(AudioBackend):
+    """
+    Linux backend for PulseAudio and PipeWire (via pipewire-pulse), driven
+    through the `pactl` command.
+
+    A background `pactl subscribe` process reports source and server changes,
+    so the default device is only re-queried when something actually changed.
+    """
+
+    name = "pulse"
+    DEFAULT_SOURCE = "@DEFAULT_SOURCE@"
+
+    def __init__(self, pactl: str = "pactl"):
+        self._pactl = pactl
+        self._subscriber = None
+        self._subscriber_thread = None
+        self._changed = threading.Event()
+
+    def _run(self, *args) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                [self._pactl, *args],
+                capture_output=True,
+                text=True,
+                timeout=2.0,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"Error running pactl: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+
+    def open(self):
+        try:
+            self._subscriber = subprocess.Popen(
+                [self._pactl, "subscribe"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError as e:
+            print(f"Error starting pactl subscribe: {e}")
+            self._subscriber = None
+            return
+
+        self._subscriber_thread = threading.Thread(
+            target=self._watch_events, name="pactl-subscribe", daemon=True
+        )
+        self._subscriber_thread.start()
+
+    def close(self):
+        if self._subscriber is not None:
+            self._subscriber.terminate()
+            try:
+                self._subscriber.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                self._subscriber.kill()
+            self._subscriber = None
+
+    def _watch_events(self):
+        # Lines look like: "Event 'change' on source #52"
+        for line in self._subscriber.stdout:
+            if " on source " in line or " on server" in line:
+                self._changed.set()
+
+    @property
+    def notifies_changes(self) -> bool:
+        return self._subscriber is not None and self._subscriber.poll() is None
+
+    def device_changed(self) -> bool:
+        if self._changed.is_set():
+            self._changed.clear()
+            return True
+        return False
+
+    def get_device_id(self) -> Optional[str]:
+        return self._run("get-default-source")
+
+    def get_mic_mute(self) -> Optional[bool]:
+        # Output looks like: "Mute: yes"
+        output = self._run("get-source-mute", self.DEFAULT_SOURCE)
+        if not output:
+            return None
+        return output.split(":", 1)[-1].strip().lower() == "yes"
+
+    def set_mic_mute(self, muted: bool):
+        self._run("set-source-mute", self.DEFAULT_SOURCE, "1" if muted else "0")
+
+
+class FakeAudioBackend(AudioBackend):
+    """
+    In-memory backend for tests and machines without audio devices.
+
+    Records every call so callers can assert on what reached the "device".
+    """
+
+    name = "fake"
+
+    def __init__(self, muted: bool = False, device_id: Optional[str] = "fake-mic",
+                 notifies_changes: bool = True):
+        """
+        Args:
+            muted (bool): Initial mute state.
+            device_id (str): Default device, or None for no microphone.
+            notifies_changes (bool): False to behave like pycaw, which has no
+                                     change notifications and must be polled.
+        """
+        self.notifies_changes = notifies_changes
+        self.muted = muted
+        self.device_id = device_id
+        self.set_calls = []
+        self.get_calls = 0
+        self._changed = False
+
+    def simulate_device_change(self, device_id: Optional[str], muted: bool = False):
+        """Swaps the fake default device, as if the user plugged in another mic."""
+        self.device_id = device_id
+        self.muted = muted
+        self._changed = True
+
+    def simulate_external_mute(self, muted: bool):
+        """Changes the mute state behind the controller's back, like the OS mixer or a headset button."""
+        self.muted = muted
+        self._changed = True
+
+    def device_changed(self) -> bool:
+        changed = self._changed and self.notifies_changes
+        self._changed = False
+        return changed
+
+    def get_device_id(self) -> Optional[str]:
+        return self.device_id
+
+    def get_mic_mute(self) -> Optional[bool]:
+        self.get_calls += 1
+        if self.device_id is None:
+            return None
+        return self.muted
+
+    def set_mic_mute(self, muted: bool):
+        self.set_calls.append(muted)
+        if self.device_id is not None:
+            self.muted = muted
+
+
+BACKENDS = {
+    "pycaw": PycawAudioBackend,
+    "pulse": PulseAudioBackend,
+    "fake": FakeAudioBackend,
+}
+
+
+def create_audio_backend(name: str = "auto") -> AudioBackend:
+    """
+    Creates the audio backend for the given name.
+
+    Args:
+        name (str): One of "auto", "pycaw", "pulse" or "fake". "auto" picks
+                    pycaw on Windows and pactl on Linux.
+
+    Returns:
+        AudioBackend: The backend instance.
+    """
+    if name == "auto":
+        if sys.platform == "win32":
+            name = "pycaw"
+        elif sys.platform.startswith("linux"):
+            name = "pulse"
+        else:
+            name = "fake"
+
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        print(f"Unknown audio backend '{name}', falling back to fake backend.")
+        backend_cls = FakeAudioBackend
+    return backend_cls()
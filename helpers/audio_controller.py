@@ -1,33 +1,156 @@
-from ctypes import cast, POINTER
-from comtypes import CLSCTX_ALL
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+"""
+Microphone control module.
+
+AudioController keeps a cached copy of the microphone mute state and performs
+all device I/O on a dedicated worker thread, so toggling the mic from the
+frame loop only flips a flag and enqueues a command. A toggle is resolved on
+the worker against the device's actual state, so muting from the OS, a
+headset button or another app never makes the next toggle a no-op. Backends
+without change notifications have their mute state re-read on every poll.
+"""
+
+import queue
+import threading
+import time
+from typing import Optional
+from core.config_manager import config
+from core.metrics import metrics
+from core.tracing import tracer
+from helpers.audio_backends import AudioBackend, create_audio_backend
+from helpers.thread_scheduling import tune_current_thread
 
 
 class AudioController:
-    def __init__(self):
-        # Setup Microphone
-        # Try to get default microphone
-        try:
-            mic_device = AudioUtilities.GetMicrophone()
-            mic_interface = mic_device.Activate(
-                IAudioEndpointVolume._iid_, CLSCTX_ALL, None
-            )
-            self.mic_volume = cast(mic_interface, POINTER(IAudioEndpointVolume))
-        except Exception as e:
-            print(f"Error initializing microphone: {e}")
-            self.mic_volume = None
+    """
+    Manages microphone mute state through an AudioBackend.
+    """
+
+    _STOP = object()
+    _TOGGLE = "toggle"
+
+    def __init__(self, backend: Optional[AudioBackend] = None, poll_interval: Optional[float] = None):
+        """
+        Initialize the AudioController and start its worker thread.
+
+        Args:
+            backend (AudioBackend): Backend to use. Defaults to the one selected
+                                    by the AUDIO_BACKEND setting.
+            poll_interval (float): Seconds between device checks. Defaults to
+                                   the AUDIO_DEVICE_POLL_SECONDS setting.
+        """
+        self.backend = backend or create_audio_backend(config.get("AUDIO_BACKEND", "auto"))
+        self.poll_interval = poll_interval or config.get("AUDIO_DEVICE_POLL_SECONDS", 2.0)
+
+        # Cached state, read by the frame thread without touching the device
+        self.mic_muted = None
+        self.device_id = None
+
+        self._state_lock = threading.Lock()  # Guards mic_muted and device_id
+        self._commands = queue.Queue()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._worker, name="audio-controller", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def available(self) -> bool:
+        """True if a microphone was found by the backend."""
+        return self.mic_muted is not None
 
     def mute_mic(self):
         """Mute the microphone."""
-        if self.mic_volume:
-            self.mic_volume.SetMute(1, None)
+        self._request_mute(True)
 
     def unmute_mic(self):
         """Unmute the microphone."""
-        if self.mic_volume:
-            self.mic_volume.SetMute(0, None)
+        self._request_mute(False)
 
     def toggle_mic(self):
         """Toggle microphone mute state."""
-        current_mute = self.mic_volume.GetMute()
-        self.mic_volume.SetMute(not current_mute, None)
+        if self.mic_muted is None:
+            return
+        self._request_mute(self._TOGGLE)
+
+    def close(self):
+        """Stop the worker thread and release the backend."""
+        self._commands.put(self._STOP)
+        self._thread.join(timeout=2.0)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the initial device state has been read."""
+        return self._ready.wait(timeout)
+
+    def _request_mute(self, muted):
+        """
+        Args:
+            muted: True or False, or _TOGGLE to invert whatever the device reports.
+        """
+        metrics.inc("input.audio_events")
+        if muted is self._TOGGLE:
+            tracer.instant("audio.toggle_requested", "audio")
+        else:
+            tracer.instant("audio.mute_requested" if muted else "audio.unmute_requested", "audio")
+        # Update the cache first so the overlay shows the new state instantly;
+        # the worker corrects it from the device
+        with self._state_lock:
+            if self.mic_muted is not None:
+                self.mic_muted = (not self.mic_muted) if muted is self._TOGGLE else muted
+        self._commands.put((muted, time.perf_counter()))
+
+    def _refresh(self):
+        device_id = self.backend.get_device_id()
+        muted = self.backend.get_mic_mute()
+        with self._state_lock:
+            self.device_id = device_id
+            self.mic_muted = muted
+
+    def _apply(self, muted, requested_at: float):
+        """Sets the device mute state; a toggle reads the device first."""
+        metrics.observe("actuator.audio.queue_ms", (time.perf_counter() - requested_at) * 1000.0)
+        if muted is self._TOGGLE:
+            current = self.backend.get_mic_mute()
+            if current is None:
+                return
+            muted = not current
+        with tracer.span("audio.mute" if muted else "audio.unmute", "audio"):
+            self.backend.set_mic_mute(muted)
+        with self._state_lock:
+            # Still None without a microphone
+            if self.mic_muted is not None:
+                self.mic_muted = muted
+
+    def _worker(self):
+        tune_current_thread("actuator")
+        try:
+            self.backend.open()
+            self._refresh()
+        except Exception as e:
+            print(f"Error opening audio backend '{self.backend.name}': {e}")
+        finally:
+            self._ready.set()
+
+        while True:
+            try:
+                command = self._commands.get(timeout=self.poll_interval)
+            except queue.Empty:
+                command = None
+
+            if command is self._STOP:
+                break
+
+            try:
+                if command is not None:
+                    self._apply(*command)
+                if self.backend.device_changed():
+                    self._refresh()
+                elif not self.backend.notifies_changes and self._commands.empty():
+                    # Nothing tells us about mutes made elsewhere, so read them
+                    self._refresh()
+            except Exception as e:
+                print(f"Audio backend error: {e}")
+
+        try:
+            self.backend.close()
+        except Exception as e:
+            print(f"Error closing audio backend: {e}")
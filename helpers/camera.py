@@ -0,0 +1,196 @@
+"""
+Camera capture module.
+
+Wraps cv2.VideoCapture so the capture mode (pixel format, resolution and
+frame rate) can be negotiated at startup and changed while the app is running.
+"""
+
+import threading
+import time
+from typing import Optional, Tuple
+import cv2
+import numpy as np
+from core.config_manager import config
+from core.metrics import metrics
+from helpers.camera_probe import negotiate_mode
+from helpers.frame_pool import FramePool
+
+
+class Camera:
+    """
+    A webcam whose resolution and frame rate can be switched at runtime.
+    """
+
+    def __init__(self, index=0, pool_size: int = 8):
+        """
+        Open the camera.
+
+        Args:
+            index (int or str): OpenCV camera index, or a video file to replay.
+            pool_size (int): Number of idle frame buffers kept for reuse.
+        """
+        self.index = index
+        self.pool = FramePool(pool_size)
+        self.capture = cv2.VideoCapture(index)
+        self.width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS)
+        self.mode_changes = 0
+        self.last_switch_ms = 0.0
+        self.fourcc = None
+        # (width, height) chosen by negotiate(); the base for later mode changes
+        self.negotiated_size = None
+        self._requested = (self.width, self.height, 0)
+        # Serializes mode changes with reopen(), which runs on the reconnect thread
+        self._lock = threading.RLock()
+
+    def set_mode(self, width: int, height: int, fps: float = 0, fourcc: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Request a capture mode. The camera picks the closest mode it supports.
+
+        Args:
+            width (int): Requested frame width.
+            height (int): Requested frame height.
+            fps (float): Requested frame rate, or 0 to leave it unchanged.
+            fourcc (str): Pixel format such as "MJPG" or "YUYV". The last one
+                          set is kept for later mode changes.
+
+        Returns:
+            Tuple[int, int]: The (width, height) actually delivered.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            self._requested = (width, height, fps)
+            if fourcc:
+                self.fourcc = fourcc
+            if self.fourcc:
+                # Must come before the size; some drivers reset it on resolution changes
+                self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps:
+                self.capture.set(cv2.CAP_PROP_FPS, fps)
+
+            self.width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            self.fps = self.capture.get(cv2.CAP_PROP_FPS)
+            self.mode_changes += 1
+            self.last_switch_ms = (time.perf_counter() - start) * 1000.0
+            return self.width, self.height
+
+    def negotiate(self, width: int, height: int, fps: float, on_progress=None) -> Tuple[int, int]:
+        """
+        Switch to the best measured mode for the request (see helpers.camera_probe),
+        falling back to a plain request if probing finds nothing.
+
+        Args:
+            on_progress: Probe progress callback, see camera_probe.negotiate_mode().
+
+        Returns:
+            Tuple[int, int]: The (width, height) actually delivered.
+        """
+        # Keep at most one frame queued in the driver so reads return fresh frames
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        mode = negotiate_mode(self, width, height, fps, on_progress=on_progress) if isinstance(self.index, int) else None
+        if mode is None:
+            self.negotiated_size = self.set_mode(width, height, fps)
+            return self.negotiated_size
+
+        print(f"Camera mode: {mode['fourcc']} {mode['width']}x{mode['height']} "
+              f"({mode['measured_fps']:.0f} fps measured, read {mode['read_ms']:.1f} ms)")
+        self.negotiated_size = self.set_mode(mode["width"], mode["height"], fps, fourcc=mode["fourcc"])
+        return self.negotiated_size
+
+    def reopen(self) -> bool:
+        """
+        Close and reopen the device, restoring the last requested mode.
+
+        Returns:
+            bool: True if the reopened camera delivered a frame.
+        """
+        with self._lock:
+            self.capture.release()
+            capture = cv2.VideoCapture(self.index)
+            if not capture.isOpened():
+                capture.release()
+                return False
+
+            self.capture = capture
+            self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.set_mode(*self._requested)
+            success, _ = self.capture.read()
+            return success
+
+    def read(self) -> Tuple[bool, np.ndarray]:
+        """
+        Grab the next frame into a buffer borrowed from the pool. Return it
+        with pool.release() once it is no longer needed.
+
+        Returns:
+            Tuple[bool, np.ndarray]: (success, BGR frame or None)
+        """
+        buffer = self.pool.acquire((self.height, self.width, 3))
+        success, img = self.capture.read(image=buffer)
+        if img is not buffer:
+            # Failed, or the camera delivered a different size than it reported
+            self.pool.release(buffer)
+        return success, img
+
+    def release(self):
+        self.capture.release()
+
+
+class CameraReconnector:
+    """
+    Reopens a camera in the background with exponential backoff, so a USB
+    hiccup does not stop the app or reload the hand tracker.
+    """
+
+    INITIAL_DELAY = 0.1
+    MAX_DELAY = 2.0
+
+    def __init__(self, camera: Camera):
+        self.camera = camera
+        self.attempts = 0
+        self.gave_up = False
+        self._thread = None
+        self._finished = threading.Event()
+        self._stop = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.active:
+            return
+        self._finished.clear()
+        self._thread = threading.Thread(target=self._run, name="camera-reconnect", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until reconnection finishes or timeout expires. Returns True if finished."""
+        return self._finished.wait(timeout)
+
+    def stop(self):
+        self._stop.set()
+        if self.active:
+            self._thread.join(timeout=2.0)
+
+    def _run(self):
+        delay = self.INITIAL_DELAY
+        deadline = time.perf_counter() + config.CAMERA_RECONNECT_TIMEOUT_SECONDS
+        try:
+            while not self._stop.is_set():
+                self.attempts += 1
+                metrics.inc("camera.reconnect_attempts")
+                if self.camera.reopen():
+                    return
+                if time.perf_counter() >= deadline:
+                    print(f"Camera could not be reopened within {config.CAMERA_RECONNECT_TIMEOUT_SECONDS}s.")
+                    self.gave_up = True
+                    return
+                self._stop.wait(delay)
+                delay = min(delay * 2.0, self.MAX_DELAY)
+        finally:
+            self._finished.set()
@@ -0,0 +1,179 @@
+"""
+Camera mode negotiation.
+
+Many webcams fall back to slow uncompressed YUYV when only a resolution is
+requested. The probe tries each candidate pixel format and resolution,
+measures the frame rate actually delivered and how long read() blocks, and
+picks the best mode. The choice is cached per device in CAMERA_MODE_CACHE_FILE
+so the probe only runs once per camera and requested mode.
+
+Every mode is probed at the requested frame rate only. The app never captures
+faster than that, and a driver that cannot deliver it falls back to its
+nearest supported rate, which the measurement then reports; probing a range
+of rates would multiply the first-run cost without changing the choice.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Callable, List, Optional
+import cv2
+import numpy as np
+from core.config_manager import config
+
+FOURCCS = ("MJPG", "YUYV")
+RESOLUTIONS = ((1920, 1080), (1280, 720), (960, 540), (640, 480))
+
+# Frames discarded after a mode switch while the camera settles
+WARMUP_FRAMES = 5
+MEASURE_FRAMES = 20
+# Upper bound on the time spent measuring one mode
+MEASURE_SECONDS = 1.5
+
+
+def fourcc_to_str(code: float) -> str:
+    code = int(code)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+
+def device_key(camera) -> str:
+    """
+    Identifies the physical camera, so a different camera on the same index is probed again.
+    """
+    name = ""
+    if sys.platform.startswith("linux"):
+        try:
+            with open(f"/sys/class/video4linux/video{camera.index}/name") as f:
+                name = f.read().strip()
+        except OSError:
+            pass
+    backend = camera.capture.getBackendName() if camera.capture.isOpened() else "closed"
+    return f"{backend}:{camera.index}:{name}"
+
+
+def candidate_modes(width: int, height: int, fps: float) -> List[dict]:
+    """The requested resolution and standard smaller ones, in each pixel format."""
+    resolutions = [(width, height)] + [r for r in RESOLUTIONS if r[0] * r[1] < width * height]
+    return [
+        {"fourcc": fourcc, "width": w, "height": h, "fps": fps}
+        for w, h in resolutions
+        for fourcc in FOURCCS
+    ]
+
+
+def measure_mode(camera, mode: dict) -> Optional[dict]:
+    """
+    Switches the camera to a mode and measures it.
+
+    Returns:
+        dict: The mode as delivered, with "measured_fps" and "read_ms", or None
+              if the camera returned no frames.
+    """
+    width, height = camera.set_mode(mode["width"], mode["height"], mode["fps"], fourcc=mode["fourcc"])
+    delivered = {
+        "fourcc": fourcc_to_str(camera.capture.get(cv2.CAP_PROP_FOURCC)) or mode["fourcc"],
+        "width": width,
+        "height": height,
+        "fps": mode["fps"],
+    }
+
+    for _ in range(WARMUP_FRAMES):
+        if not camera.capture.grab():
+            return None
+
+    reads = []
+    start = time.perf_counter()
+    while len(reads) < MEASURE_FRAMES and time.perf_counter() - start < MEASURE_SECONDS:
+        read_start = time.perf_counter()
+        success, _ = camera.capture.read()
+        if not success:
+            break
+        reads.append((time.perf_counter() - read_start) * 1000.0)
+    elapsed = time.perf_counter() - start
+
+    if len(reads) < 2:
+        return None
+    delivered["measured_fps"] = len(reads) / elapsed
+    delivered["read_ms"] = float(np.median(reads))
+    return delivered
+
+
+def choose_mode(results: List[dict], width: int, height: int, fps: float) -> Optional[dict]:
+    """
+    Picks the largest resolution (up to the requested one) that still delivers
+    at least 90% of the requested frame rate, preferring lower read latency.
+    If no mode is fast enough, the fastest one wins.
+    """
+    if not results:
+        return None
+    fast = [r for r in results if r["measured_fps"] >= 0.9 * fps and r["width"] * r["height"] <= width * height]
+    if fast:
+        return max(fast, key=lambda r: (r["width"] * r["height"], -r["read_ms"]))
+    return max(results, key=lambda r: (r["measured_fps"], -r["read_ms"]))
+
+
+def _load_cache() -> dict:
+    try:
+        with open(config.CAMERA_MODE_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict):
+    try:
+        with open(config.CAMERA_MODE_CACHE_FILE, "w") as f:
+            json.dump(cache, f, indent=4)
+    except OSError as e:
+        print(f"Could not save camera mode cache: {e}")
+
+
+def negotiate_mode(camera, width: int, height: int, fps: float, force: bool = False,
+                   on_progress: Optional[Callable[[int, int, dict], None]] = None) -> Optional[dict]:
+    """
+    Returns the best mode for the camera and request, probing only if it is not cached.
+
+    Args:
+        camera (Camera): The opened camera.
+        width (int): Requested frame width.
+        height (int): Requested frame height.
+        fps (float): Requested frame rate.
+        force (bool): Probe again even if a cached choice exists.
+        on_progress: Called as on_progress(done, total, mode) before each
+                     mode is measured, so a UI can show the probe.
+
+    Returns:
+        dict: The chosen mode (fourcc, width, height, fps, measured_fps,
+              read_ms), or None if no mode delivered frames.
+    """
+    cache = _load_cache()
+    key = device_key(camera)
+    request = f"{width}x{height}@{fps:g}"
+    entry = cache.get(key, {}).get(request)
+    if entry and not force:
+        return entry
+
+    modes = candidate_modes(width, height, fps)
+    print(f"Probing {len(modes)} camera modes for {request}, once per camera "
+          f"(up to {len(modes) * MEASURE_SECONDS:.0f} s)...")
+    results = []
+    for done, mode in enumerate(modes):
+        if on_progress is not None:
+            on_progress(done, len(modes), mode)
+        result = measure_mode(camera, mode)
+        if result is None:
+            continue
+        # Drivers often map several requests to the same real mode
+        if any((r["fourcc"], r["width"], r["height"]) == (result["fourcc"], result["width"], result["height"])
+               for r in results):
+            continue
+        print(f"  {result['fourcc']} {result['width']}x{result['height']}: "
+              f"{result['measured_fps']:.1f} fps, read {result['read_ms']:.1f} ms")
+        results.append(result)
+
+    best = choose_mode(results, width, height, fps)
+    if best is not None:
+        cache.setdefault(key, {})[request] = best
+        _save_cache(cache)
+    return best
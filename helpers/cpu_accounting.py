@@ -0,0 +1,247 @@
+"""
+CPU and memory accounting (Linux).
+
+Samples the CPU time of every thread of the process from /proc/self/task,
+and of the inference child process if there is one, and attributes it to a
+role: capture, inference, gesture, gui or actuator. Threads are recognized by
+name (see THREAD_ROLES); MediaPipe names its native threads "mediapipe/...",
+and those count as inference. A thread without a known name can claim a role
+with register_thread(). When the pipeline is off, capture, inference and
+gesture evaluation share one thread, which is counted as inference.
+
+RSS is only known per process, not per thread. Percentages are of one core,
+so a process keeping two cores busy shows 200%.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from typing import Optional
+from core.config_manager import config
+from core.metrics import metrics
+
+IS_LINUX = sys.platform.startswith("linux")
+
+ROLES = ("capture", "inference", "gesture", "gui", "actuator", "other")
+
+THREAD_ROLES = {
+    "MainThread": "gui",
+    "stage-capture": "capture",
+    "camera-reconnect": "capture",
+    "stage-inference": "inference",
+    "stage-gesture": "gesture",
+    "stage-render": "gui",
+    "scroll-engine": "actuator",
+    "audio-controller": "actuator",
+    "pactl-subscribe": "actuator",
+}
+
+# Native threads named by the libraries themselves (/proc/.../comm)
+NATIVE_PREFIX_ROLES = {
+    "mediapipe/": "inference",
+}
+
+CHILD_PROCESS_ROLES = {
+    "hand-inference": "inference",
+}
+
+_registered = {}   # native thread id -> role
+
+
+def register_thread(role: str):
+    """Attributes the calling thread to a role, overriding its name."""
+    _registered[threading.get_native_id()] = role
+
+
+def _clock_ticks() -> int:
+    return os.sysconf("SC_CLK_TCK") if IS_LINUX else 100
+
+
+def _read_cpu_seconds(stat_path: str) -> Optional[float]:
+    """User plus system CPU seconds from a /proc stat file, or None if it is gone."""
+    try:
+        with open(stat_path, "r") as f:
+            # The command name may contain spaces; the fields after it do not
+            fields = f.read().rsplit(")", 1)[1].split()
+    except (OSError, IndexError):
+        return None
+    return (int(fields[11]) + int(fields[12])) / _clock_ticks()
+
+
+def _read_comm(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _read_rss_mb(pid) -> float:
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return 0.0
+
+
+class CpuAccounting:
+    """
+    Periodic /proc sampler publishing per-role CPU usage and RSS as metrics.
+    """
+
+    def __init__(self, interval: float = None):
+        """
+        Args:
+            interval (float): Seconds between samples. Defaults to the
+                              CPU_ACCOUNTING_INTERVAL_SECONDS setting.
+        """
+        self.interval = interval or config.CPU_ACCOUNTING_INTERVAL_SECONDS
+        self.started_at = time.monotonic()
+        self.last = None        # Most recent sample, see sample()
+        self._previous = {}     # key -> cpu seconds at the previous sample
+        self._previous_time = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _thread_role(self, tid: int, names: dict) -> tuple:
+        """Returns (name, role) for a thread of this process."""
+        name = names.get(tid) or _read_comm(f"/proc/self/task/{tid}/comm")
+        role = _registered.get(tid) or THREAD_ROLES.get(name)
+        if role is None:
+            role = next((r for prefix, r in NATIVE_PREFIX_ROLES.items() if name.startswith(prefix)), "other")
+        return name, role
+
+    def sample(self) -> Optional[dict]:
+        """
+        Reads the CPU time of all threads and child processes once.
+
+        Returns:
+            dict: {"threads": [{"tid", "name", "role", "cpu_seconds", "cpu_percent"}],
+                   "children": [...same, with "pid" and "rss_mb"],
+                   "roles": {role: {"cpu_seconds", "cpu_percent"}},
+                   "process": {"cpu_seconds", "cpu_percent", "rss_mb", "threads"}}
+            or None where /proc is not available.
+        """
+        if not IS_LINUX:
+            return None
+        now = time.monotonic()
+        elapsed = now - self._previous_time if self._previous_time is not None else 0.0
+        names = {t.native_id: t.name for t in threading.enumerate()}
+        current = {}
+
+        def percent(key, seconds):
+            current[key] = seconds
+            before = self._previous.get(key)
+            if before is None or elapsed <= 0:
+                return 0.0
+            return max(0.0, seconds - before) / elapsed * 100.0
+
+        threads = []
+        try:
+            tids = [int(tid) for tid in os.listdir("/proc/self/task")]
+        except OSError:
+            return None
+        for tid in tids:
+            seconds = _read_cpu_seconds(f"/proc/self/task/{tid}/stat")
+            if seconds is None:
+                continue  # Exited since listing
+            name, role = self._thread_role(tid, names)
+            threads.append({
+                "tid": tid, "name": name, "role": role,
+                "cpu_seconds": seconds, "cpu_percent": percent(("thread", tid), seconds),
+            })
+
+        children = []
+        for child in multiprocessing.active_children():
+            seconds = _read_cpu_seconds(f"/proc/{child.pid}/stat")
+            if seconds is None:
+                continue
+            children.append({
+                "pid": child.pid, "name": child.name, "role": CHILD_PROCESS_ROLES.get(child.name, "other"),
+                "cpu_seconds": seconds, "cpu_percent": percent(("process", child.pid), seconds),
+                "rss_mb": _read_rss_mb(child.pid),
+            })
+
+        roles = {role: {"cpu_seconds": 0.0, "cpu_percent": 0.0} for role in ROLES}
+        for entry in threads + children:
+            roles[entry["role"]]["cpu_seconds"] += entry["cpu_seconds"]
+            roles[entry["role"]]["cpu_percent"] += entry["cpu_percent"]
+
+        process = {
+            "cpu_seconds": sum(e["cpu_seconds"] for e in threads + children),
+            "cpu_percent": sum(e["cpu_percent"] for e in threads + children),
+            "rss_mb": _read_rss_mb("self") + sum(c["rss_mb"] for c in children),
+            "threads": len(threads),
+        }
+
+        self._previous = current
+        self._previous_time = now
+        self.last = {"threads": threads, "children": children, "roles": roles, "process": process}
+        self._publish(self.last)
+        return self.last
+
+    @staticmethod
+    def _publish(sample: dict):
+        for role, usage in sample["roles"].items():
+            metrics.set_gauge(f"cpu.{role}.percent", usage["cpu_percent"])
+            metrics.set_gauge(f"cpu.{role}.seconds", usage["cpu_seconds"])
+        process = sample["process"]
+        metrics.set_gauge("cpu.process.percent", process["cpu_percent"])
+        metrics.set_gauge("cpu.process.seconds", process["cpu_seconds"])
+        metrics.set_gauge("memory.rss_mb", process["rss_mb"])
+        metrics.set_gauge("process.threads", process["threads"])
+
+    def start(self):
+        """Samples in the background until stop(). Does nothing outside Linux."""
+        if not IS_LINUX or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cpu-accounting", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def report(self) -> str:
+        """A readable table of the latest sample: roles first, then every thread."""
+        sample = self.sample()
+        if sample is None:
+            return "CPU accounting is only available on Linux."
+        uptime = time.monotonic() - self.started_at
+        lines = [f"CPU usage after {uptime:.0f}s (percent of one core; seconds since process start):"]
+        for role, usage in sample["roles"].items():
+            lines.append(f"  {role:<10}{usage['cpu_percent']:>7.1f}%{usage['cpu_seconds']:>10.1f}s")
+        process = sample["process"]
+        lines.append(f"  {'total':<10}{process['cpu_percent']:>7.1f}%{process['cpu_seconds']:>10.1f}s"
+                     f"   RSS {process['rss_mb']:.0f} MB, {process['threads']} threads")
+        for entry in sorted(sample["threads"] + sample["children"], key=lambda e: -e["cpu_seconds"]):
+            ident = f"pid {entry['pid']}" if "pid" in entry else f"tid {entry['tid']}"
+            lines.append(f"    {entry['name']:<24}{entry['role']:<11}{ident:<12}{entry['cpu_seconds']:>8.2f}s")
+        return "\n".join(lines)
+
+    def dump(self, path: str):
+        """Writes the latest sample (taken now) as JSON."""
+        sample = self.sample()
+        if sample is None:
+            return
+        sample = dict(sample, uptime_seconds=time.monotonic() - self.started_at)
+        try:
+            with open(path, "w") as f:
+                json.dump(sample, f, indent=4)
+            print(f"CPU usage written to {path}")
+        except OSError as e:
+            print(f"Could not write CPU usage to {path}: {e}")
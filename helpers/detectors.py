@@ -26,7 +26,7 @@ def is_fist(hand_data):
     """
     Checks for a fist gesture (all fingertips close to wrist).
     """
-    curl_threshold = hand_data.palm_size * 1.1
+    curl_threshold = hand_data.palm_size * config.FIST_CURL_RATIO
     return (
         hand_data.index_to_wrist_dist < curl_threshold
         and hand_data.middle_to_wrist_dist < curl_threshold
@@ -0,0 +1,70 @@
+"""
+Frame buffer pool.
+
+Keeps a small free list of frame-sized arrays so the camera can decode every
+frame into memory that was used before. A stage that is done with a frame
+hands its buffer back with release(); a buffer that is never returned is
+simply garbage collected, and the pool allocates a replacement. The
+allocation counters show whether the steady state is allocation-free.
+"""
+
+import threading
+from collections import deque
+from typing import Tuple
+import numpy as np
+from core.metrics import metrics
+
+
+class FramePool:
+    """
+    A fixed-size free list of uint8 frame buffers of one shape.
+    """
+
+    # Weight of the newest frame in the recent allocations-per-frame average
+    RECENT_BLEND = 0.05
+
+    def __init__(self, size: int):
+        """
+        Args:
+            size (int): Maximum number of idle buffers kept for reuse.
+        """
+        self.size = size
+        self.shape = None
+        self.allocations = 0
+        self.acquired = 0
+        self.recent_allocations = 0.0  # Moving average of allocations per acquired frame
+        self._free = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: Tuple[int, int, int]) -> np.ndarray:
+        """
+        Borrows a buffer of the given shape, allocating one only if none is free.
+        Its contents are undefined.
+        """
+        with self._lock:
+            self.acquired += 1
+            if shape != self.shape:
+                # Frame size changed; buffers of the old size are of no use any more
+                self.shape = shape
+                self._free.clear()
+            buffer = self._free.pop() if self._free else None
+            allocated = buffer is None
+            if allocated:
+                self.allocations += 1
+            self.recent_allocations += self.RECENT_BLEND * (allocated - self.recent_allocations)
+
+        metrics.set_gauge("frame_pool.allocations_per_frame", self.recent_allocations)
+        if not allocated:
+            return buffer
+        metrics.inc("frame_pool.allocations")
+        return np.empty(shape, dtype=np.uint8)
+
+    def release(self, buffer: np.ndarray):
+        """Returns a buffer obtained from acquire() for reuse."""
+        if buffer is None:
+            return
+        with self._lock:
+            if buffer.shape == self.shape and len(self._free) < self.size \
+                    and not any(buffer is free for free in self._free):
+                self._free.append(buffer)
+            metrics.set_gauge("frame_pool.free", len(self._free))
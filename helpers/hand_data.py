@@ -6,11 +6,14 @@ class HandData:
     Encapsulates hand landmark data and provides helper properties/methods
     for gesture detection.
     """
-    def __init__(self, hand_landmarks, img_shape, label=None, is_main=False):
+    def __init__(self, hand_landmarks, img_shape, label=None, is_main=False, hand_id=None):
+        # Normalized landmarks for one hand, shape (21, 3)
         self.landmarks = hand_landmarks
         self.img_h, self.img_w = img_shape
         self.label = label
         self.is_main = is_main
+        # Persistent ID from HandIdentityTracker, stable across frames
+        self.hand_id = hand_id
         
         # Cache for computed positions to avoid re-calculation
         self._positions = {}
@@ -45,8 +48,8 @@ class HandData:
         if idx in self._positions:
             return self._positions[idx]
         
-        lm = self.landmarks.landmark[idx]
-        x, y = int(lm.x * self.img_w), int(lm.y * self.img_h)
+        x = int(self.landmarks[idx, 0] * self.img_w)
+        y = int(self.landmarks[idx, 1] * self.img_h)
         self._positions[idx] = (x, y)
         return x, y
 
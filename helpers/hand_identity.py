@@ -0,0 +1,186 @@
+"""
+Frame-to-frame hand identity tracking.
+
+MediaPipe classifies handedness independently on every frame, and that
+classification can flip for a frame or two. HandIdentityTracker instead gives
+each physical hand a persistent ID by matching wrist position and palm scale
+between frames, and decides its handedness by voting over a window of frames.
+"""
+
+import itertools
+import threading
+from collections import deque
+from typing import List, Optional
+import numpy as np
+from core.config_manager import config
+
+
+class HandTrack:
+    """
+    A hand followed across frames.
+    """
+
+    def __init__(self, hand_id: int, wrist: np.ndarray, palm_size: float):
+        self.hand_id = hand_id
+        self.wrist = wrist
+        self.palm_size = palm_size
+        self.missed_frames = 0
+        self.age = 0
+        self.votes = deque(maxlen=config.HANDEDNESS_VOTE_WINDOW)
+        self.handedness = None
+        self.vote_margin = 0.0
+
+    def add_vote(self, label: Optional[str], score: float):
+        if label:
+            self.votes.append((label, score))
+        self._tally()
+
+    def _tally(self):
+        totals = {}
+        for label, score in self.votes:
+            totals[label] = totals.get(label, 0.0) + score
+        if not totals:
+            return
+
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        best_label, best_total = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        self.handedness = best_label
+        self.vote_margin = (best_total - runner_up) / len(self.votes)
+
+
+class HandIdentityTracker:
+    """
+    Assigns persistent IDs and voted handedness to the hands in each frame.
+    """
+
+    OPPOSITE = {"Left": "Right", "Right": "Left"}
+
+    def __init__(self):
+        self.tracks: List[HandTrack] = []
+        self._next_id = 1
+        self._pending_scale = None  # (sx, sy) not yet applied by update()
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget all tracks."""
+        self.tracks = []
+
+    def rescale(self, sx: float, sy: float):
+        """
+        Scales remembered positions when the frame size changes. May be called
+        from any thread; the tracks are scaled by the next update().
+        """
+        with self._lock:
+            if self._pending_scale is not None:
+                sx, sy = sx * self._pending_scale[0], sy * self._pending_scale[1]
+            self._pending_scale = (sx, sy)
+
+    def _apply_pending_scale(self):
+        with self._lock:
+            pending, self._pending_scale = self._pending_scale, None
+        if pending is None:
+            return
+        sx, sy = pending
+        for track in self.tracks:
+            track.wrist = track.wrist * (sx, sy)
+            track.palm_size *= (sx + sy) / 2.0
+
+    def update(self, wrists, palm_sizes, labels, scores) -> List[HandTrack]:
+        """
+        Matches this frame's hands to existing tracks.
+
+        Args:
+            wrists: Wrist pixel positions, shape (hands, 2).
+            palm_sizes: Palm size (wrist to middle MCP) in pixels, shape (hands,).
+            labels (list): MediaPipe handedness label per hand, or None.
+            scores (list): Handedness confidence per hand.
+
+        Returns:
+            List[HandTrack]: The track for each input hand, in input order.
+        """
+        self._apply_pending_scale()
+        wrists = np.asarray(wrists, dtype=float).reshape(-1, 2)
+        palm_sizes = np.maximum(np.asarray(palm_sizes, dtype=float).reshape(-1), 1.0)
+        num_hands = len(wrists)
+
+        assignment = self._assign(wrists, palm_sizes)
+
+        matched = set()
+        frame_tracks = []
+        for idx in range(num_hands):
+            track = assignment.get(idx)
+            if track is None:
+                track = HandTrack(self._next_id, wrists[idx], palm_sizes[idx])
+                self._next_id += 1
+                self.tracks.append(track)
+            track.wrist = wrists[idx]
+            track.palm_size = palm_sizes[idx]
+            track.missed_frames = 0
+            track.age += 1
+            track.add_vote(labels[idx] if idx < len(labels) else None,
+                           scores[idx] if idx < len(scores) else 1.0)
+            matched.add(track.hand_id)
+            frame_tracks.append(track)
+
+        for track in self.tracks:
+            if track.hand_id not in matched:
+                track.missed_frames += 1
+        self.tracks = [
+            t for t in self.tracks
+            if t.missed_frames <= config.HAND_TRACK_MAX_MISSED_FRAMES
+        ]
+
+        self._resolve_conflicts(frame_tracks)
+        return frame_tracks
+
+    def _assign(self, wrists: np.ndarray, palm_sizes: np.ndarray) -> dict:
+        """
+        Finds the lowest-cost matching of detections to tracks. With at most a
+        handful of hands, trying every assignment is cheaper than anything clever.
+        """
+        if not self.tracks or len(wrists) == 0:
+            return {}
+
+        track_wrists = np.array([t.wrist for t in self.tracks])
+        track_palms = np.array([t.palm_size for t in self.tracks])
+
+        # Wrist travel measured in palm sizes, plus a penalty for scale change
+        scale = np.maximum(palm_sizes[:, None], track_palms[None, :])
+        travel = np.linalg.norm(wrists[:, None, :] - track_wrists[None, :, :], axis=2) / scale
+        scale_change = np.abs(np.log(palm_sizes[:, None] / track_palms[None, :]))
+        cost = travel + config.HAND_TRACK_SCALE_WEIGHT * scale_change
+        gate = config.HAND_TRACK_MAX_DISTANCE_RATIO
+
+        num_dets, num_tracks = cost.shape
+        best, best_cost = {}, None
+        slots = list(range(num_tracks)) + [None] * num_dets
+        for perm in set(itertools.permutations(slots, num_dets)):
+            total, pairs = 0.0, {}
+            for det, trk in enumerate(perm):
+                if trk is None or cost[det, trk] > gate:
+                    # Unmatched detections pay the gate so matches are preferred
+                    total += gate
+                else:
+                    total += cost[det, trk]
+                    pairs[det] = self.tracks[trk]
+            if best_cost is None or total < best_cost:
+                best, best_cost = pairs, total
+        return best
+
+    def _resolve_conflicts(self, frame_tracks: List[HandTrack]):
+        """
+        Two hands in the same frame cannot share a handedness. The track with
+        the weaker vote yields and takes the opposite label.
+        """
+        by_label = {}
+        for track in frame_tracks:
+            if track.handedness:
+                by_label.setdefault(track.handedness, []).append(track)
+
+        for label, tracks in by_label.items():
+            if len(tracks) < 2 or label not in self.OPPOSITE:
+                continue
+            tracks.sort(key=lambda t: (t.vote_margin, t.age), reverse=True)
+            for track in tracks[1:]:
+                track.handedness = self.OPPOSITE[label]
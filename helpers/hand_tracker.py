@@ -8,15 +8,139 @@ initializing and using MediaPipe's Hand tracking solution.
 import mediapipe as mp
 import cv2
 import numpy as np
-from typing import Tuple, List, NamedTuple
+from typing import Optional, Tuple, List, NamedTuple
+from core.config_manager import config
 
-class HandTracker:
+NUM_LANDMARKS = 21
+
+
+class TrackerResult(NamedTuple):
+    """
+    Compact per-frame tracker output. Arrays are indexed [hand, landmark, xyz].
+    """
+    landmarks: np.ndarray           # (hands, 21, 3) normalized image x, y and relative depth z
+    handedness: List[str]           # MediaPipe handedness label per hand ("Left" / "Right")
+    handedness_scores: List[float]  # Confidence of each handedness label
+    world_landmarks: np.ndarray     # (hands, 21, 3) metric coordinates with origin at the wrist
+
+    @staticmethod
+    def empty() -> "TrackerResult":
+        none = np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+        return TrackerResult(none, [], [], none.copy())
+
+
+def landmarks_to_array(landmark_lists) -> np.ndarray:
+    """
+    Packs MediaPipe landmark lists into a (hands, 21, 3) float32 array.
+    """
+    if not landmark_lists:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.array(
+        [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in landmark_lists],
+        dtype=np.float32,
+    )
+
+
+def draw_hand(img: np.ndarray, hand_landmarks: np.ndarray, color: Tuple[int, int, int]):
+    """
+    Draws a hand skeleton from a normalized (21, 3) landmark array.
+
+    Args:
+        img (np.ndarray): The image to draw on.
+        hand_landmarks (np.ndarray): Normalized landmarks of one hand, shape (21, 3).
+        color (Tuple[int, int, int]): BGR color for joints and bones.
+    """
+    h, w = img.shape[:2]
+    points = (hand_landmarks[:, :2] * (w, h)).astype(np.int32)
+    for start, end in mp.solutions.hands.HAND_CONNECTIONS:
+        cv2.line(img, tuple(points[start]), tuple(points[end]), color, 2)
+    for point in points:
+        cv2.circle(img, tuple(point), 2, color, cv2.FILLED)
+
+
+class RgbBuffer:
+    """
+    Reused destination for the BGR to RGB conversion of frames (or crops).
+    """
+
+    def __init__(self):
+        self._buffer = np.empty((0, 0, 3), dtype=np.uint8)
+
+    def convert(self, img: np.ndarray) -> np.ndarray:
+        """
+        Converts a BGR image into the buffer, reallocating only when the size changes.
+
+        Returns:
+            np.ndarray: The RGB image. It is overwritten by the next call.
+        """
+        if self._buffer.shape != img.shape:
+            self._buffer = np.empty(img.shape, dtype=np.uint8)
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=self._buffer)
+
+
+class TrackerBackend:
+    """
+    Interface shared by all hand tracker implementations.
+
+    Every backend returns the same TrackerResult arrays, so the rest of the
+    app does not depend on which MediaPipe API produced them.
+    """
+
+    name = "base"
+
+    def process_frame(self, img: np.ndarray) -> Tuple[np.ndarray, TrackerResult]:
+        """
+        Args:
+            img (np.ndarray): The input image (BGR format from OpenCV).
+
+        Returns:
+            Tuple[np.ndarray, TrackerResult]: The image and the latest known hands.
+        """
+        raise NotImplementedError
+
+    def reconfigure(self, **settings):
+        """Apply changed tracker settings (model, confidences)."""
+        raise NotImplementedError
+
+    def draw_landmarks(self, img: np.ndarray, hand_landmarks: np.ndarray, color: Tuple[int, int, int]):
+        draw_hand(img, hand_landmarks, color)
+
+    def close(self):
+        """Release the model."""
+
+
+class HandTracker(TrackerBackend):
     """
     A wrapper class for MediaPipe Hands to perform hand tracking and landmark extraction.
+
+    Uses the synchronous mp.solutions.hands API: every call runs inference on
+    the given frame and returns its result.
+
+    A tracking graph keeps its own normalized tracking region from the
+    previous input. In ROI mode full frames and crops therefore go to two
+    long-lived graphs. When the crop moves while the crop graph is tracking
+    a hand, its tracking is cleared by feeding it a tiny blank image, which
+    costs one palm detection (about 20 ms), not the ~100 ms of building and
+    warming up a new graph. A hand reaching the crop edge gets a recentered
+    crop directly, without a full frame in between. The periodic search for
+    new hands runs on a separate static-mode graph, one extra full-frame
+    detection every ROI_FULL_FRAME_INTERVAL frames while fewer than
+    max_num_hands are tracked.
+
+    MediaPipe resizes every input to fixed model sizes, so a crop costs about
+    as much inference as a full frame. ROI mode saves the colour conversion
+    of the full frame and gives small, distant hands more model resolution;
+    it does not make inference itself cheaper.
     """
 
+    name = "solutions"
+
+    # Input that clears a tracking graph's state
+    _BLANK = np.zeros((32, 32, 3), dtype=np.uint8)
+
     def __init__(self, static_image_mode: bool = False, max_num_hands: int = 1, 
-                 min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5):
+                 min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5,
+                 roi_mode: bool = False, model_complexity: int = 1):
         """
         Initialize the HandTracker.
 
@@ -28,19 +152,45 @@ class HandTracker:
                                               detection to be considered successful.
             min_tracking_confidence (float): Minimum confidence value ([0.0, 1.0]) for the
                                              hand landmarks to be considered tracked successfully.
+            roi_mode (bool): Run inference on a padded crop around the hands found in the
+                             previous frame instead of the full frame.
+            model_complexity (int): Hand landmark model, 0 (lite) or 1 (full).
         """
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
+        self.max_num_hands = max_num_hands
+        self.roi_mode = roi_mode
+        self.roi = None  # (x0, y0, x1, y1) crop for the next frame, None = full frame
+        self._frames_since_full = 0
+        self._crop_hands = None      # Tracking graph for crops, kept for the tracker's lifetime
+        self._crop_hands_roi = None  # Crop the crop graph's tracking state refers to
+        self._crop_tracking = False  # The crop graph found hands on its last input
+        self._search_hands = None    # Static-mode graph for the periodic full-frame search
+        self._frame_size = None
+        self._rgb = RgbBuffer()
+        self.settings = dict(
             static_image_mode=static_image_mode,
             max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence
+            min_tracking_confidence=min_tracking_confidence,
         )
+        self.mp_hands = mp.solutions.hands
+        self.hands = self.mp_hands.Hands(**self.settings)
 
-    def process_frame(
-        self, img: np.ndarray
-    ) -> Tuple[np.ndarray, List[NamedTuple], List[NamedTuple], List[NamedTuple]]:
+    def reconfigure(self, **settings):
+        """
+        Rebuild the MediaPipe graph with changed settings.
+
+        Args:
+            **settings: Any of model_complexity, min_detection_confidence and
+                        min_tracking_confidence.
+        """
+        self.settings.update(settings)
+        self.close()
+        self.hands = self.mp_hands.Hands(**self.settings)
+        # The new graph has no tracking state, so search the full frame first
+        self.roi = None
+
+    def process_frame(self, img: np.ndarray) -> Tuple[np.ndarray, TrackerResult]:
         """
         Process a single video frame to detect hands.
 
@@ -48,38 +198,148 @@ class HandTracker:
             img (np.ndarray): The input image (BGR format from OpenCV).
 
         Returns:
-            Tuple[np.ndarray, List[NamedTuple], List[NamedTuple], List[NamedTuple]]:
+            Tuple[np.ndarray, TrackerResult]:
                 - The processed image (BGR).
-                - Detected hand landmarks objects (possibly empty).
-                - The handedness classification entries for the detected hands.
-                - The world landmarks (3D coordinates in meters).
-        """
-        # Convert the BGR image to RGB before processing.
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(img_rgb)
-
-        hand_landmarks = results.multi_hand_landmarks or []
-        handedness = results.multi_handedness or []
-        world_landmarks = results.multi_hand_world_landmarks or []
-
-        return img, list(hand_landmarks), list(handedness), list(world_landmarks)
-
-    def draw_landmarks(self, img: np.ndarray, hand_landmarks, color: Tuple[int, int, int]):
-        drawing_spec = self.mp_drawing.DrawingSpec(color=color, thickness=2, circle_radius=2)
-        self.mp_drawing.draw_landmarks(
-            img,
-            hand_landmarks,
-            self.mp_hands.HAND_CONNECTIONS,
-            drawing_spec,
-            drawing_spec,
+                - The detected hands as compact landmark arrays (possibly empty).
+        """
+        img_h, img_w = img.shape[:2]
+
+        if self._frame_size != (img_w, img_h):
+            # A crop from a different resolution does not apply to this frame
+            self._frame_size = (img_w, img_h)
+            self.roi = None
+
+        # Only the region MediaPipe sees is converted to RGB; the frame itself
+        # stays BGR for drawing and preview.
+        roi = self.roi if self.roi_mode else None
+        if roi is not None:
+            if roi != self._crop_hands_roi:
+                self._switch_crop(roi)
+            x0, y0, x1, y1 = roi
+            result = self._to_result(self._crop_hands.process(self._rgb.convert(img[y0:y1, x0:x1])))
+            self._crop_tracking = len(result.landmarks) > 0
+            self._crop_to_frame(result.landmarks, roi, img_w, img_h)
+            self._frames_since_full += 1
+        else:
+            # The full-frame graph's tracking region is in full-frame coordinates
+            # however long the crops ran; a stale one just fails and re-detects
+            result = self._to_result(self.hands.process(self._rgb.convert(img)))
+            self._frames_since_full = 0
+            # Any later crop, even an identical one, must not reuse the old tracking
+            self._crop_hands_roi = None
+
+        if (roi is not None and 0 < len(result.landmarks) < self.max_num_hands
+                and self._frames_since_full >= config.ROI_FULL_FRAME_INTERVAL):
+            # Look for hands entering the frame without disturbing the tracking graphs
+            self._frames_since_full = 0
+            found = self._search(img)
+            if len(found.landmarks) > len(result.landmarks):
+                result, roi = found, None
+
+        if self.roi_mode:
+            self.roi = self._next_roi(result.landmarks, roi, img_w, img_h)
+        return img, result
+
+    @staticmethod
+    def _to_result(results) -> TrackerResult:
+        handedness, scores = [], []
+        for entry in results.multi_handedness or []:
+            handedness.append(entry.classification[0].label)
+            scores.append(entry.classification[0].score)
+        return TrackerResult(
+            landmarks_to_array(results.multi_hand_landmarks),
+            handedness,
+            scores,
+            landmarks_to_array(results.multi_hand_world_landmarks),
         )
 
-    def get_landmark_pos(self, hand_landmarks, landmark_idx: int, img_shape: Tuple[int, int]) -> Tuple[int, int]:
+    def _switch_crop(self, roi: Tuple[int, int, int, int]):
+        """
+        Points the crop graph at a new crop. A tracking region from the old
+        crop would be misplaced in the new one, so it is cleared by running
+        the graph once on a blank image, which finds no hand.
+        """
+        if self._crop_hands is None:
+            self._crop_hands = self.mp_hands.Hands(**self.settings)
+        elif self._crop_tracking:
+            self._crop_hands.process(self._BLANK)
+            self._crop_tracking = False
+        self._crop_hands_roi = roi
+
+    def _search(self, img: np.ndarray) -> TrackerResult:
+        """Runs hand detection on the full frame with the static-mode graph."""
+        if self._search_hands is None:
+            self._search_hands = self.mp_hands.Hands(**dict(self.settings, static_image_mode=True))
+        return self._to_result(self._search_hands.process(self._rgb.convert(img)))
+
+    @staticmethod
+    def _crop_to_frame(landmarks: np.ndarray, roi: Tuple[int, int, int, int], img_w: int, img_h: int):
+        """Maps landmarks normalized to the crop back to full-frame normalized coordinates, in place."""
+        x0, y0, x1, y1 = roi
+        crop_w, crop_h = x1 - x0, y1 - y0
+        landmarks[..., 0] = (landmarks[..., 0] * crop_w + x0) / img_w
+        landmarks[..., 1] = (landmarks[..., 1] * crop_h + y0) / img_h
+        # MediaPipe scales depth like x
+        landmarks[..., 2] *= crop_w / img_w
+
+    def _next_roi(self, landmarks: np.ndarray, roi: Optional[Tuple[int, int, int, int]],
+                  img_w: int, img_h: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Chooses the crop for the next frame, or None to run on the full frame.
+
+        Falls back to the full frame when hands are lost or the crop would
+        cover most of the frame. A crop is kept while the hands stay inside
+        it; when a hand comes close to its edge, or with roi None, a new crop
+        is fitted around the hands.
+        """
+        if len(landmarks) == 0:
+            return None
+
+        xs = landmarks[..., 0] * img_w
+        ys = landmarks[..., 1] * img_h
+        bx0, by0, bx1, by1 = xs.min(), ys.min(), xs.max(), ys.max()
+
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            margin = config.ROI_EDGE_MARGIN_RATIO * max(x1 - x0, y1 - y0)
+            touches_edge = (
+                (x0 > 0 and bx0 - x0 < margin)
+                or (y0 > 0 and by0 - y0 < margin)
+                or (x1 < img_w and x1 - bx1 < margin)
+                or (y1 < img_h and y1 - by1 < margin)
+            )
+            if not touches_edge:
+                # Keep the crop stable while the hands stay well inside it. A fixed
+                # crop keeps MediaPipe's own frame-to-frame tracking valid.
+                return roi
+            # Otherwise fit a new crop around the hands where they are now
+
+        pad = config.ROI_PADDING_RATIO * max(bx1 - bx0, by1 - by0)
+        x0 = int(max(0, bx0 - pad))
+        y0 = int(max(0, by0 - pad))
+        x1 = int(min(img_w, bx1 + pad))
+        y1 = int(min(img_h, by1 + pad))
+
+        # Not worth cropping if the crop would be most of the frame anyway
+        if (x1 - x0) * (y1 - y0) > config.ROI_MAX_AREA_RATIO * img_w * img_h:
+            return None
+        return x0, y0, x1, y1
+
+    def close(self):
+        """Release the MediaPipe graphs."""
+        self.hands.close()
+        for graph in (self._crop_hands, self._search_hands):
+            if graph is not None:
+                graph.close()
+        self._crop_hands = self._crop_hands_roi = self._search_hands = None
+        self._crop_tracking = False
+
+    def get_landmark_pos(self, hand_landmarks: np.ndarray, landmark_idx: int, img_shape: Tuple[int, int]) -> Tuple[int, int]:
         """
         Calculate the pixel coordinates of a specific landmark.
 
         Args:
-            hand_landmarks: The detected hand landmarks object from MediaPipe.
+            hand_landmarks (np.ndarray): Normalized landmarks of one hand, shape (21, 3).
             landmark_idx (int): The index of the landmark to retrieve.
             img_shape (Tuple[int, int]): The shape of the image (height, width).
 
@@ -87,7 +347,5 @@ class HandTracker:
             Tuple[int, int]: The (x, y) pixel coordinates of the landmark.
         """
         h, w = img_shape
-        lm = hand_landmarks.landmark[landmark_idx]
-        x, y = int(lm.x * w), int(lm.y * h)
+        x, y = int(hand_landmarks[landmark_idx, 0] * w), int(hand_landmarks[landmark_idx, 1] * h)
         return x, y
-
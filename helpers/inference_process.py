@@ -0,0 +1,309 @@
+"""
+Out-of-process hand inference.
+
+RemoteHandTracker runs MediaPipe in a child process so inference does not
+compete with the GUI and gesture logic for the GIL. Frames travel through a
+ring of preallocated slots in shared memory; only slot numbers go over the
+request queue, and only compact landmark arrays come back. If the child
+process dies, or hangs with every slot still waiting for a result past
+INFERENCE_PROCESS_TIMEOUT_SECONDS, it is restarted after an exponentially
+growing delay, and the caller just sees no hands meanwhile. After
+INFERENCE_PROCESS_MAX_RESTARTS failed restarts in a row, inference falls back
+to a tracker in this process.
+"""
+
+import multiprocessing
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+import numpy as np
+from core.config_manager import config
+from helpers.hand_tracker import TrackerResult, draw_hand
+
+_READY = "ready"
+_CONFIGURE = "configure"
+
+
+def _inference_main(shm_name: str, slot_bytes: int, requests, responses, tracker_kwargs: dict):
+    """Child process entry point."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+
+    from helpers.thread_scheduling import configure_process, tune_current_thread
+    from helpers.tracker_backends import create_hand_tracker
+    configure_process()
+    # Before the tracker exists, so MediaPipe's threads inherit the settings
+    tune_current_thread("inference")
+    tracker = create_hand_tracker(**tracker_kwargs)
+    responses.put((_READY,))
+
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            if request[0] == _CONFIGURE:
+                tracker.reconfigure(**request[1])
+                continue
+            seq, slot, shape = request
+            img = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+            _, result = tracker.process_frame(img)
+            del img
+            responses.put((seq, slot, result))
+    finally:
+        tracker.close()
+        shm.close()
+
+
+class RemoteHandTracker:
+    """
+    HandTracker-compatible tracker that runs inference in a child process.
+    """
+
+    # Delay before the first restart, doubled for each further failure in a row
+    RESTART_BACKOFF_SECONDS = 0.5
+    MAX_RESTART_BACKOFF_SECONDS = 30.0
+    # A child that ran this long without failing resets the failure count
+    STABLE_SECONDS = 60.0
+
+    def __init__(self, max_num_hands: int = 1, roi_mode: bool = False, num_slots: Optional[int] = None,
+                 backend: str = "solutions"):
+        """
+        Initialize the tracker. The child process is started lazily on the
+        first frame, once the frame size is known.
+
+        Args:
+            max_num_hands (int): Maximum number of hands to detect.
+            roi_mode (bool): Enable ROI-cropped inference in the child tracker.
+            num_slots (int): Number of shared-memory frame slots. Defaults to the
+                             INFERENCE_PROCESS_SLOTS setting.
+            backend (str): Tracker backend to run in the child process.
+        """
+        self.max_num_hands = max_num_hands
+        self.tracker_kwargs = dict(name=backend, max_num_hands=max_num_hands, roi_mode=roi_mode)
+        self.num_slots = num_slots or config.INFERENCE_PROCESS_SLOTS
+        self.restarts = 0
+        self.fallback = None   # In-process tracker once the child keeps failing
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._shm = None
+        self._slot_bytes = 0
+        self._process = None
+        self._requests = None
+        self._responses = None
+        self._ready = False
+        self._free_slots = deque()
+        self._next_seq = 0
+        self._pending = {}  # seq -> (slot, submission time)
+        self._last_result = TrackerResult.empty()
+        self._failures = 0          # Restarts since the last stable child
+        self._started_at = None
+        self._restart_at = None     # When the next child may be started, while backing off
+
+    @property
+    def ready(self) -> bool:
+        """True once the child has loaded the model and accepts frames."""
+        return self._ready
+
+    def _allocate(self, frame_bytes: int):
+        """(Re)creates the shared-memory ring so every slot fits frame_bytes."""
+        self._stop_process()
+        self._release_shm()
+        self._slot_bytes = frame_bytes
+        self._shm = shared_memory.SharedMemory(create=True, size=frame_bytes * self.num_slots)
+        self._start_process()
+
+    def _start_process(self):
+        self._requests = self._ctx.Queue()
+        self._responses = self._ctx.Queue()
+        self._ready = False
+        self._pending.clear()
+        self._free_slots = deque(range(self.num_slots))
+        self._process = self._ctx.Process(
+            target=_inference_main,
+            args=(self._shm.name, self._slot_bytes, self._requests, self._responses, self.tracker_kwargs),
+            name="hand-inference",
+            daemon=True,
+        )
+        self._process.start()
+        self._started_at = time.perf_counter()
+        self._restart_at = None
+
+    def _restart(self, reason: str):
+        """
+        Stops the child and schedules a new one after the backoff delay, or
+        switches to the in-process fallback once too many restarts failed.
+        """
+        now = time.perf_counter()
+        if self._started_at is not None and now - self._started_at >= self.STABLE_SECONDS:
+            self._failures = 0
+        # The child is dead or hung, so there is no point in a graceful shutdown
+        self._stop_process(graceful=False)
+        self._failures += 1
+        self.restarts += 1
+
+        if self._failures > config.INFERENCE_PROCESS_MAX_RESTARTS:
+            print(f"Inference process {reason} after {config.INFERENCE_PROCESS_MAX_RESTARTS} restarts, "
+                  "running inference in this process instead.")
+            self._release_shm()
+            from helpers.tracker_backends import create_hand_tracker
+            self.fallback = create_hand_tracker(**self.tracker_kwargs)
+            return
+
+        delay = min(self.RESTART_BACKOFF_SECONDS * 2 ** (self._failures - 1), self.MAX_RESTART_BACKOFF_SECONDS)
+        print(f"Inference process {reason}, restarting in {delay:.1f}s...")
+        self._restart_at = now + delay
+
+    def _check_health(self):
+        """Restarts a dead or hung child, and starts a scheduled one once its backoff is over."""
+        if self._process is None:
+            if self._restart_at is not None and time.perf_counter() >= self._restart_at:
+                self._start_process()
+            return
+        if not self._process.is_alive():
+            self._restart("died")
+        elif self._ready and not self._free_slots and self._pending:
+            oldest = min(submitted for _, submitted in self._pending.values())
+            if time.perf_counter() - oldest > config.INFERENCE_PROCESS_TIMEOUT_SECONDS:
+                self._restart("stopped responding")
+
+    def submit(self, img: np.ndarray) -> Optional[int]:
+        """
+        Copies a frame into a free slot and queues it for inference.
+
+        Args:
+            img (np.ndarray): The input image (BGR, uint8).
+
+        Returns:
+            int: Sequence number of the request, or None if the frame was not
+                 queued (process starting up or restarting, or all slots busy).
+        """
+        if self._shm is None or img.nbytes > self._slot_bytes:
+            self._allocate(img.nbytes)
+
+        self.poll()
+        self._check_health()
+        if self._process is None or not self._ready or not self._free_slots:
+            return None
+
+        slot = self._free_slots.popleft()
+        view = np.ndarray(img.shape, dtype=np.uint8, buffer=self._shm.buf, offset=slot * self._slot_bytes)
+        np.copyto(view, img)
+        del view
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._pending[seq] = (slot, time.perf_counter())
+        self._requests.put((seq, slot, img.shape))
+        return seq
+
+    def poll(self, timeout: float = 0.0):
+        """
+        Collects finished results without blocking (or for up to timeout seconds).
+
+        Returns:
+            list: (seq, TrackerResult) tuples in completion order.
+        """
+        finished = []
+        if self._responses is None:
+            return finished
+
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    message = self._responses.get(timeout=remaining)
+                else:
+                    message = self._responses.get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] == _READY:
+                self._ready = True
+                continue
+
+            seq, slot, result = message
+            if self._pending.pop(seq, None) is not None:
+                self._free_slots.append(slot)
+            self._last_result = result
+            finished.append((seq, result))
+            # One result is enough when waiting; drain the rest without blocking
+            deadline = 0.0
+        return finished
+
+    def process_frame(self, img: np.ndarray) -> Tuple[np.ndarray, TrackerResult]:
+        """
+        Runs inference on a frame in the child process and waits for the result.
+
+        While the child is starting or restarting, or if it does not answer
+        within INFERENCE_PROCESS_TIMEOUT_SECONDS, the last known result is
+        returned instead. Once the child has been given up on, inference runs
+        in this process.
+        """
+        if self.fallback is not None:
+            return self.fallback.process_frame(img)
+        seq = self.submit(img)
+        if self.fallback is not None:
+            return self.fallback.process_frame(img)
+        if seq is None:
+            return img, self._last_result if self._ready else TrackerResult.empty()
+
+        deadline = time.perf_counter() + config.INFERENCE_PROCESS_TIMEOUT_SECONDS
+        while time.perf_counter() < deadline:
+            for done_seq, result in self.poll(timeout=0.05):
+                if done_seq == seq:
+                    return img, result
+            if not self._process.is_alive():
+                self._restart("died")
+                return img, TrackerResult.empty()
+        return img, self._last_result
+
+    def reconfigure(self, **settings):
+        """
+        Rebuild the child's MediaPipe graph with changed settings. They are
+        also kept for any later restart of the child.
+        """
+        self.tracker_kwargs.update(settings)
+        if self.fallback is not None:
+            self.fallback.reconfigure(**settings)
+        elif self._process is not None and self._process.is_alive():
+            self._requests.put((_CONFIGURE, settings))
+
+    def draw_landmarks(self, img: np.ndarray, hand_landmarks: np.ndarray, color: Tuple[int, int, int]):
+        draw_hand(img, hand_landmarks, color)
+
+    def _stop_process(self, graceful: bool = True):
+        if self._process is None:
+            return
+        if not graceful:
+            self._process.terminate()
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join(timeout=1.0)
+        elif self._process.is_alive():
+            try:
+                self._requests.put(None)
+            except (OSError, ValueError):
+                pass
+            self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+        self._process = None
+        self._ready = False
+
+    def _release_shm(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def close(self):
+        """Stop the child process and free the shared memory."""
+        self._stop_process()
+        self._release_shm()
+        if self.fallback is not None:
+            self.fallback.close()
@@ -0,0 +1,253 @@
+"""
+Adaptive inference rate.
+
+Hand inference is the most expensive step of a frame. The InferenceScheduler
+decides per frame whether to run it, based on a fixed frame interval and an
+optional CPU budget, and forces it whenever a hand is close to a gesture
+threshold. On the frames in between, the LandmarkPropagator moves the last
+known landmarks forward with optical flow or a constant-velocity model, so
+the cursor keeps updating at the full camera rate.
+"""
+
+import threading
+import cv2
+import numpy as np
+from core.config_manager import config
+from core.metrics import metrics
+from helpers.hand_tracker import TrackerResult
+
+THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP = 4, 8, 12, 16, 20
+WRIST, MIDDLE_MCP = 0, 9
+
+
+def near_gesture_boundary(landmarks: np.ndarray, img_w: int, img_h: int) -> bool:
+    """
+    Checks whether any hand is close to flipping a pinch or fist detector.
+
+    Mirrors the ratios used in helpers.detectors, vectorized over all hands.
+
+    Args:
+        landmarks (np.ndarray): Normalized landmarks, shape (hands, 21, 3).
+        img_w (int): Frame width in pixels.
+        img_h (int): Frame height in pixels.
+
+    Returns:
+        bool: True if any ratio is within INFERENCE_BOUNDARY_MARGIN of its threshold.
+    """
+    if len(landmarks) == 0:
+        return False
+
+    pts = landmarks[..., :2] * (img_w, img_h)
+    palm = np.maximum(np.linalg.norm(pts[:, MIDDLE_MCP] - pts[:, WRIST], axis=1), 1.0)
+
+    # Thumb pinches: left click, right click, mic toggle (ring)
+    pinch = np.linalg.norm(pts[:, [INDEX_TIP, MIDDLE_TIP, RING_TIP]] - pts[:, [THUMB_TIP]], axis=2)
+    pinch_thresholds = np.array([
+        config.LEFT_CLICK_DISTANCE_RATIO,
+        config.RIGHT_CLICK_DISTANCE_RATIO,
+        config.MIC_TOGGLE_DISTANCE_RATIO,
+    ])
+
+    # Fingertip-to-wrist curl used by the fist detector
+    curl = np.linalg.norm(pts[:, [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]] - pts[:, [WRIST]], axis=2)
+    curl_thresholds = np.full(4, config.FIST_CURL_RATIO)
+
+    ratios = np.concatenate([pinch, curl], axis=1) / palm[:, None]
+    thresholds = np.concatenate([pinch_thresholds, curl_thresholds])
+    margin = config.INFERENCE_BOUNDARY_MARGIN * thresholds
+    return bool(np.any(np.abs(ratios - thresholds) < margin))
+
+
+class InferenceScheduler:
+    """
+    Decides on every frame whether to run hand inference.
+    """
+
+    # Weight of the newest sample in the inference cost average
+    COST_BLEND = 0.2
+
+    def __init__(self):
+        self.cost_ms = 0.0
+        self.inferred_frames = 0
+        self.propagated_frames = 0
+        self.forced_frames = 0
+        # Lower bound on the frame interval, raised while idle to save power
+        self.min_interval_frames = 1
+        self._frames_since_inference = 0
+        self._credit_ms = 0.0
+        self._pending_min_interval = None  # Set from the capture thread, applied by should_infer()
+        self._lock = threading.Lock()
+
+    def request_min_interval(self, frames: int):
+        """
+        Changes the lower bound on the frame interval from any thread. It takes
+        effect on the next should_infer() call, on the inference thread.
+        """
+        with self._lock:
+            self._pending_min_interval = frames
+
+    def should_infer(self, last_result, img_w: int, img_h: int) -> bool:
+        """
+        Args:
+            last_result (TrackerResult): The latest known hands, or None.
+            img_w (int): Frame width in pixels.
+            img_h (int): Frame height in pixels.
+
+        Returns:
+            bool: True to run inference on this frame, False to propagate.
+        """
+        with self._lock:
+            pending, self._pending_min_interval = self._pending_min_interval, None
+        if pending is not None:
+            self.min_interval_frames = pending
+
+        self._frames_since_inference += 1
+        budget_ms = config.INFERENCE_CPU_BUDGET_MS
+        if budget_ms > 0:
+            # Token bucket: every frame earns the budget, every inference spends its cost
+            self._credit_ms = min(self._credit_ms + budget_ms, 2.0 * max(self.cost_ms, budget_ms))
+
+        interval = max(config.INFERENCE_INTERVAL_FRAMES, self.min_interval_frames)
+        if last_result is None or self._frames_since_inference >= interval:
+            return True
+        if budget_ms > 0 and self.min_interval_frames <= 1 and self._credit_ms >= self.cost_ms:
+            return True
+        if near_gesture_boundary(last_result.landmarks, img_w, img_h):
+            self.forced_frames += 1
+            return True
+
+        self.propagated_frames += 1
+        metrics.inc("inference.skipped_propagated")
+        return False
+
+    def may_skip_next(self) -> bool:
+        """
+        False when the next frame is certain to run inference, i.e. with an
+        interval of one frame and no CPU budget. The propagator then has no
+        use for the current frame.
+        """
+        interval = max(config.INFERENCE_INTERVAL_FRAMES, self.min_interval_frames)
+        return interval > 1 or config.INFERENCE_CPU_BUDGET_MS > 0
+
+    def record_inference(self, cost_ms: float):
+        """Registers that inference ran and how long it took."""
+        self.inferred_frames += 1
+        metrics.inc("inference.runs")
+        self._frames_since_inference = 0
+        self._credit_ms -= cost_ms
+        if self.cost_ms == 0.0:
+            self.cost_ms = cost_ms
+        else:
+            self.cost_ms += self.COST_BLEND * (cost_ms - self.cost_ms)
+
+
+class LandmarkPropagator:
+    """
+    Produces landmarks for frames where inference was skipped.
+    """
+
+    LK_PARAMS = dict(
+        winSize=(21, 21),
+        maxLevel=3,
+        criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03),
+    )
+
+    def __init__(self):
+        self._last = None        # Latest TrackerResult, inferred or propagated
+        self._last_time = None
+        self._velocity = None    # (hands, 21, 3) normalized units per second
+        self._keyframe = None    # Latest inferred TrackerResult
+        self._keyframe_time = None
+        self._prev_gray = None   # Green channel of the last frame, for optical flow
+        self._spare_gray = None  # Second buffer, swapped with _prev_gray after each flow step
+
+    @property
+    def last_result(self):
+        return self._last
+
+    def observe(self, result: TrackerResult, timestamp: float, img: np.ndarray, keep_frame: bool = True):
+        """
+        Stores an inferred result as the new reference.
+
+        Args:
+            keep_frame (bool): Keep the frame for optical flow. Pass False when
+                               the next frame will run inference anyway
+                               (InferenceScheduler.may_skip_next()).
+        """
+        if self._keyframe is not None and timestamp > self._keyframe_time:
+            self._velocity = self._estimate_velocity(
+                self._keyframe.landmarks, result.landmarks, timestamp - self._keyframe_time
+            )
+        else:
+            self._velocity = None
+
+        self._keyframe = result
+        self._keyframe_time = timestamp
+        self._last = result
+        self._last_time = timestamp
+        if keep_frame and config.INFERENCE_PROPAGATION == "flow":
+            self._prev_gray = self._gray(img, self._prev_gray)
+        elif self._prev_gray is not None:
+            # Keep the buffer for reuse, but it no longer matches the last result
+            self._spare_gray, self._prev_gray = self._prev_gray, None
+
+    def propagate(self, timestamp: float, img: np.ndarray) -> TrackerResult:
+        """Moves the last known landmarks forward to this frame."""
+        if self._last is None:
+            return TrackerResult.empty()
+        if len(self._last.landmarks) == 0:
+            return self._last
+
+        landmarks = self._extrapolate(timestamp)
+        if config.INFERENCE_PROPAGATION == "flow" and self._prev_gray is not None:
+            gray = self._gray(img, self._spare_gray)
+            landmarks = self._flow(gray, landmarks, img.shape[1], img.shape[0])
+            self._spare_gray, self._prev_gray = self._prev_gray, gray
+
+        self._last = self._last._replace(landmarks=landmarks)
+        self._last_time = timestamp
+        return self._last
+
+    def _extrapolate(self, timestamp: float) -> np.ndarray:
+        if config.INFERENCE_PROPAGATION == "hold" or self._velocity is None:
+            return self._last.landmarks.copy()
+        return (self._last.landmarks + self._velocity * (timestamp - self._last_time)).astype(np.float32)
+
+    def _flow(self, gray: np.ndarray, predicted: np.ndarray, img_w: int, img_h: int) -> np.ndarray:
+        """Tracks every landmark with pyramidal Lucas-Kanade, keeping predictions where tracking fails."""
+        scale = np.array([img_w, img_h], dtype=np.float32)
+        prev_pts = (self._last.landmarks[..., :2] * scale).reshape(-1, 1, 2).astype(np.float32)
+        guess = (predicted[..., :2] * scale).reshape(-1, 1, 2).astype(np.float32)
+
+        next_pts, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, prev_pts, guess.copy(),
+            flags=cv2.OPTFLOW_USE_INITIAL_FLOW, **self.LK_PARAMS
+        )
+        if next_pts is None:
+            return predicted
+
+        ok = status.reshape(-1).astype(bool)
+        tracked = np.where(ok[:, None], next_pts.reshape(-1, 2), guess.reshape(-1, 2))
+        result = predicted.copy()
+        result[..., :2] = (tracked / scale).reshape(predicted.shape[0], -1, 2)
+        return result
+
+    @staticmethod
+    def _estimate_velocity(prev: np.ndarray, curr: np.ndarray, dt: float):
+        """Per-landmark velocity, pairing hands by nearest wrist."""
+        if len(prev) == 0 or len(curr) == 0:
+            return None
+        wrist_dist = np.linalg.norm(curr[:, None, WRIST, :2] - prev[None, :, WRIST, :2], axis=2)
+        nearest = wrist_dist.argmin(axis=1)
+        return ((curr - prev[nearest]) / dt).astype(np.float32)
+
+    @staticmethod
+    def _gray(img: np.ndarray, out) -> np.ndarray:
+        """
+        Copies the green channel into out, reallocating it only when the frame
+        size changed. Green tracks luminance closely enough for optical flow
+        and is a plain copy, leaving inference the only color conversion.
+        """
+        if out is None or out.shape != img.shape[:2]:
+            out = np.empty(img.shape[:2], dtype=np.uint8)
+        return cv2.extractChannel(img, 1, dst=out)
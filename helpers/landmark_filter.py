@@ -0,0 +1,93 @@
+"""
+Temporal landmark filtering.
+
+Applies a One Euro filter to every coordinate of every landmark at once, so
+that jitter around pinch thresholds is removed before any detector sees the
+hand. The filter adapts its cutoff to landmark speed: still landmarks are
+smoothed heavily, fast-moving ones pass through with little lag.
+"""
+
+import math
+from typing import Dict, List
+import numpy as np
+from core.config_manager import config
+
+
+class LandmarkFilter:
+    """
+    Vectorized One Euro filter over a (hands, 21, 3) landmark array.
+
+    Filter state is kept per persistent hand ID, so hands can appear, vanish
+    and change detection order without corrupting each other's history.
+    """
+
+    # Cutoff (Hz) used for the speed estimate itself, as in the One Euro paper
+    DERIVATIVE_CUTOFF = 1.0
+    # History older than this (seconds) is dropped rather than blended in
+    STALE_SECONDS = 0.5
+
+    def __init__(self):
+        self._values: Dict[int, np.ndarray] = {}
+        self._speeds: Dict[int, np.ndarray] = {}
+        self._times: Dict[int, float] = {}
+
+    def reset(self):
+        """Drop all filter history."""
+        self._values.clear()
+        self._speeds.clear()
+        self._times.clear()
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def apply(self, landmarks: np.ndarray, hand_ids: List[int], timestamp: float) -> np.ndarray:
+        """
+        Filters one frame of landmarks.
+
+        Args:
+            landmarks (np.ndarray): Raw normalized landmarks, shape (hands, 21, 3).
+            hand_ids (List[int]): Persistent ID of each hand, in array order.
+            timestamp (float): Frame time in seconds.
+
+        Returns:
+            np.ndarray: Filtered landmarks with the same shape as the input.
+        """
+        strength = config.LANDMARK_FILTER_STRENGTH
+        self._forget_stale(timestamp)
+        if strength <= 0 or len(landmarks) == 0:
+            return landmarks
+
+        # Gather previous state for every hand, seeding new hands with the raw frame
+        prev_values = np.stack([self._values.get(i, landmarks[n]) for n, i in enumerate(hand_ids)])
+        prev_speeds = np.stack([
+            self._speeds.get(i, np.zeros_like(landmarks[n])) for n, i in enumerate(hand_ids)
+        ])
+        dt = np.array([
+            max(timestamp - self._times.get(i, timestamp), 1e-3) for i in hand_ids
+        ])[:, None, None]
+
+        # Smoothed speed of each coordinate
+        raw_speed = (landmarks - prev_values) / dt
+        speed = prev_speeds + self._alpha(self.DERIVATIVE_CUTOFF, dt) * (raw_speed - prev_speeds)
+
+        # Cutoff rises with the speed of each landmark (norm over x, y, z)
+        min_cutoff = 0.5 / strength
+        cutoff = min_cutoff + config.LANDMARK_FILTER_BETA * np.linalg.norm(speed, axis=2, keepdims=True)
+        filtered = prev_values + self._alpha(cutoff, dt) * (landmarks - prev_values)
+        filtered = filtered.astype(landmarks.dtype, copy=False)
+
+        for n, hand_id in enumerate(hand_ids):
+            self._values[hand_id] = filtered[n]
+            self._speeds[hand_id] = speed[n]
+            self._times[hand_id] = timestamp
+        return filtered
+
+    def _forget_stale(self, timestamp: float):
+        """Drop state for hands that have not been seen recently."""
+        for hand_id, last_seen in list(self._times.items()):
+            if timestamp - last_seen > self.STALE_SECONDS:
+                del self._values[hand_id]
+                del self._speeds[hand_id]
+                del self._times[hand_id]
@@ -0,0 +1,96 @@
+"""
+Motion- and duplicate-gated inference.
+
+Compares a tiny grayscale thumbnail of every frame with the previous frame
+and with the frame hand detection last ran on. Hand detection is skipped on
+frames that are exact repeats (a driver delivering the same buffer twice),
+and on frames of an empty scene that has not changed since it was last
+searched. Any motion resumes inference on the same frame. While hands are
+tracked, at most MAX_SKIP_WITH_HANDS frames in a row are skipped, so a small
+pinch is never held back by a stale result.
+"""
+
+import cv2
+import numpy as np
+from core.config_manager import config
+from core.metrics import metrics
+
+
+class MotionGate:
+    """
+    Decides whether a frame can reuse the previous hand detection.
+    """
+
+    # Thumbnail size; small enough that diffing costs microseconds
+    THUMB_SIZE = (64, 36)
+    # Consecutive repeats skipped while hands are tracked; fingertip moves are tiny in the thumbnail
+    MAX_SKIP_WITH_HANDS = 1
+
+    DUPLICATE = "duplicate"
+    STATIC = "static"
+
+    def __init__(self):
+        self.checked_frames = 0
+        self.skipped_duplicate = 0
+        self.skipped_static = 0
+        self._previous = None    # Thumbnail of the previous frame
+        self._reference = None   # Thumbnail of the last frame that was not skipped
+        self._skipped_in_row = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of checked frames that skipped inference."""
+        if self.checked_frames == 0:
+            return 0.0
+        return (self.skipped_duplicate + self.skipped_static) / self.checked_frames
+
+    def check(self, img: np.ndarray, last_result):
+        """
+        Args:
+            img (np.ndarray): The input frame (BGR).
+            last_result (TrackerResult): The latest known hands, or None.
+
+        Returns:
+            str: DUPLICATE or STATIC if inference can be skipped, None otherwise.
+        """
+        if not config.MOTION_GATE_ENABLED:
+            return None
+
+        thumb = self._thumbnail(img)
+        previous, self._previous = self._previous, thumb
+        self.checked_frames += 1
+
+        reason = None
+        hands_tracked = last_result is not None and len(last_result.landmarks) > 0
+        max_skip = self.MAX_SKIP_WITH_HANDS if hands_tracked else config.MOTION_GATE_MAX_SKIP_FRAMES
+        if last_result is not None and self._skipped_in_row < max_skip:
+            # Sensor noise makes real frames differ somewhere, so only identical ones are repeats
+            if previous is not None and previous.shape == thumb.shape and \
+                    cv2.absdiff(previous, thumb).max() == 0:
+                reason = self.DUPLICATE
+            elif not hands_tracked and not self._moved(thumb):
+                reason = self.STATIC
+
+        if reason is None:
+            self._reference = thumb
+            self._skipped_in_row = 0
+        else:
+            self._skipped_in_row += 1
+            if reason == self.DUPLICATE:
+                self.skipped_duplicate += 1
+            else:
+                self.skipped_static += 1
+            metrics.inc(f"inference.skipped_{reason}")
+        metrics.set_gauge("inference.skip_ratio", self.skip_ratio)
+        return reason
+
+    def _moved(self, thumb: np.ndarray) -> bool:
+        """True if enough of the thumbnail changed since the last searched frame."""
+        if self._reference is None or self._reference.shape != thumb.shape:
+            return True
+        changed = cv2.absdiff(self._reference, thumb) > config.MOTION_GATE_PIXEL_THRESHOLD
+        return changed.mean() >= config.MOTION_GATE_AREA_RATIO
+
+    def _thumbnail(self, img: np.ndarray) -> np.ndarray:
+        small = cv2.resize(img, self.THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
@@ -6,9 +6,12 @@ and clicking, based on coordinates provided by the tracking system.
 """
 
 import ctypes
+import sys
 import numpy as np
 from pynput.mouse import Button, Controller
 from core.config_manager import config
+from core.metrics import metrics
+from core.tracing import tracer
 
 class MouseController:
     """
@@ -30,6 +33,16 @@ class MouseController:
         self.left_pressed = False
         self.right_pressed = False
 
+        # Windows accepts wheel deltas in 1/120 notch units (WHEEL_DELTA),
+        # other platforms only emit whole notches.
+        self.scroll_resolution = 1.0 / 120.0 if sys.platform == "win32" else 1.0
+
+    @staticmethod
+    def _injected(name: str):
+        """Counts an injected mouse event and marks it in the trace."""
+        metrics.inc("input.mouse_events")
+        tracer.instant(name, "mouse")
+
     def move_to(self, location: np.ndarray, cam_width: int = 1280, cam_height: int = 720):
         """
         Moves the mouse cursor to a mapped position on the screen.
@@ -51,6 +64,7 @@ class MouseController:
         target_y = location[1] * self.screen_height * speed / cam_height
         
         self.mouse.position = (target_x, target_y)
+        self._injected("mouse.move")
 
     def click(self):
         """
@@ -58,6 +72,7 @@ class MouseController:
         """
         if not self.pressed:
             self.mouse.press(Button.left)
+            self._injected("mouse.left_press")
             self.pressed = True
             # print("Click")
 
@@ -67,6 +82,7 @@ class MouseController:
         """
         if self.pressed:
             self.mouse.release(Button.left)
+            self._injected("mouse.left_release")
             self.pressed = False
             # print("Unclick")
 
@@ -76,6 +92,7 @@ class MouseController:
         """
         if not self.left_pressed:
             self.mouse.press(Button.left)
+            self._injected("mouse.left_press")
             self.left_pressed = True
 
     def leftRelease(self):
@@ -84,6 +101,7 @@ class MouseController:
         """
         if self.left_pressed:
             self.mouse.release(Button.left)
+            self._injected("mouse.left_release")
             self.left_pressed = False
 
     def rightClick(self):
@@ -92,6 +110,7 @@ class MouseController:
         """
         if not self.right_pressed:
             self.mouse.press(Button.right)
+            self._injected("mouse.right_press")
             self.right_pressed = True
 
     def rightRelease(self):
@@ -100,15 +119,23 @@ class MouseController:
         """
         if self.right_pressed:
             self.mouse.release(Button.right)
+            self._injected("mouse.right_release")
             self.right_pressed = False
 
-    def scroll(self, dx: int, dy: int):
+    def scroll(self, dx: float, dy: float):
         """
         Scrolls the mouse wheel vertically and/or horizontally.
 
+        Fractional notches are passed through on platforms that support
+        high-resolution wheel events and truncated elsewhere.
+
         Args:
-            dx (int): Positive to scroll right, negative to scroll left.
-            dy (int): Positive to scroll up, negative to scroll down.
-        """
-        self.mouse.scroll(int(dx), int(dy))
+            dx (float): Positive to scroll right, negative to scroll left.
+            dy (float): Positive to scroll up, negative to scroll down.
+        """
+        self._injected("mouse.scroll")
+        if self.scroll_resolution < 1.0:
+            self.mouse.scroll(dx, dy)
+        else:
+            self.mouse.scroll(int(dx), int(dy))
 
@@ -0,0 +1,103 @@
+"""
+Idle power saving.
+
+When no hand has been seen for POWER_IDLE_TIMEOUT_SECONDS, the camera is
+stepped down to a lower resolution and frame rate and hand detection runs
+less often. The first detected hand steps everything back up. The time from
+that detection to the first full-resolution frame is measured; if the camera
+takes longer than POWER_MAX_WAKE_MS to switch, later idle periods keep the
+full resolution and only lower the frame and inference rates.
+"""
+
+import threading
+import time
+from typing import Optional, Tuple
+from core.config_manager import config
+from core.metrics import metrics
+
+
+class PowerManager:
+    """
+    Tracks hand presence and decides the capture and inference rates.
+    """
+
+    ACTIVE = "active"
+    IDLE = "idle"
+
+    def __init__(self):
+        self.state = self.ACTIVE
+        self.resolution_switching = True
+        self.last_wake_ms = None
+        self._last_hand_time = None
+        self._wake_started = None
+        self._pending = None  # State whose capture mode has not been applied yet
+        self._lock = threading.Lock()
+
+    def update(self, hands_present: bool, timestamp: float):
+        """
+        Feeds one evaluated frame.
+
+        Args:
+            hands_present (bool): Whether any hand was found in the frame.
+            timestamp (float): Capture time of the frame in seconds.
+        """
+        if self._last_hand_time is None or hands_present:
+            self._last_hand_time = timestamp
+
+        if self.state == self.IDLE and (hands_present or not config.POWER_SAVING_ENABLED):
+            with self._lock:
+                self.state = self.ACTIVE
+                self._pending = self.ACTIVE
+                self._wake_started = time.perf_counter()
+        elif (self.state == self.ACTIVE and config.POWER_SAVING_ENABLED
+                and timestamp - self._last_hand_time >= config.POWER_IDLE_TIMEOUT_SECONDS):
+            print(f"No hands for {config.POWER_IDLE_TIMEOUT_SECONDS}s, entering power saving mode.")
+            with self._lock:
+                self.state = self.IDLE
+                self._pending = self.IDLE
+
+    def take_pending_change(self) -> bool:
+        """True once after every state change, when the capture mode must be switched."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+        return pending is not None
+
+    def capture_mode(self, base_size: Optional[Tuple[int, int]] = None,
+                     scale: float = 1.0) -> Tuple[int, int, float]:
+        """
+        Args:
+            base_size (tuple): Full (width, height), normally the mode the camera
+                               negotiated at startup. Defaults to the configured size.
+            scale (float): Fraction of the full resolution to use outside of
+                           power saving.
+
+        Returns:
+            tuple: The (width, height, fps) for the current state.
+        """
+        base_width, base_height = base_size or (config.CAMERA_WIDTH, config.CAMERA_HEIGHT)
+        width = int(base_width * scale)
+        height = int(base_height * scale)
+        if self.state == self.IDLE:
+            if self.resolution_switching:
+                return config.POWER_IDLE_WIDTH, config.POWER_IDLE_HEIGHT, config.POWER_IDLE_FPS
+            return width, height, config.POWER_IDLE_FPS
+        return width, height, config.CAMERA_FPS
+
+    @property
+    def inference_interval(self) -> int:
+        """Minimum number of frames between hand detections in the current state."""
+        return config.POWER_IDLE_INFERENCE_INTERVAL if self.state == self.IDLE else 1
+
+    def frame_captured(self):
+        """Called for every captured frame; completes a pending wake measurement."""
+        if self._wake_started is None or self._pending is not None:
+            return
+
+        wake_ms = (time.perf_counter() - self._wake_started) * 1000.0
+        self._wake_started = None
+        self.last_wake_ms = wake_ms
+        metrics.observe("power.wake_ms", wake_ms)
+
+        if wake_ms > config.POWER_MAX_WAKE_MS and self.resolution_switching:
+            self.resolution_switching = False
+            print(f"Camera took {wake_ms:.0f} ms to wake up, keeping full resolution while idle.")
@@ -0,0 +1,152 @@
+"""
+Closed-loop quality control.
+
+Watches the end-to-end latency of every frame and moves along a ladder of
+quality levels to hold QUALITY_TARGET_FPS on the current machine. Each step
+down trades some tracking quality for speed: first the lighter hand model,
+then a lower tracking confidence (so the palm detector reruns less often),
+then smaller capture resolutions. When the load goes away (a video call
+ends, for example) the controller steps back up. Every failed attempt to
+step up doubles how long it waits before trying that level again, so it does
+not oscillate on a machine that sits right at the edge.
+"""
+
+import threading
+from typing import NamedTuple, Optional
+from core.config_manager import config
+from core.metrics import metrics
+
+
+class QualityLevel(NamedTuple):
+    resolution_scale: float        # Fraction of CAMERA_WIDTH / CAMERA_HEIGHT
+    model_complexity: int          # MediaPipe Hands model: 1 = full, 0 = lite
+    min_tracking_confidence: float
+
+
+class QualityController:
+    """
+    Picks the quality level from measured frame latency.
+    """
+
+    LEVELS = (
+        QualityLevel(1.0, 1, 0.5),
+        QualityLevel(1.0, 0, 0.5),
+        QualityLevel(1.0, 0, 0.3),
+        QualityLevel(0.75, 0, 0.3),
+        QualityLevel(0.5, 0, 0.3),
+    )
+
+    # Weight of the newest sample in the latency average
+    LATENCY_BLEND = 0.1
+    # Degrade above this fraction of the frame budget, recover below the lower one
+    DEGRADE_LOAD = 0.9
+    RECOVER_LOAD = 0.6
+    # Longest wait before retrying a level that could not be held
+    MAX_RECOVER_SECONDS = 300.0
+
+    def __init__(self):
+        self.level = 0
+        self.latency_ms = 0.0
+        self._over_since = None
+        self._under_since = None
+        self._changed_at = None
+        self._stepped_up = False
+        self._recover_seconds = {}   # level -> current wait before stepping up to it
+        self._pending_resolution = False
+        self._pending_tracker = False
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> QualityLevel:
+        return self.LEVELS[self.level]
+
+    def observe(self, latency_ms: float, timestamp: float):
+        """
+        Feeds the end-to-end latency of one frame.
+
+        Args:
+            latency_ms (float): Capture-to-render time of the frame.
+            timestamp (float): Capture time of the frame in seconds.
+        """
+        if not config.QUALITY_CONTROL_ENABLED:
+            if self.level != 0:
+                self._set_level(0, timestamp)
+            return
+
+        if self.latency_ms == 0.0:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += self.LATENCY_BLEND * (latency_ms - self.latency_ms)
+        metrics.set_gauge("quality.latency_ms", self.latency_ms)
+
+        # Let the average settle after every change before judging the new level
+        if self._changed_at is not None and timestamp - self._changed_at < config.QUALITY_SETTLE_SECONDS:
+            return
+
+        budget_ms = 1000.0 / config.QUALITY_TARGET_FPS
+        if self.latency_ms > self.DEGRADE_LOAD * budget_ms:
+            self._under_since = None
+            if self._over_since is None:
+                self._over_since = timestamp
+            if timestamp - self._over_since >= config.QUALITY_DEGRADE_SECONDS and self.level < len(self.LEVELS) - 1:
+                self._degrade(timestamp)
+        elif self.latency_ms < self.RECOVER_LOAD * budget_ms:
+            self._over_since = None
+            if self._under_since is None:
+                self._under_since = timestamp
+            target = self.level - 1
+            wait = self._recover_seconds.get(target, config.QUALITY_RECOVER_SECONDS)
+            if target >= 0 and timestamp - self._under_since >= wait:
+                self._set_level(target, timestamp)
+        else:
+            self._over_since = None
+            self._under_since = None
+
+    def _degrade(self, timestamp: float):
+        # Stepping down soon after stepping up means the level above can't be held
+        if self._changed_at is not None and self._stepped_up:
+            wait = self._recover_seconds.get(self.level, config.QUALITY_RECOVER_SECONDS)
+            if timestamp - self._changed_at < 2.0 * wait:
+                self._recover_seconds[self.level] = min(2.0 * wait, self.MAX_RECOVER_SECONDS)
+        self._set_level(self.level + 1, timestamp)
+
+    def _set_level(self, level: int, timestamp: float):
+        previous = self.current
+        self._stepped_up = level < self.level
+        self.level = level
+        self._changed_at = timestamp
+        self._over_since = None
+        self._under_since = None
+
+        with self._lock:
+            if self.current.resolution_scale != previous.resolution_scale:
+                self._pending_resolution = True
+            if (self.current.model_complexity, self.current.min_tracking_confidence) != \
+                    (previous.model_complexity, previous.min_tracking_confidence):
+                self._pending_tracker = True
+
+        metrics.set_gauge("quality.level", level)
+        metrics.inc("quality.changes")
+        print(f"Quality level {level}: {self.latency_ms:.0f} ms per frame "
+              f"(target {1000.0 / config.QUALITY_TARGET_FPS:.0f} ms)")
+
+    def take_pending_resolution(self) -> bool:
+        """True once after the capture resolution of the level changed."""
+        with self._lock:
+            pending, self._pending_resolution = self._pending_resolution, False
+        return pending
+
+    def take_pending_tracker_settings(self) -> Optional[dict]:
+        """
+        Returns:
+            dict: HandTracker.reconfigure() arguments, once after they changed,
+                  otherwise None.
+        """
+        with self._lock:
+            pending, self._pending_tracker = self._pending_tracker, False
+        if not pending:
+            return None
+        return dict(
+            model_complexity=self.current.model_complexity,
+            min_tracking_confidence=self.current.min_tracking_confidence,
+        )
@@ -0,0 +1,170 @@
+"""
+Smooth scrolling module.
+
+The ScrollEngine decouples wheel output from the camera frame rate: gesture
+code pushes fractional wheel deltas whenever a frame arrives, and a dedicated
+thread spreads them out into high-resolution wheel events at a fixed rate,
+optionally coasting with inertia after the scroll gesture ends.
+"""
+
+import math
+import threading
+import time
+import numpy as np
+from core.config_manager import config
+from core.metrics import metrics
+from helpers.thread_scheduling import tune_current_thread
+
+
+class ScrollEngine:
+    """
+    Emits smoothed, high-resolution scroll events from its own thread.
+    """
+
+    # Fraction of the measured speed blended in per tick when estimating velocity
+    VELOCITY_BLEND = 0.3
+
+    def __init__(self, mouse):
+        """
+        Initialize the ScrollEngine and start its output thread.
+
+        Args:
+            mouse (MouseController): Controller used to emit wheel events.
+        """
+        self.mouse = mouse
+        self.resolution = getattr(mouse, "scroll_resolution", 1.0)
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending = np.zeros(2)    # Wheel notches (dx, dy) not yet emitted
+        self._velocity = np.zeros(2)   # Notches per second, used for inertia
+        self._remainder = np.zeros(2)  # Leftover below the wheel resolution
+        self._pending_since = None     # perf_counter() of the oldest push not yet emitted
+        self._engaged = False
+        self._coasting = False
+        self._running = True
+
+        self._thread = threading.Thread(target=self._run, name="scroll-engine", daemon=True)
+        self._thread.start()
+
+    def engage(self):
+        """Start a scroll gesture, cancelling any inertia and deltas left from the last one."""
+        with self._lock:
+            self._engaged = True
+            self._coasting = False
+            self._pending[:] = 0.0
+            self._pending_since = None
+            self._velocity[:] = 0.0
+            self._remainder[:] = 0.0
+        self._wake.set()
+
+    def push(self, dx: float, dy: float):
+        """
+        Queue a fractional wheel delta for emission.
+
+        Args:
+            dx (float): Horizontal notches, positive to scroll right.
+            dy (float): Vertical notches, positive to scroll up.
+        """
+        with self._lock:
+            self._pending[0] += dx
+            self._pending[1] += dy
+            if self._pending_since is None:
+                self._pending_since = time.perf_counter()
+        self._wake.set()
+
+    def release(self, inertia=None):
+        """
+        End the scroll gesture.
+
+        Args:
+            inertia (bool): Keep scrolling with decaying speed. Defaults to the
+                            SCROLL_INERTIA_ENABLED setting.
+        """
+        if inertia is None:
+            inertia = config.SCROLL_INERTIA_ENABLED
+        with self._lock:
+            self._engaged = False
+            speed = float(np.hypot(*self._velocity))
+            self._coasting = bool(inertia) and speed > config.SCROLL_INERTIA_MIN_SPEED
+            if not self._coasting:
+                self._velocity[:] = 0.0
+        self._wake.set()
+
+    def stop(self):
+        """Immediately stop all scrolling and drop anything not yet emitted."""
+        with self._lock:
+            self._engaged = False
+            self._coasting = False
+            self._pending[:] = 0.0
+            self._velocity[:] = 0.0
+            self._remainder[:] = 0.0
+            self._pending_since = None
+
+    def close(self):
+        """Stop the output thread."""
+        self.stop()
+        self._running = False
+        self._wake.set()
+        self._thread.join(timeout=1.0)
+
+    def _is_active(self) -> bool:
+        with self._lock:
+            return (
+                self._engaged
+                or self._coasting
+                or bool(np.any(np.abs(self._pending) >= self.resolution))
+            )
+
+    def _run(self):
+        tune_current_thread("actuator")
+        last_tick = time.perf_counter()
+        while self._running:
+            if not self._is_active():
+                self._wake.wait()
+                self._wake.clear()
+                last_tick = time.perf_counter()
+                continue
+
+            time.sleep(1.0 / config.SCROLL_ENGINE_RATE_HZ)
+            now = time.perf_counter()
+            dt = now - last_tick
+            last_tick = now
+
+            with self._lock:
+                step = self._tick(dt)
+                dx, dy = self._quantize(step)
+                pushed_at = self._pending_since if dx or dy else None
+                if pushed_at is not None:
+                    self._pending_since = None
+
+            if dx or dy:
+                self.mouse.scroll(dx, dy)
+                if pushed_at is not None:
+                    metrics.observe("actuator.scroll.queue_ms", (time.perf_counter() - pushed_at) * 1000.0)
+
+    def _tick(self, dt: float) -> np.ndarray:
+        """Returns the wheel delta to emit for a tick of length dt (lock held)."""
+        if self._coasting:
+            step = self._velocity * dt
+            self._velocity *= math.exp(-config.SCROLL_INERTIA_FRICTION * dt)
+            if np.hypot(*self._velocity) < config.SCROLL_INERTIA_MIN_SPEED:
+                self._coasting = False
+                self._velocity[:] = 0.0
+            return step
+
+        smoothing = config.SCROLL_SMOOTHING_SECONDS
+        fraction = 1.0 - math.exp(-dt / smoothing) if smoothing > 0 else 1.0
+        step = self._pending * fraction
+        self._pending -= step
+
+        if self._engaged and dt > 0:
+            self._velocity += self.VELOCITY_BLEND * (step / dt - self._velocity)
+        return step
+
+    def _quantize(self, step: np.ndarray):
+        """Rounds a delta down to the wheel resolution, keeping the remainder (lock held)."""
+        total = self._remainder + step
+        quantized = np.trunc(total / self.resolution) * self.resolution
+        self._remainder = total - quantized
+        return float(quantized[0]), float(quantized[1])
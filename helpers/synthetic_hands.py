@@ -0,0 +1,383 @@
+"""
+Synthetic hand landmark streams.
+
+Generates (frames, hands, 21, 3) landmark arrays in the same layout and
+coordinate system as the tracker output (normalized image x and y, relative
+depth z, plus metric world landmarks), so detectors, conditions and the
+identity tracker can be exercised at scale without a camera or recordings.
+
+Each hand follows a script of named poses (see POSES). It holds each pose
+for a while and moves to the next with a minimum-jerk transition of a
+human-like duration, while the wrist drifts and rotates slightly. On top of
+the geometry come landmark noise, tracker handedness flips, and camera-like
+frame timing (interval jitter and dropped frames).
+
+    stream = SyntheticHandStream([SyntheticHand("Right"), SyntheticHand("Left", position=(0.3, 0.6))])
+    timestamps, results = stream.generate(3000)
+
+SyntheticHandTracker serves a stream as a tracker backend, following the
+app's clock. It is not a TRACKER_BACKEND choice, since the scripted poses
+move and click the real mouse; pass it in from code:
+
+    clock = VirtualClock()
+    app = HandyMouseApp(camera, clock, tracker=SyntheticHandTracker(2, clock=clock))
+"""
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from core.clock import MonotonicClock
+from helpers.hand_tracker import NUM_LANDMARKS, TrackerBackend, TrackerResult
+
+# Local hand model: a right hand, palm towards the camera, wrist at the origin,
+# y up, in units of palm size (wrist to middle finger MCP). z < 0 is towards the camera.
+WRIST = 0
+THUMB_CMC = np.array([-0.3, 0.25, 0.0])
+THUMB_OPEN_TIP = np.array([-0.95, 0.8, -0.05])
+THUMB_FIST_TIP = np.array([0.05, 0.38, -0.3])  # Across the curled fingers, below the fingertips
+THUMB_LENGTH = 0.9  # CMC to tip along the bones
+
+FINGERS = ("index", "middle", "ring", "pinky")
+
+
+class FingerGeometry(NamedTuple):
+    mcp_index: int              # Landmark index of the MCP joint; the next three are PIP, DIP, tip
+    mcp: Tuple[float, float]    # MCP position in the local model
+    splay_deg: float            # Direction of the extended finger, from straight up towards +x
+    lengths: Tuple[float, float, float]
+
+
+FINGER_GEOMETRY = (
+    FingerGeometry(5, (-0.3, 0.95), -8.0, (0.45, 0.28, 0.22)),
+    FingerGeometry(9, (0.0, 1.0), 0.0, (0.5, 0.32, 0.24)),
+    FingerGeometry(13, (0.28, 0.92), 7.0, (0.46, 0.3, 0.22)),
+    FingerGeometry(17, (0.52, 0.8), 15.0, (0.36, 0.22, 0.2)),
+)
+
+# Bend of the MCP, PIP and DIP joints of a fully curled finger
+MAX_BEND_RAD = np.radians((80.0, 100.0, 70.0))
+
+# Wrist to middle finger MCP of an average adult hand
+PALM_SIZE_M = 0.085
+
+
+class Pose(NamedTuple):
+    curls: Tuple[float, float, float, float]  # Index, middle, ring, pinky; 0 = extended, 1 = curled
+    thumb: object                             # "open", "fist", or a tuple of fingers the thumb touches
+
+
+POSES = {
+    "open_palm": Pose((0.0, 0.0, 0.0, 0.0), "open"),
+    "activation": Pose((0.0, 0.0, 1.0, 0.0), "open"),
+    "fist": Pose((1.0, 1.0, 1.0, 1.0), "fist"),
+    "pinch_index": Pose((0.6, 0.0, 0.0, 0.0), ("index",)),
+    "pinch_middle": Pose((0.0, 0.6, 0.0, 0.0), ("middle",)),
+    "pinch_ring": Pose((0.0, 0.0, 0.6, 0.0), ("ring",)),
+    "pinch_pinky": Pose((0.0, 0.0, 0.0, 0.65), ("pinky",)),
+    # Middle and ring fingers on the thumb, index and pinky up (mic mute)
+    "quiet_coyote": Pose((0.0, 0.6, 0.6, 0.0), ("middle", "ring")),
+}
+
+
+def build_hands(curls: np.ndarray, thumb_tips: np.ndarray) -> np.ndarray:
+    """
+    Builds local-model landmarks for many hands at once.
+
+    Args:
+        curls (np.ndarray): (n, 4) curl of index, middle, ring and pinky.
+        thumb_tips (np.ndarray): (n, 3) thumb tip positions.
+
+    Returns:
+        np.ndarray: (n, 21, 3) landmarks in the local model.
+    """
+    n = len(curls)
+    out = np.zeros((n, NUM_LANDMARKS, 3))
+    toward_camera = np.array([0.0, 0.0, -1.0])
+
+    for finger, geometry in enumerate(FINGER_GEOMETRY):
+        splay = np.radians(geometry.splay_deg)
+        direction = np.array([np.sin(splay), np.cos(splay), 0.0])
+        pos = np.broadcast_to(np.array([*geometry.mcp, 0.0]), (n, 3)).copy()
+        out[:, geometry.mcp_index] = pos
+        angle = np.zeros(n)
+        for joint, (length, bend) in enumerate(zip(geometry.lengths, MAX_BEND_RAD)):
+            angle = angle + curls[:, finger] * bend
+            segment = np.cos(angle)[:, None] * direction + np.sin(angle)[:, None] * toward_camera
+            pos = pos + length * segment
+            out[:, geometry.mcp_index + 1 + joint] = pos
+
+    # Thumb: from the CMC to the tip, bowed outwards when the tip is close
+    span = thumb_tips - THUMB_CMC
+    distance = np.linalg.norm(span[:, :2], axis=1)
+    bow = 0.5 * np.sqrt(np.maximum(0.0, (THUMB_LENGTH / 2) ** 2 - (distance / 2) ** 2))
+    # Unit vector perpendicular to the thumb in the image plane, on the side away from the palm
+    normal = np.stack([-span[:, 1], span[:, 0], np.zeros(n)], axis=1) / np.maximum(distance, 1e-6)[:, None]
+    normal[normal[:, 0] > 0] *= -1
+    out[:, 1] = THUMB_CMC
+    for landmark, fraction in ((2, 0.38), (3, 0.7)):
+        out[:, landmark] = THUMB_CMC + fraction * span + (bow * np.sin(np.pi * fraction))[:, None] * normal
+    out[:, 4] = thumb_tips
+    return out
+
+
+def pose_thumb_tip(pose: Pose) -> np.ndarray:
+    """Where the thumb tip is in a pose: its rest position, or on the fingertips it touches."""
+    if pose.thumb == "open":
+        return THUMB_OPEN_TIP
+    if pose.thumb == "fist":
+        return THUMB_FIST_TIP
+    hand = build_hands(np.array([pose.curls], dtype=float), THUMB_OPEN_TIP[None])[0]
+    tips = [hand[FINGER_GEOMETRY[FINGERS.index(f)].mcp_index + 3] for f in pose.thumb]
+    # Resting against the pads, slightly in front of the fingertips
+    return np.mean(tips, axis=0) + np.array([-0.03, -0.03, -0.04])
+
+
+def min_jerk(w: np.ndarray) -> np.ndarray:
+    """Minimum-jerk easing: the velocity profile of a natural point-to-point movement."""
+    w = np.clip(w, 0.0, 1.0)
+    return w * w * w * (10.0 - 15.0 * w + 6.0 * w * w)
+
+
+def random_script(duration: float, rng: np.random.Generator, poses: Optional[Sequence[str]] = None,
+                  hold: Tuple[float, float] = (0.3, 1.5),
+                  transition: Tuple[float, float] = (0.12, 0.35)) -> List[Tuple[str, float, float]]:
+    """
+    A random pose sequence covering at least duration seconds.
+
+    Returns:
+        list: (pose name, transition seconds, hold seconds) steps, never
+              repeating a pose twice in a row.
+    """
+    names = list(poses or POSES)
+    script, total, previous = [], 0.0, None
+    while total < duration or len(script) < 2:
+        name = rng.choice([n for n in names if n != previous] or names)
+        step = (str(name), float(rng.uniform(*transition)), float(rng.uniform(*hold)))
+        script.append(step)
+        total += step[1] + step[2]
+        previous = name
+    return script
+
+
+class SyntheticHand:
+    """
+    One scripted hand: a cyclic pose timeline plus placement and drift.
+    """
+
+    def __init__(self, label: str = "Right", script: Optional[List[Tuple[str, float, float]]] = None,
+                 position: Tuple[float, float] = (0.6, 0.65), scale: float = 0.15,
+                 rotation_deg: float = 0.0, drift: float = 0.05, seed: Optional[int] = None):
+        """
+        Args:
+            label (str): "Right" or "Left"; a left hand is the mirror image.
+            script (list): (pose name, transition seconds, hold seconds) steps,
+                           repeated cyclically; the transition into the first
+                           step starts from the last pose. Defaults to a random script.
+            position (tuple): Normalized image position of the wrist.
+            scale (float): Palm size as a fraction of the image height.
+            rotation_deg (float): In-plane rotation, positive turns the fingers clockwise.
+            drift (float): Amplitude of the slow wrist movement, as a fraction of the image.
+            seed (int): Seed for the random script and drift phases.
+        """
+        rng = np.random.default_rng(seed)
+        self.label = label
+        self.script = script or random_script(60.0, rng)
+        self.position = np.asarray(position, dtype=float)
+        self.scale = scale
+        self.rotation_deg = rotation_deg
+        self.drift = drift
+        # Slow, non-repeating looking wander of the wrist and a slight wobble
+        self._drift_freq = rng.uniform(0.1, 0.4, size=2)
+        self._drift_phase = rng.uniform(0.0, 2 * np.pi, size=3)
+
+        unknown = [name for name, _, _ in self.script if name not in POSES]
+        if unknown:
+            raise ValueError(f"Unknown poses: {unknown}. Known poses: {list(POSES)}")
+        self._curls = np.array([POSES[name].curls for name, _, _ in self.script], dtype=float)
+        self._thumbs = np.array([pose_thumb_tip(POSES[name]) for name, _, _ in self.script])
+        self._transitions = np.array([step[1] for step in self.script])
+        durations = self._transitions + np.array([step[2] for step in self.script])
+        self._starts = np.concatenate([[0.0], np.cumsum(durations)[:-1]])
+        self._period = float(durations.sum())
+
+    def pose_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Index of the script step each time falls into.
+        """
+        phase = np.mod(t, self._period)
+        return np.searchsorted(self._starts, phase, side="right") - 1
+
+    def pose_names(self, t: np.ndarray) -> List[str]:
+        """Name of the pose the hand is in, or moving into, at each time."""
+        return [self.script[step][0] for step in self.pose_at(t)]
+
+    def settled(self, t: np.ndarray) -> np.ndarray:
+        """True where the hand has finished moving into its pose and is holding it."""
+        step = self.pose_at(t)
+        return np.mod(t, self._period) - self._starts[step] >= self._transitions[step]
+
+    def local(self, t: np.ndarray) -> np.ndarray:
+        """(len(t), 21, 3) local-model landmarks at the given times in seconds."""
+        step = self.pose_at(t)
+        previous = (step - 1) % len(self.script)
+        phase = np.mod(t, self._period) - self._starts[step]
+        w = min_jerk(phase / np.maximum(self._transitions[step], 1e-6))[:, None]
+        curls = self._curls[previous] + w * (self._curls[step] - self._curls[previous])
+        thumbs = self._thumbs[previous] + w * (self._thumbs[step] - self._thumbs[previous])
+        return build_hands(curls, thumbs)
+
+    def place(self, t: np.ndarray, local: np.ndarray, aspect: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mirrors, rotates and positions local landmarks in the image.
+
+        Args:
+            t (np.ndarray): Times in seconds, for the drift.
+            local (np.ndarray): (n, 21, 3) local-model landmarks.
+            aspect (float): Image width / height.
+
+        Returns:
+            tuple: (n, 21, 3) normalized image landmarks and (n, 21, 3) world landmarks.
+        """
+        points = local.copy()
+        if self.label == "Left":
+            points[..., 0] *= -1.0
+
+        wobble = 3.0 * np.sin(2 * np.pi * 0.3 * t + self._drift_phase[2])
+        angle = np.radians(self.rotation_deg + wobble)
+        cos, sin = np.cos(angle)[:, None], np.sin(angle)[:, None]
+        x, y = points[..., 0], points[..., 1]
+        points[..., 0], points[..., 1] = cos * x + sin * y, -sin * x + cos * y
+
+        # World landmarks: meters, y down like the image, origin at the wrist
+        world = points * PALM_SIZE_M
+        world[..., 1] *= -1.0
+
+        wrist = self.position + self.drift * np.sin(
+            2 * np.pi * self._drift_freq * t[:, None] + self._drift_phase[:2]
+        )
+        image = np.empty_like(points)
+        image[..., 0] = wrist[:, 0:1] + points[..., 0] * self.scale / aspect
+        image[..., 1] = wrist[:, 1:2] - points[..., 1] * self.scale
+        image[..., 2] = points[..., 2] * self.scale / aspect
+        return image, world
+
+
+class SyntheticHandStream:
+    """
+    Frames of tracker output for a set of scripted hands.
+    """
+
+    def __init__(self, hands: Optional[List[SyntheticHand]] = None, fps: float = 30.0,
+                 image_size: Tuple[int, int] = (1280, 720), noise: float = 0.01,
+                 handedness_flip_rate: float = 0.0, interval_jitter_ms: float = 1.5,
+                 drop_rate: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            hands (list): The hands in view. Defaults to one random right hand.
+            fps (float): Nominal camera frame rate.
+            image_size (tuple): (width, height) the landmarks are normalized to.
+            noise (float): Standard deviation of landmark noise, as a fraction of palm size.
+            handedness_flip_rate (float): Probability per frame and hand that the
+                                          reported Left/Right label is wrong.
+            interval_jitter_ms (float): Standard deviation of the frame interval.
+            drop_rate (float): Probability that a frame is lost, doubling an interval.
+            seed (int): Seed for noise, flips and timing.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.hands = hands or [SyntheticHand(seed=seed)]
+        self.fps = fps
+        self.width, self.height = image_size
+        self.noise = noise
+        self.handedness_flip_rate = handedness_flip_rate
+        self.interval_jitter_ms = interval_jitter_ms
+        self.drop_rate = drop_rate
+
+    def timestamps(self, frames: int, start: float = 0.0) -> np.ndarray:
+        """Capture times of the given number of frames, in seconds."""
+        nominal = 1.0 / self.fps
+        intervals = nominal + self.rng.normal(0.0, self.interval_jitter_ms / 1000.0, frames)
+        intervals = np.maximum(intervals, 0.2 * nominal)
+        intervals += nominal * (self.rng.random(frames) < self.drop_rate)
+        return start + np.concatenate([[0.0], np.cumsum(intervals[1:])])
+
+    def sample(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[List[str]], np.ndarray]:
+        """
+        Landmarks of every hand at the given times.
+
+        Returns:
+            tuple: landmarks (frames, hands, 21, 3) float32, world landmarks
+                   (frames, hands, 21, 3) float32, handedness labels per frame,
+                   and handedness scores (frames, hands).
+        """
+        t = np.asarray(t, dtype=float)
+        frames, count = len(t), len(self.hands)
+        aspect = self.width / self.height
+        landmarks = np.empty((frames, count, NUM_LANDMARKS, 3), dtype=np.float32)
+        world = np.empty_like(landmarks)
+        for h, hand in enumerate(self.hands):
+            image, world[:, h] = hand.place(t, hand.local(t), aspect)
+            if self.noise:
+                sigma = self.noise * hand.scale
+                image = image + self.rng.normal(0.0, sigma, image.shape) * np.array([1.0 / aspect, 1.0, 1.0 / aspect])
+            landmarks[:, h] = image
+
+        flipped = self.rng.random((frames, count)) < self.handedness_flip_rate
+        swap = {"Left": "Right", "Right": "Left"}
+        labels = [
+            [swap[hand.label] if flipped[f, h] else hand.label for h, hand in enumerate(self.hands)]
+            for f in range(frames)
+        ]
+        scores = np.where(flipped, self.rng.uniform(0.5, 0.7, flipped.shape),
+                          self.rng.uniform(0.9, 0.99, flipped.shape))
+        return landmarks, world, labels, scores
+
+    def generate(self, frames: int, start: float = 0.0) -> Tuple[np.ndarray, List[TrackerResult]]:
+        """
+        Returns:
+            tuple: Frame timestamps (frames,) and one TrackerResult per frame,
+                   as the tracker would have returned them.
+        """
+        timestamps = self.timestamps(frames, start)
+        landmarks, world, labels, scores = self.sample(timestamps)
+        results = [
+            TrackerResult(landmarks[f], labels[f], scores[f].tolist(), world[f])
+            for f in range(frames)
+        ]
+        return timestamps, results
+
+
+class SyntheticHandTracker(TrackerBackend):
+    """
+    Tracker backend that ignores the image and returns a synthetic stream,
+    advancing its scripts with a clock.
+    """
+
+    name = "synthetic"
+
+    def __init__(self, max_num_hands: int = 1, seed: Optional[int] = None, clock=None, **_):
+        """
+        Args:
+            max_num_hands (int): 1 for a right hand, 2 to add a left hand.
+            seed (int): Seed for the scripts and noise.
+            clock: Clock the scripts follow (see core.clock); pass the app's
+                   clock so a VirtualClock runs them faster than real time.
+                   Defaults to a monotonic clock.
+
+        Settings of the MediaPipe backends are accepted and ignored.
+        """
+        hands = [SyntheticHand("Right", position=(0.65, 0.65), seed=seed)]
+        if max_num_hands > 1:
+            hands.append(SyntheticHand("Left", position=(0.3, 0.65), seed=None if seed is None else seed + 1))
+        self.stream = SyntheticHandStream(hands, seed=seed)
+        self.clock = clock or MonotonicClock()
+        self._start = self.clock.now()
+
+    def process_frame(self, img: np.ndarray) -> Tuple[np.ndarray, TrackerResult]:
+        height, width = img.shape[:2]
+        self.stream.width, self.stream.height = width, height
+        t = np.array([self.clock.now() - self._start])
+        landmarks, world, labels, scores = self.stream.sample(t)
+        return img, TrackerResult(landmarks[0], labels[0], scores[0].tolist(), world[0])
+
+    def reconfigure(self, **settings):
+        """Nothing to reconfigure."""
@@ -0,0 +1,220 @@
+"""
+Thread scheduling for the capture, inference and actuator threads (Linux).
+
+Each role ("capture", "inference", "actuator") has a nice value, an optional SCHED_FIFO
+real-time priority and a CPU list in the PERFORMANCE_SETTINGS. Linux applies
+all three per thread, and threads inherit them from the thread that creates
+them. The hand tracker is therefore created with the inference settings
+applied, so MediaPipe's own inference (XNNPACK) worker threads run on the
+inference cores too. MediaPipe does not let Python choose how many of those
+threads it starts; INFERENCE_THREAD_CPUS is what bounds them. Only the
+tracker is created that way; the scroll and audio worker threads tune
+themselves for the "actuator" role.
+
+FrameJitterMeter measures how evenly frames arrive, to compare settings.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+import cv2
+import numpy as np
+from core.config_manager import config
+from core.metrics import metrics
+
+IS_LINUX = sys.platform.startswith("linux")
+
+ROLES = ("capture", "inference", "actuator")
+
+
+def parse_cpu_list(text: str) -> set:
+    """
+    Parses a CPU list like "2", "0,2" or "2-3,6" into a set of CPU numbers.
+    An empty string means no restriction and returns an empty set.
+    """
+    cpus = set()
+    for part in str(text).replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return cpus
+
+
+def role_settings(role: str) -> dict:
+    """The configured nice value, real-time priority and CPU set for a thread role."""
+    prefix = role.upper()
+    return {
+        "nice": int(config.get(f"{prefix}_THREAD_NICE", 0)),
+        "realtime_priority": int(config.get(f"{prefix}_THREAD_REALTIME_PRIORITY", 0)),
+        "cpus": parse_cpu_list(config.get(f"{prefix}_THREAD_CPUS", "")),
+    }
+
+
+def describe_settings() -> str:
+    """One line summarizing the scheduling settings, for measurement reports."""
+    parts = [f"opencv threads {cv2.getNumThreads()}"]
+    for role in ROLES:
+        s = role_settings(role)
+        rt = f"fifo {s['realtime_priority']}" if s["realtime_priority"] else "rt off"
+        cpus = ",".join(str(c) for c in sorted(s["cpus"])) or "any"
+        parts.append(f"{role}: nice {s['nice']}, {rt}, cpus {cpus}")
+    return "; ".join(parts)
+
+
+def _thread_state(tid: int) -> tuple:
+    return (
+        os.getpriority(os.PRIO_PROCESS, tid),
+        os.sched_getscheduler(tid),
+        os.sched_getparam(tid),
+        os.sched_getaffinity(tid),
+    )
+
+
+def _apply(tid: int, nice: int, policy: int, param, cpus: set, role: str):
+    """Applies each setting separately, so one refused setting does not prevent the others."""
+    try:
+        if os.getpriority(os.PRIO_PROCESS, tid) != nice:
+            os.setpriority(os.PRIO_PROCESS, tid, nice)
+    except OSError as e:
+        print(f"Could not set nice {nice} for the {role} thread: {e}")
+    try:
+        if os.sched_getscheduler(tid) != policy or os.sched_getparam(tid) != param:
+            os.sched_setscheduler(tid, policy, param)
+    except OSError as e:
+        print(f"Could not set real-time scheduling for the {role} thread "
+              f"(needs CAP_SYS_NICE or an rtprio limit): {e}")
+    if cpus:
+        try:
+            os.sched_setaffinity(tid, cpus)
+        except OSError as e:
+            print(f"Could not pin the {role} thread to CPUs {sorted(cpus)}: {e}")
+
+
+def tune_current_thread(role: str):
+    """
+    Applies the scheduling settings of a role to the calling thread. Does
+    nothing outside Linux or when the role is left at its defaults.
+    """
+    if not IS_LINUX:
+        return
+    s = role_settings(role)
+    if not s["nice"] and not s["realtime_priority"] and not s["cpus"]:
+        return
+
+    if s["realtime_priority"]:
+        policy, param = os.SCHED_FIFO, os.sched_param(s["realtime_priority"])
+    else:
+        policy, param = os.SCHED_OTHER, os.sched_param(0)
+    _apply(threading.get_native_id(), s["nice"], policy, param, s["cpus"], role)
+
+
+@contextmanager
+def tuned_thread(role: str):
+    """
+    Runs a block with the role's settings applied to the calling thread and
+    restores the previous settings afterwards. Threads started inside the
+    block keep the role's settings.
+    """
+    if not IS_LINUX:
+        yield
+        return
+    tid = threading.get_native_id()
+    nice, policy, param, cpus = _thread_state(tid)
+    tune_current_thread(role)
+    try:
+        yield
+    finally:
+        if _thread_state(tid) != (nice, policy, param, cpus):
+            _apply(tid, nice, policy, param, cpus, "previous")
+
+
+def configure_process():
+    """
+    Process-wide settings: the OpenCV worker thread count on every platform,
+    and on Linux the process nice value (inherited by all threads started
+    afterwards).
+    """
+    if config.OPENCV_THREADS >= 0:
+        cv2.setNumThreads(config.OPENCV_THREADS)
+    if IS_LINUX and config.PROCESS_NICE:
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, config.PROCESS_NICE)
+            print(f"Process nice value set to {config.PROCESS_NICE}.")
+        except OSError as e:
+            print(f"Could not set process nice value {config.PROCESS_NICE}: {e}")
+
+
+class FrameJitterMeter:
+    """
+    Measures the spacing of captured frames. Every interval goes to the
+    frame.interval_ms metric; with FRAME_JITTER_REPORT_SECONDS set, a summary
+    of the last window is printed together with the scheduling settings.
+    """
+
+    def __init__(self, report_seconds: float = None):
+        """
+        Args:
+            report_seconds (float): Seconds between printed reports (0 = never).
+                                    Defaults to the FRAME_JITTER_REPORT_SECONDS setting.
+        """
+        self.report_seconds = config.FRAME_JITTER_REPORT_SECONDS if report_seconds is None else report_seconds
+        self._last = None
+        self._window_start = None
+        self._intervals = deque(maxlen=4096)
+
+    def tick(self):
+        """Call once per captured frame."""
+        now = time.perf_counter()
+        if self._last is not None:
+            interval_ms = (now - self._last) * 1000.0
+            metrics.observe("frame.interval_ms", interval_ms)
+            self._intervals.append(interval_ms)
+        self._last = now
+
+        if not self.report_seconds:
+            return
+        if self._window_start is None:
+            self._window_start = now
+        elif now - self._window_start >= self.report_seconds:
+            print(self.report())
+            self._intervals.clear()
+            self._window_start = now
+
+    def reset(self):
+        """Forget the previous frame, e.g. after the camera was reopened."""
+        self._last = None
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Interval count, median, and the jitter: standard deviation,
+                  99th percentile and maximum of the deviation from the median,
+                  all in milliseconds.
+        """
+        if not self._intervals:
+            return {"frames": 0, "median_ms": 0.0, "std_ms": 0.0, "p99_dev_ms": 0.0, "max_dev_ms": 0.0}
+        intervals = np.fromiter(self._intervals, dtype=np.float64)
+        median = float(np.median(intervals))
+        deviation = np.abs(intervals - median)
+        return {
+            "frames": int(intervals.size),
+            "median_ms": median,
+            "std_ms": float(intervals.std()),
+            "p99_dev_ms": float(np.percentile(deviation, 99)),
+            "max_dev_ms": float(deviation.max()),
+        }
+
+    def report(self) -> str:
+        s = self.stats()
+        metrics.set_gauge("frame.jitter_std_ms", s["std_ms"])
+        metrics.set_gauge("frame.jitter_p99_ms", s["p99_dev_ms"])
+        return (f"Frame intervals ({s['frames']}): median {s['median_ms']:.1f} ms, "
+                f"jitter std {s['std_ms']:.2f} ms, p99 {s['p99_dev_ms']:.2f} ms, "
+                f"max {s['max_dev_ms']:.1f} ms [{describe_settings()}]")
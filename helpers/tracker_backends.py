@@ -0,0 +1,179 @@
+"""
+Hand tracker backends.
+
+"solutions" is the synchronous mp.solutions.hands HandTracker. "tasks" uses
+the MediaPipe Tasks HandLandmarker in live-stream mode: frames are submitted
+with a timestamp and results arrive on a MediaPipe thread through a callback,
+so the caller never waits for inference. Each call returns the newest result
+available at that moment, usually that of an earlier frame. MediaPipe drops
+submitted frames itself while the model is busy.
+
+The synthetic backend (helpers/synthetic_hands.py) is deliberately not
+selectable here: its scripted poses drive the real mouse and microphone, so
+it is only passed in from code (HandyMouseApp(tracker=...)).
+"""
+
+import os
+import threading
+import time
+from typing import Tuple
+import mediapipe as mp
+import numpy as np
+from core.clock import MonotonicClock
+from core.config_manager import config
+from core.metrics import metrics
+from helpers.hand_tracker import NUM_LANDMARKS, HandTracker, RgbBuffer, TrackerBackend, TrackerResult
+
+
+def _points_to_array(hands) -> np.ndarray:
+    """Packs Tasks landmark lists (one list of points per hand) into a (hands, 21, 3) array."""
+    if not hands:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.array([[(p.x, p.y, p.z) for p in hand] for hand in hands], dtype=np.float32)
+
+
+class LiveStreamHandTracker(TrackerBackend):
+    """
+    MediaPipe Tasks HandLandmarker in LIVE_STREAM mode.
+    """
+
+    name = "tasks"
+
+    def __init__(self, max_num_hands: int = 1, min_detection_confidence: float = 0.5,
+                 min_tracking_confidence: float = 0.5, model_path: str = None, clock=None, **_):
+        """
+        Initialize the HandLandmarker.
+
+        Args:
+            max_num_hands (int): Maximum number of hands to detect.
+            min_detection_confidence (float): Minimum palm detection confidence.
+            min_tracking_confidence (float): Minimum hand presence and tracking confidence.
+            model_path (str): Path to the hand_landmarker.task bundle. Defaults to
+                              the HAND_LANDMARKER_MODEL_PATH setting.
+            clock: Clock the submissions are stamped with (see core.clock), so
+                   a VirtualClock replay runs faster than real time. Defaults
+                   to a monotonic clock.
+
+        Settings only the solutions backend understands (roi_mode,
+        model_complexity, ...) are accepted and ignored.
+        """
+        self.model_path = model_path or config.HAND_LANDMARKER_MODEL_PATH
+        self.clock = clock or MonotonicClock()
+        self.settings = dict(
+            max_num_hands=max_num_hands,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+        )
+        self._lock = threading.Lock()
+        self._latest = TrackerResult.empty()
+        self._submitted = {}   # timestamp_ms -> perf_counter() at submission
+        self._last_timestamp_ms = -1
+        self._rgb = RgbBuffer()
+        self.landmarker = self._create()
+
+    def _create(self):
+        vision = mp.tasks.vision
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=self.model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=self.settings["max_num_hands"],
+            min_hand_detection_confidence=self.settings["min_detection_confidence"],
+            min_hand_presence_confidence=self.settings["min_tracking_confidence"],
+            min_tracking_confidence=self.settings["min_tracking_confidence"],
+            result_callback=self._on_result,
+        )
+        return vision.HandLandmarker.create_from_options(options)
+
+    def _on_result(self, result, output_image, timestamp_ms: int):
+        """Runs on a MediaPipe thread for every processed frame."""
+        handedness, scores = [], []
+        for categories in result.handedness:
+            handedness.append(categories[0].category_name)
+            scores.append(categories[0].score)
+
+        latest = TrackerResult(
+            _points_to_array(result.hand_landmarks),
+            handedness,
+            scores,
+            _points_to_array(result.hand_world_landmarks),
+        )
+        with self._lock:
+            self._latest = latest
+            submitted = self._submitted.pop(timestamp_ms, None)
+            # Frames MediaPipe dropped never get a callback
+            for stale in [t for t in self._submitted if t < timestamp_ms]:
+                del self._submitted[stale]
+        if submitted is not None:
+            metrics.observe("inference.async_ms", (time.perf_counter() - submitted) * 1000.0)
+
+    def process_frame(self, img: np.ndarray) -> Tuple[np.ndarray, TrackerResult]:
+        """
+        Submits a frame for inference and returns immediately.
+
+        Returns:
+            Tuple[np.ndarray, TrackerResult]: The image, and the newest result
+            delivered so far (possibly for an earlier frame).
+        """
+        # Timestamps must strictly increase, even for frames in the same millisecond
+        timestamp_ms = max(int(self.clock.now() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+
+        img_rgb = self._rgb.convert(img)
+        with self._lock:
+            self._submitted[timestamp_ms] = time.perf_counter()
+        self.landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=img_rgb), timestamp_ms)
+
+        with self._lock:
+            return img, self._latest
+
+    def reconfigure(self, **settings):
+        """
+        Rebuild the HandLandmarker with changed confidences. Settings it does
+        not support, like model_complexity, are ignored.
+        """
+        settings = {k: v for k, v in settings.items() if k in self.settings}
+        if not settings:
+            return
+        self.settings.update(settings)
+        self.landmarker.close()
+        self.landmarker = self._create()
+
+    def close(self):
+        """Release the HandLandmarker."""
+        self.landmarker.close()
+
+
+BACKENDS = {
+    "solutions": HandTracker,
+    "tasks": LiveStreamHandTracker,
+}
+
+
+def create_hand_tracker(name: str = "solutions", **kwargs) -> TrackerBackend:
+    """
+    Creates the hand tracker for the given backend name.
+
+    Args:
+        name (str): "solutions" or "tasks".
+        **kwargs: Tracker settings (max_num_hands, roi_mode, confidences,
+                  clock, ...).
+
+    Returns:
+        TrackerBackend: The tracker instance.
+    """
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        print(f"Unknown tracker backend '{name}', falling back to solutions backend.")
+        backend_cls = HandTracker
+
+    if backend_cls is LiveStreamHandTracker:
+        model_path = kwargs.get("model_path") or config.HAND_LANDMARKER_MODEL_PATH
+        if not os.path.isfile(model_path):
+            print(f"Hand landmarker model not found at '{model_path}', falling back to solutions backend. "
+                  "Download hand_landmarker.task from the MediaPipe models page to use the tasks backend.")
+            backend_cls = HandTracker
+
+    if backend_cls is HandTracker:
+        kwargs.pop("model_path", None)
+        kwargs.pop("clock", None)
+    return backend_cls(**kwargs)
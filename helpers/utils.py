@@ -23,7 +23,7 @@ def smooth_position(target_pos: np.ndarray, current_pos: np.ndarray, alpha: floa
     """
     return current_pos + alpha * (target_pos - current_pos)
 
-def is_palm_facing_camera(hand_landmarks, handedness_info):
+def is_palm_facing_camera(hand_landmarks, handedness):
     """
     Determines if the palm is facing the camera.
     
@@ -31,23 +31,23 @@ def is_palm_facing_camera(hand_landmarks, handedness_info):
     handedness information to determine orientation.
     
     Args:
-        hand_landmarks: The detected hand landmarks.
-        handedness_info: The MediaPipe handedness classification object.
+        hand_landmarks (np.ndarray): Normalized landmarks of one hand, shape (21, 3).
+        handedness (str): The MediaPipe handedness label ("Left" or "Right").
         
     Returns:
         bool: True if the palm is likely facing the camera, False otherwise.
     """
-    if not handedness_info:
+    if not handedness:
         return True # Default to True if uncertain to avoid locking out
         
     
-    label = handedness_info.classification[0].label # "Left" or "Right"
+    label = handedness # "Left" or "Right"
     # Landmark indices
     INDEX_MCP = 5
     PINKY_MCP = 17
     
-    index_mcp_x = hand_landmarks.landmark[INDEX_MCP].x
-    pinky_mcp_x = hand_landmarks.landmark[PINKY_MCP].x
+    index_mcp_x = hand_landmarks[INDEX_MCP, 0]
+    pinky_mcp_x = hand_landmarks[PINKY_MCP, 0]
     
     is_palm = False
     
@@ -61,7 +61,7 @@ def is_palm_facing_camera(hand_landmarks, handedness_info):
             is_palm = True
 
     # When the hand is upside down, MediaPipe's handedness logic appears flipped.
-    if hand_landmarks and not is_palm_rightside_up(hand_landmarks):
+    if hand_landmarks is not None and not is_palm_rightside_up(hand_landmarks):
         is_palm = not is_palm
             
     return is_palm
@@ -71,7 +71,7 @@ def is_palm_rightside_up(hand_landmarks):
     Determines if the palm is upside down based on wrist and finger MCP positions.
     
     Args:
-        hand_landmarks: The detected hand landmarks.
+        hand_landmarks (np.ndarray): Normalized landmarks of one hand, shape (21, 3).
         
     Returns:
         bool: True if the palm is likely right side up, False otherwise.
@@ -80,8 +80,8 @@ def is_palm_rightside_up(hand_landmarks):
     WRIST = 0
     MIDDLE_MCP = 9
     
-    wrist_y = hand_landmarks.landmark[WRIST].y
-    middle_mcp_y = hand_landmarks.landmark[MIDDLE_MCP].y
+    wrist_y = hand_landmarks[WRIST, 1]
+    middle_mcp_y = hand_landmarks[MIDDLE_MCP, 1]
     
     # If wrist is below both MCPs, palm is right side up
     if wrist_y > middle_mcp_y:
@@ -165,10 +165,13 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
 
 def set_high_priority():
     """ Set the priority of the process to high. """
+    from helpers.thread_scheduling import configure_process
+    configure_process()
+
     try:
         sys.getwindowsversion()
     except AttributeError:
-        # Not on Windows
+        # Not on Windows; Linux threads are tuned per role (see helpers.thread_scheduling)
         return
 
     pid = os.getpid()
@@ -190,7 +193,7 @@ def measure_true_palm_width(hand_landmarks, world_landmarks, image_shape):
     Uses the "Max Scale" heuristic: The bone with the least foreshortening
     provides the true depth scale (Pixels per Meter).
     """
-    if not hand_landmarks or not world_landmarks:
+    if hand_landmarks is None or world_landmarks is None:
         return 0.0
 
     h, w = image_shape[:2]
@@ -208,19 +211,13 @@ def measure_true_palm_width(hand_landmarks, world_landmarks, image_shape):
     # 1. Find the best available scale factor from the most parallel bone
     for i1, i2 in bones_to_check:
         # Screen Length (2D Pixels) - purely x and y
-        p1 = hand_landmarks.landmark[i1]
-        p2 = hand_landmarks.landmark[i2]
-        dist_px = math.hypot((p1.x - p2.x) * w, (p1.y - p2.y) * h)
+        p1 = hand_landmarks[i1]
+        p2 = hand_landmarks[i2]
+        dist_px = math.hypot((p1[0] - p2[0]) * w, (p1[1] - p2[1]) * h)
         
         # World Length (3D Metric) - x, y, and z
         # MediaPipe world landmarks are in meters (approx) with origin at wrist
-        w1 = world_landmarks.landmark[i1]
-        w2 = world_landmarks.landmark[i2]
-        dist_m = math.sqrt(
-            (w1.x - w2.x)**2 + 
-            (w1.y - w2.y)**2 + 
-            (w1.z - w2.z)**2
-        )
+        dist_m = float(np.linalg.norm(world_landmarks[i1] - world_landmarks[i2]))
         
         if dist_m < 1e-6: continue # Avoid division by zero
         
@@ -230,14 +227,7 @@ def measure_true_palm_width(hand_landmarks, world_landmarks, image_shape):
 
     # 2. Get the constant 3D width of the palm (Index 5 to Pinky 17)
     i_idx, i_pinky = 5, 17
-    w_idx = world_landmarks.landmark[i_idx]
-    w_pinky = world_landmarks.landmark[i_pinky]
-    
-    real_palm_width_m = math.sqrt(
-        (w_idx.x - w_pinky.x)**2 + 
-        (w_idx.y - w_pinky.y)**2 + 
-        (w_idx.z - w_pinky.z)**2
-    )
+    real_palm_width_m = float(np.linalg.norm(world_landmarks[i_idx] - world_landmarks[i_pinky]))
     
     # 3. Convert 3D width to pixels using the best scale found
     return real_palm_width_m * max_pixels_per_meter
@@ -0,0 +1,78 @@
+"""
+AudioController against the fake audio backend.
+
+    python -m unittest tests.test_audio_controller
+"""
+
+import time
+import unittest
+from helpers.audio_backends import FakeAudioBackend
+from helpers.audio_controller import AudioController
+
+POLL_SECONDS = 0.02
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class AudioControllerTest(unittest.TestCase):
+
+    def make_controller(self, **backend_kwargs):
+        backend = FakeAudioBackend(**backend_kwargs)
+        controller = AudioController(backend, poll_interval=POLL_SECONDS)
+        self.addCleanup(controller.close)
+        self.assertTrue(controller.wait_ready(2.0))
+        return backend, controller
+
+    def test_toggle_updates_cache_instantly_and_device_on_worker(self):
+        backend, controller = self.make_controller(muted=False)
+        controller.toggle_mic()
+        self.assertTrue(controller.mic_muted)
+        self.assertTrue(wait_for(lambda: backend.set_calls == [True]))
+        self.assertTrue(backend.muted)
+
+    def test_toggle_follows_external_mute_with_notifications(self):
+        backend, controller = self.make_controller(muted=False)
+        backend.simulate_external_mute(True)
+        self.assertTrue(wait_for(lambda: controller.mic_muted is True))
+        controller.toggle_mic()
+        self.assertTrue(wait_for(lambda: backend.set_calls == [False]))
+        self.assertFalse(backend.muted)
+
+    def test_toggle_follows_external_mute_without_notifications(self):
+        # Like pycaw: nothing reports the change, so the toggle must read the device
+        backend, controller = self.make_controller(muted=False, notifies_changes=False)
+        backend.simulate_external_mute(True)
+        controller.toggle_mic()
+        self.assertTrue(wait_for(lambda: backend.set_calls == [False]))
+        self.assertFalse(backend.muted)
+        self.assertTrue(wait_for(lambda: controller.mic_muted is False))
+
+    def test_polling_picks_up_external_mute_without_notifications(self):
+        backend, controller = self.make_controller(muted=False, notifies_changes=False)
+        backend.simulate_external_mute(True)
+        self.assertTrue(wait_for(lambda: controller.mic_muted is True))
+
+    def test_device_change_refreshes_cache(self):
+        backend, controller = self.make_controller(muted=False)
+        backend.simulate_device_change("headset", muted=True)
+        self.assertTrue(wait_for(lambda: controller.device_id == "headset"))
+        self.assertTrue(controller.mic_muted)
+
+    def test_no_microphone(self):
+        backend, controller = self.make_controller(device_id=None)
+        self.assertFalse(controller.available)
+        controller.toggle_mic()
+        controller.mute_mic()
+        self.assertTrue(wait_for(lambda: backend.set_calls == [True]))
+        self.assertIsNone(controller.mic_muted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Setting validation against default_config.json.
+
+    python -m unittest tests.test_config_manager
+"""
+
+import unittest
+from core.config_manager import config
+
+
+class ValidateTest(unittest.TestCase):
+
+    def test_unknown_key(self):
+        with self.assertRaises(KeyError):
+            config.validate("NOT_A_SETTING", 1)
+
+    def test_numbers_are_range_checked_and_converted(self):
+        self.assertEqual(config.validate("CAMERA_FPS", 24.0), 24)
+        self.assertIsInstance(config.validate("CAMERA_FPS", 24.0), int)
+        self.assertIsInstance(config.validate("SMOOTHING_FACTOR", 1), float)
+        with self.assertRaises(ValueError):
+            config.validate("CAMERA_FPS", 24.5)
+        with self.assertRaises(ValueError):
+            config.validate("CONTROL_PORT", 80)
+        with self.assertRaises(ValueError):
+            config.validate("CAMERA_FPS", "30")
+
+    def test_bools_are_strict(self):
+        self.assertIs(config.validate("CONTROL_API_ENABLED", True), True)
+        with self.assertRaises(ValueError):
+            config.validate("CONTROL_API_ENABLED", 1)
+        with self.assertRaises(ValueError):
+            config.validate("CAMERA_FPS", True)
+
+    def test_strings_must_be_in_range(self):
+        self.assertEqual(config.validate("TRACKER_BACKEND", "tasks"), "tasks")
+        with self.assertRaises(ValueError):
+            config.validate("TRACKER_BACKEND", "synthetic")
+        # No range: any string
+        self.assertEqual(config.validate("TRACE_FILE", "trace.json"), "trace.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
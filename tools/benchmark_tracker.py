@@ -0,0 +1,298 @@
+"""
+Tracker benchmark.
+
+Runs a recorded session through HandTracker under a matrix of configurations
+and reports, for each one, inference latency percentiles, how far its
+landmarks deviate from a reference run, and whether the gesture events the
+detectors would fire differ from the reference.
+
+Record a session from the webcam:
+    python -m tools.benchmark_tracker record session.mp4 --seconds 60
+
+Benchmark it:
+    python -m tools.benchmark_tracker run session.mp4 --complexity 0 1 \
+        --resolutions 1280x720 960x540 640x360 --roi off on --hands 1 2 \
+        --json results.json
+"""
+
+import argparse
+import itertools
+import json
+import time
+from typing import List, NamedTuple, Optional
+import cv2
+import numpy as np
+from helpers import detectors
+from helpers.hand_data import HandData
+from helpers.hand_tracker import HandTracker
+
+GESTURES = {
+    "activation": detectors.is_activation_pose,
+    "fist": detectors.is_fist,
+    "left_click": detectors.is_left_click,
+    "right_click": detectors.is_right_click,
+    "mic": detectors.is_mic_mute,
+}
+
+WRIST = 0
+
+
+class TrackerConfig(NamedTuple):
+    model_complexity: int
+    width: int
+    height: int
+    roi_mode: bool
+    max_num_hands: int
+
+    @property
+    def name(self) -> str:
+        roi = "roi" if self.roi_mode else "full"
+        return f"c{self.model_complexity} {self.width}x{self.height} {roi} h{self.max_num_hands}"
+
+
+class RunResult(NamedTuple):
+    config: TrackerConfig
+    latencies_ms: np.ndarray
+    landmarks: List[np.ndarray]   # Per frame, (hands, 21, 3) normalized
+    events: list                  # (frame, hand label, gesture, state)
+
+
+def record(path: str, seconds: float, camera: int = 0, width: int = 1280, height: int = 720):
+    """Records a webcam session to a video file for later benchmarking."""
+    cap = cv2.VideoCapture(camera)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+
+    print(f"Recording {size[0]}x{size[1]} @ {fps:g} fps to {path} for {seconds:g}s...")
+    frames = 0
+    end = time.time() + seconds
+    try:
+        while time.time() < end:
+            success, img = cap.read()
+            if not success:
+                continue
+            writer.write(img)
+            frames += 1
+    finally:
+        writer.release()
+        cap.release()
+    print(f"Recorded {frames} frames.")
+
+
+def load_frames(path: str, limit: Optional[int] = None) -> List[np.ndarray]:
+    """Decodes the whole session up front so decoding is not part of the timings."""
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while limit is None or len(frames) < limit:
+        success, img = cap.read()
+        if not success:
+            break
+        frames.append(img)
+    cap.release()
+    if not frames:
+        raise SystemExit(f"No frames could be read from {path}")
+    return frames
+
+
+def gesture_states(landmarks: np.ndarray, handedness: List[str], img_shape) -> dict:
+    """
+    Returns:
+        dict: {(hand label, gesture): bool} for every hand in the frame.
+    """
+    states = {}
+    seen = {}
+    for hand, label in zip(landmarks, handedness):
+        # Tell apart two hands given the same label
+        seen[label] = seen.get(label, 0) + 1
+        key = label if seen[label] == 1 else f"{label}{seen[label]}"
+        hand_data = HandData(hand, img_shape, label=key)
+        for gesture, detector in GESTURES.items():
+            states[(key, gesture)] = bool(detector(hand_data))
+    return states
+
+
+def run_config(frames: List[np.ndarray], cfg: TrackerConfig) -> RunResult:
+    """Runs every frame through a fresh tracker with the given configuration."""
+    tracker = HandTracker(
+        max_num_hands=cfg.max_num_hands,
+        roi_mode=cfg.roi_mode,
+        model_complexity=cfg.model_complexity,
+    )
+    latencies, landmarks, events = [], [], []
+    previous = {}
+    try:
+        for index, frame in enumerate(frames):
+            if frame.shape[1] != cfg.width or frame.shape[0] != cfg.height:
+                frame = cv2.resize(frame, (cfg.width, cfg.height), interpolation=cv2.INTER_AREA)
+
+            start = time.perf_counter()
+            _, result = tracker.process_frame(frame)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            landmarks.append(result.landmarks)
+
+            states = gesture_states(result.landmarks, result.handedness, frame.shape[:2])
+            for key in set(states) | set(previous):
+                state = states.get(key, False)
+                if state != previous.get(key, False):
+                    events.append((index, key[0], key[1], state))
+            previous = states
+    finally:
+        tracker.close()
+    return RunResult(cfg, np.array(latencies), landmarks, events)
+
+
+def landmark_deviation(result: RunResult, reference: RunResult, ref_size) -> dict:
+    """
+    Compares landmarks frame by frame, pairing hands by nearest wrist.
+
+    Returns:
+        dict: Mean and 95th percentile landmark error in reference pixels, and
+              the number of frames where the hand count differs.
+    """
+    scale = np.array(ref_size, dtype=np.float32)
+    errors = []
+    count_mismatch = 0
+    for ours, ref in zip(result.landmarks, reference.landmarks):
+        if len(ours) != len(ref):
+            count_mismatch += 1
+        if len(ours) == 0 or len(ref) == 0:
+            continue
+        wrist_dist = np.linalg.norm(ref[:, None, WRIST, :2] - ours[None, :, WRIST, :2], axis=2)
+        for ref_idx, our_idx in enumerate(wrist_dist.argmin(axis=1)):
+            diff = (ours[our_idx, :, :2] - ref[ref_idx, :, :2]) * scale
+            errors.append(np.linalg.norm(diff, axis=1))
+
+    if not errors:
+        return {"mean_px": None, "p95_px": None, "hand_count_mismatch_frames": count_mismatch}
+    errors = np.concatenate(errors)
+    return {
+        "mean_px": float(errors.mean()),
+        "p95_px": float(np.percentile(errors, 95)),
+        "hand_count_mismatch_frames": count_mismatch,
+    }
+
+
+def compare_events(events: list, reference: list, tolerance: int) -> dict:
+    """
+    Matches gesture events against the reference, allowing them to fire up to
+    tolerance frames early or late.
+
+    Returns:
+        dict: Counts of matched, missing (in reference only) and extra events.
+    """
+    unmatched = list(events)
+    matched = 0
+    for frame, label, gesture, state in reference:
+        for i, (other_frame, other_label, other_gesture, other_state) in enumerate(unmatched):
+            if ((other_label, other_gesture, other_state) == (label, gesture, state)
+                    and abs(other_frame - frame) <= tolerance):
+                del unmatched[i]
+                matched += 1
+                break
+    return {
+        "matched": matched,
+        "missing": len(reference) - matched,
+        "extra": len(unmatched),
+        "changed": matched != len(reference) or bool(unmatched),
+    }
+
+
+def summarize(result: RunResult, reference: RunResult, ref_size, tolerance: int) -> dict:
+    p50, p90, p99 = np.percentile(result.latencies_ms, [50, 90, 99])
+    return {
+        "config": result.config._asdict(),
+        "name": result.config.name,
+        "frames": len(result.latencies_ms),
+        "latency_ms": {
+            "mean": float(result.latencies_ms.mean()),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p99": float(p99),
+        },
+        "deviation": landmark_deviation(result, reference, ref_size),
+        "gesture_events": compare_events(result.events, reference.events, tolerance),
+    }
+
+
+def print_table(rows: List[dict]):
+    header = f"{'config':<28}{'p50':>8}{'p90':>8}{'p99':>8}{'dev px':>9}{'p95 px':>9}{'count!=':>9}{'events':>16}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        lat, dev, ev = row["latency_ms"], row["deviation"], row["gesture_events"]
+        mean_px = "-" if dev["mean_px"] is None else f"{dev['mean_px']:.1f}"
+        p95_px = "-" if dev["p95_px"] is None else f"{dev['p95_px']:.1f}"
+        events = "same" if not ev["changed"] else f"-{ev['missing']} +{ev['extra']}"
+        print(f"{row['name']:<28}{lat['p50']:>8.1f}{lat['p90']:>8.1f}{lat['p99']:>8.1f}"
+              f"{mean_px:>9}{p95_px:>9}{dev['hand_count_mismatch_frames']:>9}{events:>16}")
+
+
+def parse_resolution(text: str):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def run(args):
+    frames = load_frames(args.session, args.max_frames)
+    native = (frames[0].shape[1], frames[0].shape[0])
+    resolutions = [parse_resolution(r) for r in args.resolutions] if args.resolutions else [native]
+    print(f"Loaded {len(frames)} frames at {native[0]}x{native[1]}.")
+
+    # The reference is the most expensive configuration on the recording as-is
+    reference_cfg = TrackerConfig(1, native[0], native[1], False, max(args.hands))
+    print(f"Reference: {reference_cfg.name}")
+    reference = run_config(frames, reference_cfg)
+
+    matrix = [
+        TrackerConfig(complexity, width, height, roi == "on", hands)
+        for complexity, (width, height), roi, hands
+        in itertools.product(args.complexity, resolutions, args.roi, args.hands)
+    ]
+
+    rows = []
+    for cfg in matrix:
+        print(f"Running {cfg.name}...")
+        result = reference if cfg == reference_cfg else run_config(frames, cfg)
+        rows.append(summarize(result, reference, native, args.tolerance))
+
+    print()
+    print_table(rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"session": args.session, "reference": reference_cfg.name, "results": rows}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hand tracker configurations on a recorded session.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="Record a webcam session to a video file")
+    rec.add_argument("output")
+    rec.add_argument("--seconds", type=float, default=30.0)
+    rec.add_argument("--camera", type=int, default=0)
+    rec.add_argument("--resolution", default="1280x720")
+
+    bench = commands.add_parser("run", help="Benchmark a recorded session")
+    bench.add_argument("session")
+    bench.add_argument("--complexity", type=int, nargs="+", default=[0, 1], choices=[0, 1])
+    bench.add_argument("--resolutions", nargs="+", help="e.g. 1280x720 640x360 (default: recording size)")
+    bench.add_argument("--roi", nargs="+", default=["off", "on"], choices=["off", "on"])
+    bench.add_argument("--hands", type=int, nargs="+", default=[1, 2])
+    bench.add_argument("--max-frames", type=int, help="Only use the first N frames")
+    bench.add_argument("--tolerance", type=int, default=2,
+                       help="Frames a gesture event may shift and still match the reference")
+    bench.add_argument("--json", help="Also write the results to this file")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.output, args.seconds, args.camera, *parse_resolution(args.resolution))
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Detector stress and regression test on synthetic hands.
+
+Streams scripted hand poses (helpers/synthetic_hands.py) through the same
+per-frame path the app uses (identity tracking, HandData, gesture detectors)
+as fast as possible, and reports throughput, per-frame latency percentiles,
+how often each detector fires for each pose while the pose is held, and how
+often the voted handedness is right.
+
+    python -m tools.stress_detectors --frames 20000 --hands 2 --noise 0.02 --flip-rate 0.05
+
+With --check, exits with status 1 if a pose no longer triggers its gesture or
+triggers another one, which makes it usable as a regression gate after
+changing detector thresholds or geometry code.
+"""
+
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from helpers import detectors
+from helpers.hand_data import HandData
+from helpers.hand_identity import HandIdentityTracker
+from helpers.synthetic_hands import POSES, SyntheticHand, SyntheticHandStream, random_script
+
+GESTURES = {
+    "activation": detectors.is_activation_pose,
+    "fist": detectors.is_fist,
+    "left_click": detectors.is_left_click,
+    "right_click": detectors.is_right_click,
+    "mic": detectors.is_mic_mute,
+}
+
+# The gesture each pose is meant to trigger. Poses not listed should trigger none,
+# except pinch_ring, which looks like the activation pose to the detectors.
+EXPECTED = {
+    "activation": "activation",
+    "fist": "fist",
+    "pinch_index": "left_click",
+    "pinch_middle": "right_click",
+    "quiet_coyote": "mic",
+}
+TOLERATED = {("pinch_ring", "activation")}
+
+WRIST = 0
+MIDDLE_MCP = 9
+
+
+def build_stream(args) -> SyntheticHandStream:
+    rng = np.random.default_rng(args.seed)
+    hands = []
+    for h in range(args.hands):
+        label = "Right" if h % 2 == 0 else "Left"
+        position = (0.65, 0.65) if label == "Right" else (0.3, 0.65)
+        script = random_script(60.0, rng)
+        hands.append(SyntheticHand(label, script, position=position, scale=args.scale,
+                                   rotation_deg=float(rng.uniform(-args.rotation, args.rotation)),
+                                   seed=args.seed + h))
+    return SyntheticHandStream(hands, fps=args.fps, image_size=(args.width, args.height),
+                               noise=args.noise, handedness_flip_rate=args.flip_rate,
+                               drop_rate=args.drop_rate, seed=args.seed)
+
+
+def run(args) -> dict:
+    stream = build_stream(args)
+    timestamps, results = stream.generate(args.frames)
+    img_shape = (args.height, args.width)
+    scale = np.array([args.width, args.height])
+    identity = HandIdentityTracker()
+
+    truth = [hand.pose_names(timestamps) for hand in stream.hands]
+    settled = [hand.settled(timestamps) for hand in stream.hands]
+    fired = {pose: {gesture: 0 for gesture in GESTURES} for pose in POSES}
+    held = {pose: 0 for pose in POSES}
+    handedness_correct = 0
+
+    latencies = np.empty(args.frames)
+    for f, result in enumerate(results):
+        start = time.perf_counter()
+        wrists = result.landmarks[:, WRIST, :2] * scale
+        palm_sizes = np.linalg.norm((result.landmarks[:, MIDDLE_MCP, :2] - result.landmarks[:, WRIST, :2]) * scale, axis=1)
+        tracks = identity.update(wrists, palm_sizes, result.handedness, result.handedness_scores)
+        states = []
+        for landmarks, track in zip(result.landmarks, tracks):
+            hand_data = HandData(landmarks, img_shape, label=track.handedness, hand_id=track.hand_id)
+            states.append([bool(detector(hand_data)) for detector in GESTURES.values()])
+        latencies[f] = time.perf_counter() - start
+
+        for h, hand in enumerate(stream.hands):
+            handedness_correct += tracks[h].handedness == hand.label
+            if not settled[h][f]:
+                continue
+            pose = truth[h][f]
+            held[pose] += 1
+            for gesture, state in zip(GESTURES, states[h]):
+                fired[pose][gesture] += state
+
+    latencies_ms = latencies * 1000.0
+    rates = {
+        pose: {gesture: count / held[pose] for gesture, count in counts.items()}
+        for pose, counts in fired.items() if held[pose]
+    }
+    return {
+        "frames": args.frames,
+        "hands": args.hands,
+        "frames_per_second": args.frames / latencies.sum(),
+        "latency_ms": {f"p{p}": float(np.percentile(latencies_ms, p)) for p in (50, 90, 99)},
+        "handedness_accuracy": handedness_correct / (args.frames * args.hands),
+        "fire_rates": rates,
+        "held_frames": held,
+    }
+
+
+def failures(report: dict, min_rate: float, max_rate: float) -> list:
+    """Pose/gesture pairs that fire too rarely (expected) or too often (unexpected)."""
+    problems = []
+    for pose, rates in report["fire_rates"].items():
+        for gesture, rate in rates.items():
+            expected = EXPECTED.get(pose) == gesture
+            if expected and rate < min_rate:
+                problems.append(f"{pose} triggered {gesture} in only {rate:.0%} of held frames")
+            elif not expected and (pose, gesture) not in TOLERATED and rate > max_rate:
+                problems.append(f"{pose} unexpectedly triggered {gesture} in {rate:.0%} of held frames")
+    return problems
+
+
+def print_report(report: dict):
+    print(f"\n{report['frames']} frames, {report['hands']} hand(s)")
+    print(f"Throughput: {report['frames_per_second']:.0f} frames/s")
+    latency = report["latency_ms"]
+    print(f"Per frame: p50 {latency['p50']:.3f} ms, p90 {latency['p90']:.3f} ms, p99 {latency['p99']:.3f} ms")
+    print(f"Voted handedness correct: {report['handedness_accuracy']:.1%}")
+
+    print("\nFire rate while the pose is held:")
+    print(f"{'pose':<14} {'frames':>7} " + " ".join(f"{g:>12}" for g in GESTURES))
+    for pose, rates in report["fire_rates"].items():
+        cells = " ".join(f"{rates[g]:>12.0%}" for g in GESTURES)
+        print(f"{pose:<14} {report['held_frames'][pose]:>7} {cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress and regression test the gesture detectors on synthetic hands.")
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--hands", type=int, default=1, choices=[1, 2])
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--scale", type=float, default=0.15, help="Palm size as a fraction of the image height")
+    parser.add_argument("--rotation", type=float, default=20.0, help="Max in-plane rotation of each hand in degrees")
+    parser.add_argument("--noise", type=float, default=0.01, help="Landmark noise as a fraction of palm size")
+    parser.add_argument("--flip-rate", type=float, default=0.0, help="Per-frame probability of a wrong handedness label")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Per-frame probability of a dropped frame")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on unexpected fire rates")
+    parser.add_argument("--min-rate", type=float, default=0.9, help="Lowest acceptable rate for a pose's own gesture")
+    parser.add_argument("--max-rate", type=float, default=0.05, help="Highest acceptable rate for any other gesture")
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.check:
+        problems = failures(report, args.min_rate, args.max_rate)
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        if problems:
+            sys.exit(1)
+        print("\nAll poses trigger their expected gestures.")
+
+
+if __name__ == "__main__":
+    main()